@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmarks - times each stage of the search engine and prints JSON
+
+Usage: python bench.py                                  # all domains/stacks + 10k/100k synthetic corpora
+       python bench.py --scales 10000 --repeat 3        # smaller run
+       python bench.py --output bench.json              # write JSON to a file
+       python bench.py --memory --skip-synthetic        # add tracemalloc index sizes
+
+Stages measured per domain/stack (milliseconds):
+  load     _load_csv (CSV parse)
+  fit      BM25.fit over the search columns
+  score    BM25.score top-k, per query (queries sampled from the CSV itself)
+  top_k    exhaustive scorer vs MaxScore on long queries: the style-domain
+           queries _multi_domain_search builds from ui-reasoning.csv for
+           styles corpora, 8-term sampled queries elsewhere
+  phrases  score() on the multi-word sampled queries: bag of words only
+           (PROXIMITY_WEIGHT = 0), with the proximity re-ranking, and with
+           the first two words quoted as a phrase
+Plus generate_design_system end-to-end (cold = caches cleared, warm = cached).
+With --memory, tracemalloc also reports the bytes each fitted index retains
+(and the peak while fitting) for every domain and stack CSV.
+
+Synthetic corpora reuse the real column schema of styles.csv, ux-guidelines.csv
+and the stack CSVs. Each cell is built from words drawn from that column's real
+vocabulary, with cell lengths taken from the real data. Everything is seeded,
+so runs are comparable across commits.
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import core
+from core import BM25, CSV_CONFIG, DATA_DIR, STACK_CONFIG, MAX_RESULTS, _STACK_COLS, _load_csv
+
+
+# ============ CONFIGURATION ============
+DEFAULT_SCALES = [10000, 100000]
+DEFAULT_REPEAT = 5
+QUERIES_PER_CORPUS = 50
+LONG_QUERY_TERMS = 8
+SEED = 1337
+
+SYNTHETIC_SOURCES = {
+    "styles": {"files": [CSV_CONFIG["style"]["file"]], "search_cols": CSV_CONFIG["style"]["search_cols"]},
+    "ux-guidelines": {"files": [CSV_CONFIG["ux"]["file"]], "search_cols": CSV_CONFIG["ux"]["search_cols"]},
+    "stacks": {"files": [cfg["file"] for cfg in STACK_CONFIG.values()], "search_cols": _STACK_COLS["search_cols"]},
+}
+
+DESIGN_SYSTEM_QUERIES = ["SaaS dashboard", "beauty spa wellness service", "fintech crypto", "laboratory inventory"]
+
+
+# ============ HELPERS ============
+def _timed(fn, repeat):
+    """Run fn `repeat` times; returns (last result, stats in ms)."""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, _summary(samples)
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    return {
+        "min": round(ordered[0], 4),
+        "median": round(statistics.median(ordered), 4),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+    }
+
+
+def sample_queries(documents, count, rng):
+    """Queries of 1-4 words taken from random documents of the corpus."""
+    queries = []
+    tokenized = [BM25.tokenize(doc) for doc in documents]
+    tokenized = [tokens for tokens in tokenized if tokens]
+    for _ in range(count):
+        tokens = rng.choice(tokenized)
+        queries.append(" ".join(rng.sample(tokens, min(len(tokens), rng.randint(1, 4)))))
+    return queries
+
+
+def sample_long_queries(documents, count, rng):
+    """LONG_QUERY_TERMS-word queries mixing the words of two random documents."""
+    tokenized = [tokens for tokens in (BM25.tokenize(doc) for doc in documents) if tokens]
+    queries = []
+    for _ in range(count):
+        words = rng.choice(tokenized) + rng.choice(tokenized)
+        queries.append(" ".join(rng.sample(words, min(len(words), LONG_QUERY_TERMS))))
+    return queries
+
+
+def multi_domain_queries():
+    """The style queries _multi_domain_search builds: category + first two style priorities."""
+    queries = []
+    for rule in _load_csv(DATA_DIR / "ui-reasoning.csv"):
+        priority = [s.strip() for s in rule.get("Style_Priority", "").split("+")]
+        queries.append(f"{rule.get('UI_Category', '')} {' '.join(priority[:2])}")
+    return queries
+
+
+def bench_top_k(bm25, queries, repeat):
+    """Exhaustive scoring vs MaxScore early termination for the same top-k queries."""
+    term_ids = [[t for t in map(bm25.vocab.get, bm25.query_terms(q)) if t is not None] for q in queries]
+    result = {"queries": len(queries), "avg_terms": round(statistics.mean(len(t) for t in term_ids), 2)}
+    for label, scorer in (("exhaustive_ms", bm25._exhaustive), ("max_score_ms", bm25._max_score)):
+        samples = []
+        for _ in range(repeat):
+            for tokens in term_ids:
+                start = time.perf_counter()
+                scorer(tokens, MAX_RESULTS)
+                samples.append((time.perf_counter() - start) * 1000)
+        result[label] = _summary(samples)
+        result[label]["mean"] = round(statistics.mean(samples), 4)
+    return result
+
+
+def bench_phrases(bm25, queries, repeat):
+    """score() latency without proximity, with proximity, and with a quoted phrase."""
+    queries = [q for q in queries if len(q.split()) > 1]
+    phrase_queries = ['"{} {}" {}'.format(*q.split(" ", 2)) if q.count(" ") > 1 else f'"{q}"' for q in queries]
+    proximity_weight = core.PROXIMITY_WEIGHT
+    result = {"queries": len(queries)}
+    for label, weight, batch in (("bag_of_words_ms", 0, queries), ("proximity_ms", proximity_weight, queries),
+                                 ("phrase_ms", proximity_weight, phrase_queries)):
+        core.PROXIMITY_WEIGHT = weight
+        samples = []
+        try:
+            for _ in range(repeat):
+                for query in batch:
+                    start = time.perf_counter()
+                    bm25.score(query, top_k=MAX_RESULTS)
+                    samples.append((time.perf_counter() - start) * 1000)
+        finally:
+            core.PROXIMITY_WEIGHT = proximity_weight
+        result[label] = _summary(samples) if samples else None
+        if samples:
+            result[label]["mean"] = round(statistics.mean(samples), 4)
+    return result
+
+
+def bench_corpus(filepath, search_cols, repeat, rng, queries=None, long_queries=None):
+    """Time load, fit and score for one CSV."""
+    data, load = _timed(lambda: _load_csv(filepath), repeat)
+    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+
+    def fit():
+        bm25 = BM25()
+        bm25.fit(documents)
+        return bm25
+
+    bm25, fit_stats = _timed(fit, repeat)
+    queries = queries or sample_queries(documents, QUERIES_PER_CORPUS, rng)
+
+    score_samples = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            bm25.score(query, top_k=MAX_RESULTS)
+            score_samples.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "rows": len(data),
+        "bytes": os.path.getsize(filepath),
+        "vocabulary": len(bm25.vocab),
+        "load_ms": load,
+        "fit_ms": fit_stats,
+        "score_ms": _summary(score_samples),
+        "queries": len(queries),
+        "top_k": bench_top_k(bm25, long_queries or sample_long_queries(documents, QUERIES_PER_CORPUS, rng), repeat),
+        "phrases": bench_phrases(bm25, queries, repeat),
+    }
+
+
+# ============ SYNTHETIC CORPORA ============
+def build_synthetic_csv(source, rows, rng, directory):
+    """Write a synthetic CSV with the source's columns; returns its path."""
+    config = SYNTHETIC_SOURCES[source]
+    real_rows = []
+    for file in config["files"]:
+        real_rows.extend(_load_csv(DATA_DIR / file))
+    columns = list(real_rows[0].keys())
+
+    vocab = {col: [] for col in columns}
+    lengths = {col: [] for col in columns}
+    for row in real_rows:
+        for col in columns:
+            words = str(row.get(col, "") or "").split()
+            vocab[col].extend(words)
+            lengths[col].append(len(words))
+
+    path = Path(directory) / f"{source}-{rows}.csv"
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for _ in range(rows):
+            writer.writerow({
+                col: " ".join(rng.choices(vocab[col], k=rng.choice(lengths[col]))) if vocab[col] else ""
+                for col in columns
+            })
+    return path
+
+
+# ============ DESIGN SYSTEM ============
+def bench_design_system(repeat):
+    from design_system import generate_design_system
+
+    cold, warm = [], []
+    for _ in range(repeat):
+        for query in DESIGN_SYSTEM_QUERIES:
+            core.clear_caches()
+            start = time.perf_counter()
+            generate_design_system(query)
+            cold.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            generate_design_system(query)
+            warm.append((time.perf_counter() - start) * 1000)
+
+    return {"queries": DESIGN_SYSTEM_QUERIES, "cold_ms": _summary(cold), "warm_ms": _summary(warm)}
+
+
+# ============ MEMORY ============
+def bench_memory():
+    """tracemalloc bytes retained by (and peak while) fitting each real index."""
+    indexes = {}
+    for name, filepath, search_cols, _ in core._index_targets():
+        if not filepath.exists():
+            continue
+        documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in _load_csv(filepath)]
+        tracemalloc.start()
+        bm25 = BM25()
+        bm25.fit(documents)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        indexes[name] = {"rows": bm25.N, "vocabulary": len(bm25.vocab), "retained_kib": round(retained / 1024, 1),
+                         "peak_kib": round(peak / 1024, 1)}
+
+    return {
+        "fuzzy_matching": core.FUZZY_MATCHING,
+        "indexes": indexes,
+        "total_retained_kib": round(sum(i["retained_kib"] for i in indexes.values()), 1),
+        "total_peak_kib": round(sum(i["peak_kib"] for i in indexes.values()), 1),
+    }
+
+
+# ============ MAIN ============
+def run(scales, repeat, skip_real=False, skip_synthetic=False, memory=False):
+    rng = random.Random(SEED)
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": SEED,
+        }
+    }
+
+    style_queries = multi_domain_queries()
+
+    if not skip_real:
+        report["domains"] = {}
+        for name, filepath, search_cols, _ in core._index_targets():
+            if filepath.exists():
+                report["domains"][name] = bench_corpus(filepath, search_cols, repeat, rng,
+                                                       long_queries=style_queries if name == "style" else None)
+        report["design_system"] = bench_design_system(repeat)
+
+    if memory:
+        report["memory"] = bench_memory()
+
+    if not skip_synthetic:
+        report["synthetic"] = []
+        with tempfile.TemporaryDirectory(prefix="uipro-bench-") as tmp:
+            for source, config in SYNTHETIC_SOURCES.items():
+                for rows in scales:
+                    path = build_synthetic_csv(source, rows, rng, tmp)
+                    # Large corpora are slow to fit in pure Python: cap repeats
+                    result = bench_corpus(path, config["search_cols"], max(1, repeat if rows < 50000 else 1), rng,
+                                          long_queries=style_queries if source == "styles" else None)
+                    result["source"] = source
+                    report["synthetic"].append(result)
+                    path.unlink()
+
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search benchmarks (JSON output)")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="Synthetic corpus sizes in rows (default: 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Repetitions per measurement (default: 5)")
+    parser.add_argument("--skip-real", action="store_true", help="Skip the real domain/stack CSVs and design system")
+    parser.add_argument("--skip-synthetic", action="store_true", help="Skip synthetic corpora")
+    parser.add_argument("--memory", action="store_true", help="Report tracemalloc index sizes for every real CSV")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write JSON to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = run(args.scales, args.repeat, args.skip_real, args.skip_synthetic, args.memory)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        print(f"Benchmark written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
@@ -4,15 +4,30 @@
 UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
-import csv
+import copy
+import heapq
+import os
+import pickle
 import re
-from pathlib import Path
+import sys
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict, defaultdict, deque
+from functools import lru_cache
+from itertools import accumulate
 from math import log
-from collections import defaultdict
+from operator import add
+from pathlib import Path
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
+INDEX_DIR = Path(__file__).parent.parent / ".index"
+INDEX_VERSION = 8
 MAX_RESULTS = 3
+RESULT_CACHE_SIZE = 512
 
 CSV_CONFIG = {
     "style": {
@@ -72,6 +87,22 @@ CSV_CONFIG = {
     }
 }
 
+# BM25F per-column boosts (ranking="bm25f"); unlisted columns weigh 1.0.
+# Short curated columns (names, keywords) are stronger evidence than long free text.
+FIELD_BOOSTS = {
+    "style": {"Style Category": 3.0, "Keywords": 2.0, "Best For": 1.0, "Type": 0.5},
+    "prompt": {"Style Category": 3.0, "AI Prompt Keywords (Copy-Paste Ready)": 1.5, "CSS/Technical Keywords": 1.0},
+    "color": {"Product Type": 3.0, "Keywords": 2.0, "Notes": 0.5},
+    "chart": {"Data Type": 3.0, "Keywords": 2.0, "Best Chart Type": 1.5, "Accessibility Notes": 0.5},
+    "landing": {"Pattern Name": 3.0, "Keywords": 2.0, "Conversion Optimization": 0.5, "Section Order": 0.5},
+    "product": {"Product Type": 3.0, "Keywords": 2.0, "Primary Style Recommendation": 1.0, "Key Considerations": 0.5},
+    "ux": {"Category": 2.0, "Issue": 3.0, "Description": 0.5, "Platform": 1.0},
+    "typography": {"Font Pairing Name": 2.0, "Category": 1.5, "Mood/Style Keywords": 2.0, "Best For": 1.0},
+    "icons": {"Category": 1.5, "Icon Name": 3.0, "Keywords": 2.0, "Best For": 1.0},
+    "react": {"Category": 1.5, "Issue": 3.0, "Keywords": 2.0, "Description": 0.5},
+    "web": {"Category": 1.5, "Issue": 3.0, "Keywords": 2.0, "Description": 0.5}
+}
+
 STACK_CONFIG = {
     "html-tailwind": {"file": "stacks/html-tailwind.csv"},
     "react": {"file": "stacks/react.csv"},
@@ -92,140 +123,1480 @@ _STACK_COLS = {
     "search_cols": ["Category", "Guideline", "Description", "Do", "Don't"],
     "output_cols": ["Category", "Guideline", "Description", "Do", "Don't", "Code Good", "Code Bad", "Severity", "Docs URL"]
 }
+_STACK_BOOSTS = {"Category": 1.5, "Guideline": 3.0, "Description": 1.0, "Do": 0.5, "Don't": 0.5}
+
+RANKINGS = ["bm25", "bm25f"]
+DEFAULT_RANKING = "bm25"
+
+# "python": in-process BM25 above; "fts5": SQLite FTS5 database (see sqlite_fts.py)
+ENGINES = ["python", "fts5"]
+DEFAULT_ENGINE = "python"
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
+# Typo tolerance: query tokens found in no CSV at all are mapped to the closest
+# indexed term (1 edit for 5-8 characters, 2 edits for 9+, exact below 5)
+FUZZY_MATCHING = True
+
+# score(top_k=...) switches to MaxScore pruning once a query touches this many
+# postings; below that the exhaustive loop is cheaper
+MAXSCORE_MIN_POSTINGS = 300
+
+# Term proximity: the best PROXIMITY_WINDOW bag-of-words hits are re-ranked with
+# PROXIMITY_WEIGHT x min(idf) / distance^2 for each pair of consecutive query
+# terms found within PROXIMITY_MAX_DISTANCE tokens of each other (0 disables).
+# "Quoted phrases" in a query only match rows containing the exact phrase.
+PROXIMITY_WEIGHT = 1.0
+PROXIMITY_MAX_DISTANCE = 5
+PROXIMITY_WINDOW = 50
+
+# Domain detection: hand-picked keywords (substring matches, weight 1 each)...
+DOMAIN_KEYWORDS = {
+    "color": ["color", "palette", "hex", "#", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
+    "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
+    "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+}
+# ...plus query words derived from the CSVs: a term whose per-row frequency is
+# mostly (>= this share) in one domain votes for it with DERIVED_KEYWORD_WEIGHT x share
+DERIVED_KEYWORD_MIN_SHARE = 0.6
+DERIVED_KEYWORD_WEIGHT = 0.5
+DEFAULT_DOMAIN = "style"
+
+# index file -> (key, rows, BM25); filled lazily by _load_index
+_INDEX_CACHE = {}
+_INDEX_STATS = {"memory_hits": 0, "disk_loads": 0, "builds": 0, "appends": 0}
+
+# Serialises index builds/appends (re-entrant: some builders load other indexes)
+_INDEX_LOCK = threading.RLock()
+
+
+# ============ PHRASES & PROXIMITY ============
+_PHRASE_PATTERN = re.compile(r'"([^"]*)"')
+
+
+def split_phrases(query):
+    """The quoted parts of a query: 'ssr "server component"' -> ['server component']"""
+    return _PHRASE_PATTERN.findall(str(query))
+
+
+def phrase_starts(left, right, gap):
+    """Positions p of sorted list left with p + gap in sorted list right (linear merge)"""
+    matches, j = [], 0
+    for p in left:
+        target = p + gap
+        while j < len(right) and right[j] < target:
+            j += 1
+        if j == len(right):
+            break
+        if right[j] == target:
+            matches.append(p)
+    return matches
+
+
+def min_distance(left, right):
+    """Smallest |a - b| over sorted position lists, +1 when b precedes a (linear merge)"""
+    best, i, j = None, 0, 0
+    while i < len(left) and j < len(right):
+        a, b = left[i], right[j]
+        distance = b - a if b > a else a - b + 1
+        if best is None or distance < best:
+            best = distance
+        if a < b:
+            i += 1
+        else:
+            j += 1
+    return best
+
+
+def contains_phrase(phrase, positions):
+    """Whether the terms of phrase occur consecutively, given term -> sorted positions in one document"""
+    starts = positions.get(phrase[0], ())
+    for gap, term in enumerate(phrase[1:], 1):
+        if not starts:
+            break
+        starts = phrase_starts(starts, positions.get(term, ()), gap)
+    return bool(starts)
+
+
+def proximity_boost(tokens, positions, idf):
+    """PROXIMITY_WEIGHT x min(idf) / distance^2 summed over consecutive query terms found close together"""
+    boost = 0.0
+    for left, right in zip(tokens, tokens[1:]):
+        if left == right or not positions.get(left) or not positions.get(right):
+            continue
+        distance = min_distance(positions[left], positions[right])
+        if distance <= PROXIMITY_MAX_DISTANCE:
+            boost += PROXIMITY_WEIGHT * min(idf[left], idf[right]) / distance ** 2
+    return boost
+
+
+def rerank_window(ranked, boost, top_k=None):
+    """ranked [(doc_id, score)] with boost(doc_id) added inside the first PROXIMITY_WINDOW entries"""
+    head = [(doc_id, score + boost(doc_id)) for doc_id, score in ranked[:PROXIMITY_WINDOW]]
+    head.sort(key=lambda x: (-x[1], x[0]))
+    ranked = head + ranked[PROXIMITY_WINDOW:]
+    return ranked if top_k is None else ranked[:top_k]
+
+
+# ============ FUZZY MATCHING ============
+def max_edit_distance(token):
+    """Edits tolerated for a token of this length"""
+    if len(token) < 5:
+        return 0
+    return 1 if len(token) < 9 else 2
+
+
+def deletes(word, distance):
+    """Every string reachable from word by deleting up to `distance` characters"""
+    results = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        results |= frontier
+    return results
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance (adjacent transpositions count as 1), capped at limit + 1"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev_prev = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(prev[j] + 1, current[j - 1] + 1, prev[j - 1] + cost)
+            if prev_prev is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], prev_prev[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        prev_prev, prev = prev, current
+    return prev[-1]
+
+
+def best_correction(token, candidates):
+    """Closest candidate term: fewest edits, then most frequent, then alphabetical.
+
+    candidates maps term -> document frequency; returns None when nothing is
+    within max_edit_distance(token).
+    """
+    limit = max_edit_distance(token)
+    best = None
+    for term, freq in candidates.items():
+        distance = edit_distance(token, term, limit)
+        if distance <= limit:
+            rank = (distance, -freq, term)
+            if best is None or rank < best[0]:
+                best = (rank, term)
+    return best[1] if best else None
+
+
+class FuzzyIndex:
+    """SymSpell-style deletion dictionary over an index vocabulary.
+
+    Built once with the index: every term is stored under each string
+    obtained by deleting up to max_edit_distance(term) characters. A
+    misspelled token is resolved by generating its own deletes and looking
+    them up, so no pass over the vocabulary is needed. Corrections are
+    memoised for the lifetime of the index.
+
+    The dictionary is two parallel arrays sorted by the CRC32 of each delete
+    (12 bytes per entry instead of a dict of strings). A hash collision only
+    adds a candidate, and best_correction() rejects it by edit distance.
+    """
+
+    def __init__(self, vocab, terms, doc_freqs):
+        self.vocab = vocab
+        self.terms = terms
+        self.doc_freqs = doc_freqs
+        entries = sorted(
+            (zlib.crc32(key.encode("utf-8")), term_id)
+            for term_id, term in enumerate(terms)
+            for key in deletes(term, max_edit_distance(term))
+        )
+        self.keys = array('I', (key for key, _ in entries))
+        self.term_ids = array('I', (term_id for _, term_id in entries))
+        self.added = {}  # crc -> [term_id] for terms added by BM25.append()
+        self.corrections = {}
+        self.vocabulary_key = None  # Version of the is_known_word() vocabulary the corrections were made with
+
+    def copy(self, vocab, terms, doc_freqs):
+        """This dictionary over a copied vocabulary (see BM25.copy); the built delete arrays are shared"""
+        clone = copy.copy(self)
+        clone.vocab, clone.terms, clone.doc_freqs = vocab, terms, doc_freqs
+        clone.added = {crc: list(term_ids) for crc, term_ids in self.added.items()}
+        clone.corrections = dict(self.corrections)
+        return clone
+
+    def add(self, term_id):
+        """Register a term appended to the vocabulary after the index was built"""
+        term = self.terms[term_id]
+        for key in deletes(term, max_edit_distance(term)):
+            self.added.setdefault(zlib.crc32(key.encode("utf-8")), []).append(term_id)
+        self.corrections.clear()  # Tokens that had no (or a worse) correction may now match
+
+    def track_vocabulary(self, key):
+        """Forget memoised corrections made against another version of the is_known_word() vocabulary"""
+        if key != self.vocabulary_key:
+            self.corrections.clear()
+            self.vocabulary_key = key
+
+    def candidates(self, token):
+        """{term: document frequency} for every term sharing a delete with token"""
+        keys, term_ids = self.keys, self.term_ids
+        candidates = {}
+        for key in deletes(token, max_edit_distance(token)):
+            crc = zlib.crc32(key.encode("utf-8"))
+            i = bisect_left(keys, crc)
+            while i < len(keys) and keys[i] == crc:
+                term_id = term_ids[i]
+                candidates[self.terms[term_id]] = self.doc_freqs[term_id]
+                i += 1
+            for term_id in self.added.get(crc, ()):
+                candidates[self.terms[term_id]] = self.doc_freqs[term_id]
+        return candidates
+
+    def correct(self, token, is_known_word=None):
+        """token itself if indexed, else its best in-vocabulary correction (or None).
+
+        is_known_word(token) -> bool marks real words that are merely absent from
+        this corpus (e.g. "chart" in the typography CSV); those are not corrected.
+        """
+        if token in self.vocab:
+            return token
+        if token in self.corrections:
+            return self.corrections[token]
+        if is_known_word is not None and is_known_word(token):
+            self.corrections[token] = None
+            return None
+
+        correction = best_correction(token, self.candidates(token))
+        self.corrections[token] = correction
+        return correction
+
 
 # ============ BM25 IMPLEMENTATION ============
+def bm25_idf(n_docs, doc_freq):
+    """Okapi idf, smoothed to stay positive for terms in most documents"""
+    return log((n_docs - doc_freq + 0.5) / (doc_freq + 0.5) + 1)
+
+
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """BM25 ranking algorithm for text search (positional inverted index).
+
+    Every posting also points (pos_starts) into positions, which holds the
+    posting's token count followed by its token offsets in the document, so
+    phrases and term proximity are checked by merging position lists.
+
+    source, when set by the index builder, describes the input the index was
+    fitted on (CSV byte size, CRC32, header) so that appended rows can be
+    applied with append() instead of a refit.
+    """
 
     def __init__(self, k1=1.5, b=0.75):
         self.k1 = k1
         self.b = b
-        self.corpus = []
-        self.doc_lengths = []
+        self.vocab = {}
+        self.terms = []
+        self.offsets = array('I', [0])
+        self.doc_ids = array('I')
+        self.tfs = array('f')
+        self.pos_starts = array('I')
+        self.positions = array('I')
+        self.doc_lengths = array('I')
         self.avgdl = 0
-        self.idf = {}
-        self.doc_freqs = defaultdict(int)
+        self.idf = array('d')
+        self.doc_freqs = array('I')
+        self.max_tfs = array('f')
+        self.min_lengths = array('I')
         self.N = 0
+        self.total_length = 0
+        self.max_weights = None
+        self.fuzzy = None
+        self.source = None
+        self._pending = {}  # term_id -> [(doc_id, tf, positions)] appended since the arrays were built
 
-    def tokenize(self, text):
+    @staticmethod
+    def tokenize(text):
         """Lowercase, split, remove punctuation, filter short words"""
         text = re.sub(r'[^\w\s]', ' ', str(text).lower())
         return [w for w in text.split() if len(w) > 2]
 
+    @staticmethod
+    def token_positions(tokens, start=0):
+        """word -> offsets of its occurrences in tokens (shifted by start)"""
+        positions = {}
+        for pos, word in enumerate(tokens, start):
+            positions.setdefault(word, []).append(pos)
+        return positions
+
     def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        """Build postings (term id -> doc ids + tfs + positions) and per-document lengths"""
+        vocab = {}
+        postings = []
+        doc_lengths = array('I')
+        for doc_id, doc in enumerate(documents):
+            tokens = self.tokenize(doc)
+            doc_lengths.append(len(tokens))
+            for word, positions in self.token_positions(tokens).items():
+                term_id = vocab.get(word)
+                if term_id is None:
+                    term_id = vocab[sys.intern(word)] = len(postings)
+                    postings.append([])
+                postings[term_id].append((doc_id, len(positions), positions))
+
+        self.doc_lengths = doc_lengths
+        self.N = len(doc_lengths)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
-        self.avgdl = sum(self.doc_lengths) / self.N
+        self.total_length = sum(doc_lengths)
+        self.avgdl = self.total_length / self.N
+        self._store_postings(vocab, postings)
+
+    def _store_postings(self, vocab, postings):
+        """Flatten per-term [(doc_id, tf, positions)] lists into CSR arrays indexed by term id"""
+        self.vocab = vocab
+        self.terms = list(vocab)
+        self.offsets = array('I', [0])
+        self.doc_ids = array('I')
+        self.tfs = array('f')
+        self.pos_starts = array('I')
+        self.positions = array('I')
+        for plist in postings:
+            self.doc_ids.extend(doc_id for doc_id, _, _ in plist)
+            self.tfs.extend(tf for _, tf, _ in plist)
+            for _, _, positions in plist:
+                self.pos_starts.append(len(self.positions))
+                self.positions.append(len(positions))
+                self.positions.extend(positions)
+            self.offsets.append(len(self.doc_ids))
+
+        self.doc_freqs = array('I', (len(plist) for plist in postings))
+        lengths = self.doc_lengths
+        self.max_tfs = array('f', (max(tf for _, tf, _ in plist) for plist in postings))
+        self.min_lengths = array('I', (min(lengths[doc_id] for doc_id, _, _ in plist) for plist in postings))
+        self._compute_idf()
+        self._compute_upper_bounds()
+        self.fuzzy = FuzzyIndex(self.vocab, self.terms, self.doc_freqs) if FUZZY_MATCHING else None
+
+    def doc_positions(self, term_id, doc_id):
+        """Sorted token offsets of a term in one document (empty when absent)"""
+        start, end = self.offsets[term_id], self.offsets[term_id + 1]
+        i = bisect_left(self.doc_ids, doc_id, start, end)
+        if i == end or self.doc_ids[i] != doc_id:
+            return ()
+        first = self.pos_starts[i] + 1
+        return self.positions[first:first + self.positions[first - 1]]
+
+    def length_norm(self):
+        """(base, scale) such that a document's length norm is base + scale * doc_lengths[doc_id].
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+        That is k1 * (1 - b + b * |d| / avgdl). It is derived from avgdl when
+        scoring instead of being stored per document, so an append that moves
+        avgdl does not rewrite N norms.
+        """
+        return self.k1 * (1 - self.b), self.k1 * self.b / (self.avgdl or 1)
 
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+    def _compute_idf(self):
+        self.idf = array('d', (bm25_idf(self.N, freq) for freq in self.doc_freqs))
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
+    def _compute_upper_bounds(self):
+        """Upper bound of each term's contribution to any document, for score_top_k().
+
+        The weight grows with tf and shrinks with document length, so the
+        term's largest tf over its shortest document bounds it. Unlike the
+        exact per-posting maximum, that needs one pass over the vocabulary
+        and append() keeps max_tfs/min_lengths current.
+        """
+        k1_plus_1 = self.k1 + 1
+        base, scale = self.length_norm()
+        self.max_weights = array('d', (
+            idf * tf * k1_plus_1 / (tf + base + scale * length)
+            for idf, tf, length in zip(self.idf, self.max_tfs, self.min_lengths)
+        ))
+
+    def append(self, documents):
+        """Index documents added after the current last one, in O(new tokens).
+
+        Vocabulary, document frequencies, lengths and avgdl are updated right
+        away; length norms follow from avgdl when scoring. The new postings
+        wait in _pending: idf, the flat postings arrays and the MaxScore
+        bounds depend on N, so they are rebuilt lazily (_refresh) by the next
+        query. That costs C-level copies of the arrays plus one pass over the
+        vocabulary, with no tokenizing; new position lists simply go to the
+        end of the positions array. The result ranks exactly like fit() over
+        all documents.
+
+        Not thread-safe: cached indexes are appended to as copies (copy())
+        and refreshed before they are shared (see _append_index).
+        """
+        pending = self._pending
+        for doc in documents:
+            tokens = self.tokenize(doc)
+            doc_id = self.N
+            self.N += 1
+            self.doc_lengths.append(len(tokens))
+            self.total_length += len(tokens)
+            for word, positions in self.token_positions(tokens).items():
+                term_id = self.vocab.get(word)
+                if term_id is None:
+                    term_id = self.vocab[sys.intern(word)] = len(self.terms)
+                    self.terms.append(word)
+                    self.doc_freqs.append(0)
+                    self.max_tfs.append(0)
+                    self.min_lengths.append(len(tokens))
+                    self.offsets.append(self.offsets[-1])  # No postings in the flat arrays yet
+                    if self.fuzzy is not None:
+                        self.fuzzy.add(term_id)
+                self.doc_freqs[term_id] += 1
+                self.max_tfs[term_id] = max(self.max_tfs[term_id], len(positions))
+                self.min_lengths[term_id] = min(self.min_lengths[term_id], len(tokens))
+                pending.setdefault(term_id, []).append((doc_id, len(positions), positions))
+        if self.N:
+            self.avgdl = self.total_length / self.N
+        self._matrix = None
+
+    def _refresh(self):
+        """Merge appended postings into the flat arrays; recompute idf, drop the bounds"""
+        if not self._pending:
+            return
+        offsets, doc_ids, tfs, pos_starts = self.offsets, self.doc_ids, self.tfs, self.pos_starts
+        pending = self._pending
+        merged_docs, merged_tfs, merged_starts = array('I'), array('f'), array('I')
+        start = 0
+        for term_id in sorted(pending):
+            # Untouched terms between two pending ones are copied as one block
+            end = offsets[term_id + 1]
+            merged_docs += doc_ids[start:end]
+            merged_tfs += tfs[start:end]
+            merged_starts += pos_starts[start:end]
+            for doc_id, tf, positions in pending[term_id]:
+                merged_docs.append(doc_id)
+                merged_tfs.append(tf)
+                merged_starts.append(len(self.positions))  # New position lists go to the end
+                self.positions.append(len(positions))
+                self.positions.extend(positions)
+            start = end
+        merged_docs += doc_ids[start:]
+        merged_tfs += tfs[start:]
+        merged_starts += pos_starts[start:]
+
+        # Every offset moves by the number of postings appended to terms up to and including its own
+        added = [0] * len(self.terms)
+        for term_id, plist in pending.items():
+            added[term_id] = len(plist)
+        merged_offsets = array('I', [0])
+        merged_offsets.extend(map(add, offsets[1:], accumulate(added)))
+        self.offsets, self.doc_ids, self.tfs, self.pos_starts = merged_offsets, merged_docs, merged_tfs, merged_starts
+        self._pending = {}
+        self._compute_idf()
+        self.max_weights = None  # Only MaxScore needs them: computed on first use
+
+    def copy(self):
+        """Copy that append() can extend while other threads keep querying this index.
+
+        Containers that append() and _refresh() grow in place are copied
+        (C-level); the posting arrays are shared, since _refresh() replaces
+        them rather than editing them.
+        """
+        clone = copy.copy(self)
+        clone.vocab, clone.terms = dict(self.vocab), list(self.terms)
+        clone.offsets, clone.positions = self.offsets[:], self.positions[:]
+        clone.doc_lengths, clone.doc_freqs = self.doc_lengths[:], self.doc_freqs[:]
+        clone.max_tfs, clone.min_lengths = self.max_tfs[:], self.min_lengths[:]
+        clone._pending = {term_id: list(plist) for term_id, plist in self._pending.items()}
+        clone._matrix = None
+        if self.fuzzy is not None:
+            clone.fuzzy = self.fuzzy.copy(clone.vocab, clone.terms, clone.doc_freqs)
+        return clone
+
+    def postings(self, term):
+        """(doc_id, tf) pairs of one term (empty when the term is not indexed)"""
+        self._refresh()
+        term_id = self.vocab.get(term)
+        if term_id is None:
+            return ()
+        start, end = self.offsets[term_id], self.offsets[term_id + 1]
+        return zip(self.doc_ids[start:end], self.tfs[start:end])
+
+    def query_terms(self, query):
+        """Query tokens, with misspelled (out-of-vocabulary) tokens corrected when fuzzy matching is on"""
+        tokens = self.tokenize(query)
+        if self.fuzzy is None or all(token in self.vocab for token in tokens):
+            return tokens
+        self.fuzzy.track_vocabulary(_unified_key())  # _is_known_word() changes with every CSV
+        corrected = (self.fuzzy.correct(token, _is_known_word) for token in tokens)
+        return [token for token in corrected if token is not None]
+
+    def parse_query(self, query):
+        """Query term ids (in query order) and the term ids of each quoted phrase.
+
+        phrases is None when a quoted word occurs in no document, so nothing
+        can match the query.
+        """
+        tokens = [term_id for term_id in map(self.vocab.get, self.query_terms(query)) if term_id is not None]
+        phrases = []
+        for phrase in split_phrases(query):
+            words = self.query_terms(phrase)
+            term_ids = [self.vocab.get(word) for word in words]
+            if len(words) != len(self.tokenize(phrase)) or None in term_ids:
+                return tokens, None
+            if term_ids:
+                phrases.append(term_ids)
+        return tokens, phrases
+
+    def score(self, query, top_k=None):
+        """Score documents containing at least one query term.
+
+        Returns (doc_id, score) pairs sorted by descending score (ties by doc_id);
+        with top_k, only the best top_k are selected via a heap, or via
+        score_top_k() when the query's postings are long enough to pay off.
+        Rows must contain every quoted phrase, and the best PROXIMITY_WINDOW
+        rows of a multi-term query are re-ranked with proximity().
+        """
+        self._refresh()
+        tokens, phrases = self.parse_query(query)
+        if phrases is None:
+            return []
+        if phrases:
+            return self.rerank(tokens, self._score_docs(tokens, self.phrase_docs(phrases)), top_k)
+        if not PROXIMITY_WEIGHT or len(set(tokens)) < 2:
+            return self._bag_of_words(tokens, top_k)
+        window = None if top_k is None else max(top_k, PROXIMITY_WINDOW)
+        return self.rerank(tokens, self._bag_of_words(tokens, window), top_k)
+
+    def _bag_of_words(self, tokens, top_k=None):
+        """Plain BM25 ranking of query term ids: MaxScore for long postings, else exhaustive"""
+        offsets = self.offsets
+        if top_k is not None and sum(offsets[t + 1] - offsets[t] for t in tokens) >= MAXSCORE_MIN_POSTINGS:
+            return self._max_score(tokens, top_k)
+        return self._exhaustive(tokens, top_k)
+
+    def _score_docs(self, tokens, docs):
+        """Bag-of-words scores of the given documents only, ranked like score()"""
+        k1_plus_1 = self.k1 + 1
+        base, scale = self.length_norm()
+        lengths, offsets, doc_ids, tfs = self.doc_lengths, self.offsets, self.doc_ids, self.tfs
         scores = []
+        for doc_id in docs:
+            score = 0.0
+            for term_id in tokens:
+                start, end = offsets[term_id], offsets[term_id + 1]
+                i = bisect_left(doc_ids, doc_id, start, end)
+                if i < end and doc_ids[i] == doc_id:
+                    tf = tfs[i]
+                    score += self.idf[term_id] * tf * k1_plus_1 / (tf + base + scale * lengths[doc_id])
+            scores.append((doc_id, score))
+        return sorted(scores, key=lambda x: (-x[1], x[0]))
+
+    def phrase_docs(self, phrases):
+        """Documents containing every phrase (list of term ids) as consecutive tokens"""
+        offsets, doc_ids = self.offsets, self.doc_ids
+        # Documents holding every phrase word (C-level set intersection), rarest term first
+        term_ids = sorted({term_id for phrase in phrases for term_id in phrase},
+                          key=lambda term_id: offsets[term_id + 1] - offsets[term_id])
+        docs = set(doc_ids[offsets[term_ids[0]]:offsets[term_ids[0] + 1]])
+        for term_id in term_ids[1:]:
+            docs.intersection_update(doc_ids[offsets[term_id]:offsets[term_id + 1]])
+        # ...then position lists decide
+        for phrase in phrases:
+            if len(phrase) > 1:
+                docs = {doc_id for doc_id in docs if contains_phrase(
+                    phrase, {term_id: self.doc_positions(term_id, doc_id) for term_id in phrase})}
+        return docs
+
+    def proximity(self, tokens, doc_id):
+        """Boost for consecutive query terms that occur close together in a document"""
+        positions = {term_id: self.doc_positions(term_id, doc_id) for term_id in set(tokens)}
+        return proximity_boost(tokens, positions, self.idf)
+
+    def rerank(self, tokens, ranked, top_k=None):
+        """Add proximity() to the best PROXIMITY_WINDOW of a ranked [(doc_id, score)] list.
+
+        The window holds the highest bag-of-words scores and boosts are never
+        negative, so no document below it can overtake one inside it.
+        """
+        return rerank_window(ranked, lambda doc_id: self.proximity(tokens, doc_id), top_k)
+
+    def _exhaustive(self, tokens, top_k=None):
+        """score() over query term ids, accumulating every posting"""
+        self._refresh()
+        scores = defaultdict(float)
+        k1_plus_1 = self.k1 + 1
+        base, scale = self.length_norm()
+        lengths, offsets, doc_ids, tfs = self.doc_lengths, self.offsets, self.doc_ids, self.tfs
+
+        for term_id in tokens:
+            idf = self.idf[term_id]
+            start, end = offsets[term_id], offsets[term_id + 1]
+            for doc_id, tf in zip(doc_ids[start:end], tfs[start:end]):
+                scores[doc_id] += idf * tf * k1_plus_1 / (tf + base + scale * lengths[doc_id])
+
+        if top_k is not None:
+            return heapq.nlargest(top_k, scores.items(), key=lambda x: (x[1], -x[0]))
+        return sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+
+    def score_top_k(self, query, top_k):
+        """Best top_k bag-of-words (doc_id, score) pairs via MaxScore early termination.
+
+        Returns exactly what score(query, top_k) returns without phrases and
+        proximity (PROXIMITY_WEIGHT = 0), with the same ties and scores.
+        Terms are accumulated term-at-a-time, largest upper bound
+        (max_weights x occurrences) first. Once the k-th best partial score
+        exceeds the bound of every term still to come, no unseen document can
+        reach the top k. After that, the remaining (low-idf, long) postings
+        are only probed with bisect for the surviving candidates. Candidates
+        are pruned again after each term. The few documents at the cut-off
+        are rescored in query order, so floating-point sums match score()
+        bit for bit.
+        """
+        self._refresh()
+        tokens = [term_id for term_id in map(self.vocab.get, self.query_terms(query)) if term_id is not None]
+        return self._max_score(tokens, top_k)
+
+    def _max_score(self, tokens, top_k):
+        """score_top_k() over query term ids (in query order, repeats kept)"""
+        self._refresh()
+        if top_k <= 0 or not tokens:
+            return []
+
+        k1_plus_1 = self.k1 + 1
+        base, scale = self.length_norm()
+        lengths, offsets, doc_ids, tfs, idfs = self.doc_lengths, self.offsets, self.doc_ids, self.tfs, self.idf
+        occurrences = Counter(tokens)
+        if self.max_weights is None:
+            self._compute_upper_bounds()
+        bounds = {term_id: self.max_weights[term_id] * count for term_id, count in occurrences.items()}
+        remaining = sum(bounds.values())
+        eps = 1e-9  # far above float rounding error, far below any real score gap
+
+        scores = defaultdict(float)
+        pruning = False
+        for term_id in sorted(bounds, key=bounds.get, reverse=True):
+            count, idf = occurrences[term_id], idfs[term_id]
+            start, end = offsets[term_id], offsets[term_id + 1]
+            if len(scores) >= top_k:
+                threshold = heapq.nlargest(top_k, scores.values())[-1]
+                pruning = pruning or remaining + eps < threshold
+
+            if pruning:
+                scores = {doc_id: score for doc_id, score in scores.items() if score + remaining + eps >= threshold}
+                for doc_id in scores:
+                    pos = bisect_left(doc_ids, doc_id, start, end)
+                    if pos < end and doc_ids[pos] == doc_id:
+                        tf = tfs[pos]
+                        scores[doc_id] += count * (idf * tf * k1_plus_1 / (tf + base + scale * lengths[doc_id]))
+            else:
+                for doc_id, tf in zip(doc_ids[start:end], tfs[start:end]):
+                    scores[doc_id] += count * (idf * tf * k1_plus_1 / (tf + base + scale * lengths[doc_id]))
+            remaining -= bounds[term_id]
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
+        # Rescore everything within eps of the cut-off exactly as score() sums it
+        cutoff = heapq.nlargest(top_k, scores.values())[-1] - eps
+        exact = []
+        for doc_id, approx in scores.items():
+            if approx < cutoff:
+                continue
+            weights = {}
+            for term_id in occurrences:
+                start, end = offsets[term_id], offsets[term_id + 1]
+                pos = bisect_left(doc_ids, doc_id, start, end)
+                if pos < end and doc_ids[pos] == doc_id:
+                    tf = tfs[pos]
+                    weights[term_id] = idfs[term_id] * tf * k1_plus_1 / (tf + base + scale * lengths[doc_id])
+            score = 0.0
+            for term_id in tokens:
+                if term_id in weights:
+                    score += weights[term_id]
+            exact.append((doc_id, score))
+        return heapq.nlargest(top_k, exact, key=lambda x: (x[1], -x[0]))
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    def matrix(self):
+        """Precomputed sparse term x document weight matrix (built once per index)"""
+        self._refresh()
+        if getattr(self, "_matrix", None) is None:
+            self._matrix = ScoreMatrix(self)
+        return self._matrix
 
-            scores.append((idx, score))
+    def term_hits(self, query):
+        """Number of distinct query terms each matching document contains"""
+        self._refresh()
+        hits = defaultdict(int)
+        for token in set(self.query_terms(query)):
+            for doc_id, _ in self.postings(token):
+                hits[doc_id] += 1
+        return hits
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+
+class BM25F(BM25):
+    """Field-weighted BM25 (BM25F) over a fixed list of columns.
+
+    Each field's term frequency is length-normalised against that field's
+    average length and multiplied by its boost; the sum is stored in the
+    postings as a single pseudo term frequency. The norm becomes the constant k1,
+    so the inherited score() costs exactly the same as plain BM25. Field
+    norms depend on corpus-wide averages, so appended rows mean a refit
+    (_append_index only patches plain BM25 indexes).
+    """
+
+    def __init__(self, k1=1.5, b=0.75, boosts=None):
+        super().__init__(k1, b)
+        self.boosts = list(boosts or [])
+
+    def fit(self, documents):
+        """Build postings from documents given as lists of field texts"""
+        field_tokens = [[self.tokenize(field) for field in doc] for doc in documents]
+        self.N = len(field_tokens)
+        if self.N == 0:
+            return
+
+        n_fields = max(len(doc) for doc in field_tokens)
+        boosts = self.boosts + [1.0] * (n_fields - len(self.boosts))
+        avg_field_len = [
+            (sum(len(doc[f]) for doc in field_tokens if f < len(doc)) / self.N) or 1
+            for f in range(n_fields)
+        ]
+
+        vocab = {}
+        postings = []
+        self.doc_lengths = array('I')
+        for doc_id, doc in enumerate(field_tokens):
+            weighted_tf = defaultdict(float)
+            doc_positions = defaultdict(list)
+            offset = 0  # Positions run on across fields, as in the joined BM25 document
+            for f, tokens in enumerate(doc):
+                if not tokens:
+                    continue
+                field_norm = 1 - self.b + self.b * len(tokens) / avg_field_len[f]
+                for word, positions in self.token_positions(tokens, offset).items():
+                    weighted_tf[word] += boosts[f] * len(positions) / field_norm
+                    doc_positions[word].extend(positions)
+                offset += len(tokens)
+            for word, tf in weighted_tf.items():
+                term_id = vocab.get(word)
+                if term_id is None:
+                    term_id = vocab[sys.intern(word)] = len(postings)
+                    postings.append([])
+                postings[term_id].append((doc_id, tf, doc_positions[word]))
+            self.doc_lengths.append(sum(len(tokens) for tokens in doc))
+
+        self.avgdl = sum(self.doc_lengths) / self.N
+        self._store_postings(vocab, postings)
+
+    def length_norm(self):
+        """Fields are already length-normalised in the pseudo term frequencies"""
+        return self.k1, 0.0
+
+
+class ScoreMatrix:
+    """Sparse term x document matrix of BM25 weights in CSR-by-term layout.
+
+    Row t holds idf(t) * tf * (k1 + 1) / (tf + norm_d) for every document d
+    containing t, so a query's scores are the product of its term-count
+    vector with the matrix. A batch of queries is scored in one pass: each
+    distinct term's row is read once and scattered into every query that
+    uses it.
+    """
+
+    def __init__(self, bm25):
+        # Term ids, row offsets and document ids are shared with the index
+        self.query_terms = bm25.query_terms
+        self.parse_query, self.phrase_docs, self.rerank = bm25.parse_query, bm25.phrase_docs, bm25.rerank
+        self.vocab = bm25.vocab
+        self.indptr = bm25.offsets
+        self.doc_ids = bm25.doc_ids
+        self.weights = array('d')
+
+        k1_plus_1 = bm25.k1 + 1
+        base, scale = bm25.length_norm()
+        lengths, tfs = bm25.doc_lengths, bm25.tfs
+        for term_id, idf in enumerate(bm25.idf):
+            for i in range(self.indptr[term_id], self.indptr[term_id + 1]):
+                tf = tfs[i]
+                self.weights.append(idf * tf * k1_plus_1 / (tf + base + scale * lengths[self.doc_ids[i]]))
+
+    def query_vector(self, query):
+        """Sparse term-count vector {term_id: count} for a query"""
+        vector = defaultdict(int)
+        for token in self.query_terms(query):
+            term_id = self.vocab.get(token)
+            if term_id is not None:
+                vector[term_id] += 1
+        return vector
+
+    def score_batch(self, queries, top_k=None):
+        """Scores for many queries at once; returns one ranked [(doc_id, score)] list per query"""
+        vectors = [self.query_vector(q) for q in queries]
+
+        # Invert the batch: term_id -> [(query_idx, count)]
+        users = defaultdict(list)
+        for q_idx, vector in enumerate(vectors):
+            for term_id, count in vector.items():
+                users[term_id].append((q_idx, count))
+
+        accumulators = [defaultdict(float) for _ in queries]
+        doc_ids, weights, indptr = self.doc_ids, self.weights, self.indptr
+        for term_id, term_users in users.items():
+            for i in range(indptr[term_id], indptr[term_id + 1]):
+                doc_id, weight = doc_ids[i], weights[i]
+                for q_idx, count in term_users:
+                    accumulators[q_idx][doc_id] += weight * count
+
+        ranked = []
+        for query, scores in zip(queries, accumulators):
+            # Same phrase filter and proximity re-ranking as BM25.score()
+            tokens, phrases = self.parse_query(query)
+            if phrases is None:
+                ranked.append([])
+                continue
+            if phrases:
+                docs = self.phrase_docs(phrases)
+                scores = {doc_id: score for doc_id, score in scores.items() if doc_id in docs}
+            rerank = phrases or (PROXIMITY_WEIGHT and len(set(tokens)) > 1)
+            window = top_k if top_k is None or not rerank else max(top_k, PROXIMITY_WINDOW)
+            if window is not None:
+                top = heapq.nlargest(window, scores.items(), key=lambda x: (x[1], -x[0]))
+            else:
+                top = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+            ranked.append(self.rerank(tokens, top, top_k) if rerank else top)
+        return ranked
 
 
 # ============ SEARCH FUNCTIONS ============
 def _load_csv(filepath):
     """Load CSV and return list of dicts"""
+    import csv  # only needed when (re)building an index
     with open(filepath, 'r', encoding='utf-8') as f:
         return list(csv.DictReader(f))
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
-    if not filepath.exists():
-        return []
+def load_rows(filepath):
+    """CSV rows memoised in the process-wide index cache (invalidated by mtime/size)"""
+    stat = os.stat(filepath)
+    key = ("rows", stat.st_mtime_ns, stat.st_size)
+    cached = _INDEX_CACHE.get(filepath)
+    if cached and cached[0] == key:
+        _INDEX_STATS["memory_hits"] += 1
+        return cached[1]
+    rows = _load_csv(filepath)
+    _INDEX_CACHE[filepath] = (key, rows, None)
+    return rows
+
+
+def _parse_csv(raw, fieldnames=None):
+    """Rows and header of CSV bytes (same decoding and newline handling as _load_csv)"""
+    import csv
+    import io
+    reader = csv.DictReader(io.StringIO(raw.decode('utf-8'), newline=None), fieldnames=fieldnames)
+    return list(reader), reader.fieldnames
+
+
+def _csv_source(raw, fieldnames):
+    """What append detection needs to know about the bytes an index was built from"""
+    return {"size": len(raw), "crc": zlib.crc32(raw), "fieldnames": fieldnames,
+            "complete_lines": raw.endswith(b"\n")}
+
+
+def _build_index(filepath, search_cols, ranking=DEFAULT_RANKING, boosts=None):
+    """Parse CSV and fit a BM25 (or BM25F) index over its search columns"""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    data, fieldnames = _parse_csv(raw)
 
-    data = _load_csv(filepath)
+    if ranking == "bm25f":
+        boosts = boosts or {}
+        bm25 = BM25F(boosts=[boosts.get(col, 1.0) for col in search_cols])
+        bm25.fit([[str(row.get(col, "")) for col in search_cols] for row in data])
+        return data, bm25
 
     # Build documents from search columns
     documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
 
-    # BM25 search
     bm25 = BM25()
     bm25.fit(documents)
-    ranked = bm25.score(query)
+    bm25.source = _csv_source(raw, fieldnames)
+    return data, bm25
+
+
+def _append_index(filepath, search_cols, data, bm25):
+    """(rows, BM25) with the rows appended to the CSV since bm25 was built.
+
+    The change counts as an append only if the file grew, the old content
+    ended on a line break, and the first source["size"] bytes still have the
+    old CRC32. Only the bytes after that offset are parsed and tokenized.
+    data and bm25 are left untouched (copy-on-write), since other threads
+    may still be querying them. Returns None when the change is anything
+    else, so the caller refits.
+    """
+    source = getattr(bm25, "source", None)
+    if type(bm25) is not BM25 or not source or not source["complete_lines"]:
+        return None
+    with open(filepath, 'rb') as f:
+        head = f.read(source["size"])
+        tail = f.read()
+    if not tail or len(head) < source["size"] or zlib.crc32(head) != source["crc"]:
+        return None
+
+    rows, _ = _parse_csv(tail, source["fieldnames"])
+    bm25 = bm25.copy()
+    bm25.append([" ".join(str(row.get(col, "")) for col in search_cols) for row in rows])
+    bm25._refresh()  # Merge now, so queries never rewrite a published index
+    bm25.source = dict(source, size=source["size"] + len(tail), crc=zlib.crc32(tail, source["crc"]),
+                       complete_lines=tail.endswith(b"\n"))
+    return data + rows, bm25
+
+
+def _index_path(filepath, ranking=DEFAULT_RANKING):
+    """Compiled index location for a CSV (stacks/react.csv -> .index/stacks__react.pickle)"""
+    return _resolved_index_path(Path(filepath), ranking, DATA_DIR, INDEX_DIR)
+
+
+@lru_cache(maxsize=256)
+def _resolved_index_path(filepath, ranking, data_dir, index_dir):
+    # resolve() costs more than a warm search, so it runs once per CSV
+    relative = filepath.resolve().relative_to(data_dir.resolve())
+    name = relative.with_suffix("").as_posix().replace("/", "__")
+    if ranking != "bm25":
+        name += f".{ranking}"
+    return index_dir / (name + ".pickle")
+
+
+def _index_key(filepath, search_cols, ranking=DEFAULT_RANKING, boosts=None):
+    """Invalidation key: format version, CSV mtime/size, indexed columns and ranking setup"""
+    stat = os.stat(filepath)
+    key = (INDEX_VERSION, stat.st_mtime_ns, stat.st_size, tuple(search_cols))
+    if ranking == "bm25f":
+        key += (ranking, tuple((boosts or {}).get(col, 1.0) for col in search_cols))
+    return key
+
+
+def _cached_index(index_file, key, build, rebuild=False, update=None):
+    """Return the (rows, BM25) payload stored at index_file, calling build() when stale or missing.
+
+    update(stale_key, data, bm25), when given, may bring a stale payload up
+    to date (e.g. appended CSV rows) as a new payload, leaving the one it is
+    given as it was for threads still querying it; it returns None to force
+    build(). A payload updated from the warm copy is only published in
+    memory: the disk copy catches up, with the same update, the next time a
+    process loads it cold.
+    """
+    # Process-wide cache: long-running callers (search daemon) keep indexes warm
+    cached = _INDEX_CACHE.get(index_file)
+    if not rebuild and cached and cached[0] == key:
+        _INDEX_STATS["memory_hits"] += 1
+        return cached[1], cached[2]
+
+    with _INDEX_LOCK:
+        cached = _INDEX_CACHE.get(index_file)
+        if not rebuild and cached and cached[0] == key:  # Another thread got here first
+            _INDEX_STATS["memory_hits"] += 1
+            return cached[1], cached[2]
+        # A warm stale copy is patched before the (slower) disk payload is even read
+        if not rebuild and update and cached and cached[2] is not None:
+            updated = update(cached[0], cached[1], cached[2])
+            if updated is not None:
+                _INDEX_STATS["appends"] += 1
+                _INDEX_CACHE[index_file] = (key,) + updated
+                return updated
+
+        updated = None
+        if not rebuild and index_file.exists():
+            try:
+                with open(index_file, 'rb') as f:
+                    payload = pickle.load(f)
+                if payload.get("key") == key:
+                    _INDEX_STATS["disk_loads"] += 1
+                    _INDEX_CACHE[index_file] = (key, payload["data"], payload["bm25"])
+                    return payload["data"], payload["bm25"]
+                if update:
+                    updated = update(payload["key"], payload["data"], payload["bm25"])
+            except Exception:
+                pass  # Corrupt or incompatible index: fall through and rebuild
+
+        if updated is not None:
+            data, bm25 = updated
+            _INDEX_STATS["appends"] += 1
+        else:
+            data, bm25 = build()
+            _INDEX_STATS["builds"] += 1
+        _store_index(index_file, key, data, bm25)
+        return data, bm25
+
+
+def _store_index(index_file, key, data, bm25):
+    """Persist a (rows, BM25) payload under key and make it the in-memory copy"""
+    # Write atomically; a read-only checkout simply keeps the in-memory index
+    try:
+        INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = index_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({"key": key, "data": data, "bm25": bm25}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, index_file)
+    except OSError:
+        pass
+
+    _INDEX_CACHE[index_file] = (key, data, bm25)
+    return data, bm25
+
+
+def _load_index(filepath, search_cols, rebuild=False, ranking=DEFAULT_RANKING, boosts=None):
+    """Load the compiled index for a CSV, rebuilding it when stale or missing"""
+    return _cached_index(
+        _index_path(filepath, ranking),
+        _index_key(filepath, search_cols, ranking, boosts),
+        lambda: _build_index(filepath, search_cols, ranking, boosts),
+        rebuild,
+        # BM25F field norms shift for every document when rows arrive, so only BM25 appends
+        update=_index_updater(filepath, search_cols) if ranking == "bm25" else None
+    )
+
+
+def _index_updater(filepath, search_cols):
+    """update() for _cached_index: apply appended rows when only the CSV's size/mtime moved"""
+    def update(stale_key, data, bm25):
+        key = _index_key(filepath, search_cols)
+        if stale_key[0] != key[0] or stale_key[3:] != key[3:]:
+            return None  # Index format or search columns changed
+        return _append_index(filepath, search_cols, data, bm25)
+    return update
+
+
+def _build_unified_index():
+    """One BM25 over every domain and stack row; data is [(source, row)]"""
+    data = []
+    documents = []
+    for name, filepath, search_cols, _ in _index_targets():
+        if not filepath.exists():
+            continue
+        rows, _ = _load_index(filepath, search_cols)
+        for row in rows:
+            data.append((name, row))
+            documents.append(" ".join(str(row.get(col, "")) for col in search_cols))
+
+    bm25 = BM25()
+    bm25.fit(documents)
+    return data, bm25
+
+
+def _unified_key():
+    """Invalidation key covering every source CSV"""
+    return (INDEX_VERSION,) + tuple(
+        (name,) + _index_key(filepath, search_cols)[1:]
+        for name, filepath, search_cols, _ in _index_targets() if filepath.exists()
+    )
+
+
+def _load_unified_index(rebuild=False):
+    """Load the cross-domain index, invalidated when any source CSV changes"""
+    return _cached_index(INDEX_DIR / "_unified.pickle", _unified_key(), _build_unified_index, rebuild)
+
+
+def _build_vocabulary():
+    """Union of every source's indexed terms (payload shape matches _cached_index)"""
+    vocabulary = set()
+    for name, filepath, search_cols, _ in _index_targets():
+        if filepath.exists():
+            vocabulary.update(_load_index(filepath, search_cols)[1].vocab)
+    return frozenset(vocabulary), None
+
+
+def _is_known_word(token):
+    """True when token is indexed in any domain or stack CSV"""
+    vocabulary, _ = _cached_index(INDEX_DIR / "_vocabulary.pickle", _unified_key(), _build_vocabulary)
+    return token in vocabulary
+
+
+def _index_targets():
+    """(name, csv path, search columns, BM25F boosts) for every domain and stack"""
+    targets = [(domain, DATA_DIR / cfg["file"], cfg["search_cols"], FIELD_BOOSTS.get(domain, {}))
+               for domain, cfg in CSV_CONFIG.items()]
+    targets += [(f"stack:{stack}", DATA_DIR / cfg["file"], _STACK_COLS["search_cols"], _STACK_BOOSTS)
+                for stack, cfg in STACK_CONFIG.items()]
+    return targets
+
+
+def rebuild_indexes():
+    """Recompile the index of every domain and stack CSV, returns {name: seconds}"""
+    timings = {}
+    for name, filepath, search_cols, boosts in _index_targets():
+        if not filepath.exists():
+            continue
+        for ranking in RANKINGS:
+            start = time.perf_counter()
+            _load_index(filepath, search_cols, rebuild=True, ranking=ranking, boosts=boosts)
+            label = name if ranking == DEFAULT_RANKING else f"{name} ({ranking})"
+            timings[label] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _load_unified_index(rebuild=True)
+    timings["all"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _load_domain_map(rebuild=True)
+    timings["domain map"] = time.perf_counter() - start
+
+    import sqlite_fts
+    start = time.perf_counter()
+    sqlite_fts.build_database()
+    timings["sqlite fts5"] = time.perf_counter() - start
+    return timings
+
+
+def warm_indexes():
+    """Load every domain and stack index into the process-wide cache"""
+    for name, filepath, search_cols, boosts in _index_targets():
+        if filepath.exists():
+            for ranking in RANKINGS:
+                _load_index(filepath, search_cols, ranking=ranking, boosts=boosts)
+    _load_unified_index()
+    _load_domain_map()
+
+
+class ResultCache:
+    """Thread-safe LRU of search results with hit/miss/time-saved counters.
+
+    Keys are built from the query's BM25 tokens in query order plus its
+    quoted phrases (so case and punctuation do not matter, but word order
+    does: phrases and proximity rank on it), the index key of the CSV
+    (which changes with its mtime/size), output columns and max_results.
+    Queries with out-of-vocabulary words also carry the key of every other
+    CSV, whose words typo correction leaves alone.
+    """
+
+    def __init__(self, maxsize=RESULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.time_saved += entry[1]
+            return entry[0]
+
+    def put(self, key, results, cost):
+        with self._lock:
+            self._entries[key] = (results, cost)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            self.time_saved = 0.0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "time_saved_ms": round(self.time_saved * 1000, 3)
+            }
+
+
+_RESULT_CACHE = ResultCache()
+
+
+def cache_stats():
+    """Counters for the shared result cache and the process-wide index cache"""
+    return {
+        "results": _RESULT_CACHE.stats(),
+        "indexes": dict(_INDEX_STATS, loaded=len(_INDEX_CACHE))
+    }
+
+
+def clear_caches():
+    """Drop cached results and in-memory indexes (on-disk indexes are kept)"""
+    _RESULT_CACHE.clear()
+    _INDEX_CACHE.clear()
+    for name in _INDEX_STATS:
+        _INDEX_STATS[name] = 0
+
+
+def _search_csv(filepath, search_cols, output_cols, query, max_results, ranking=DEFAULT_RANKING, boosts=None):
+    """Core search function using BM25 (or BM25F with per-column boosts)"""
+    if not filepath.exists():
+        return []
+
+    start = time.perf_counter()
+    data, bm25 = _load_index(filepath, search_cols, ranking=ranking, boosts=boosts)
+    tokens = BM25.tokenize(query)
+    # Term order and quotes matter once phrases and proximity are ranked. Out-of-vocabulary tokens are
+    # corrected unless another CSV knows them, so those results also depend on every other CSV.
+    vocabulary = _unified_key() if bm25.fuzzy is not None and any(t not in bm25.vocab for t in tokens) else None
+    cache_key = (tuple(tokens), tuple(split_phrases(query)), _index_key(filepath, search_cols, ranking, boosts),
+                 vocabulary, tuple(output_cols), max_results)
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return [dict(row) for row in cached]
+
+    ranked = bm25.score(query, top_k=max_results)
 
     # Get top results with score > 0
     results = []
-    for idx, score in ranked[:max_results]:
+    for idx, score in ranked:
         if score > 0:
             row = data[idx]
             results.append({col: row.get(col, "") for col in output_cols if col in row})
 
-    return results
+    _RESULT_CACHE.put(cache_key, results, time.perf_counter() - start)
+    return [dict(row) for row in results]
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton: every keyword occurring in a text, found in one pass.
+
+    Matching is by substring, like `keyword in text`, but the cost is linear
+    in the text length rather than in the number of keywords.
+    """
+
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [()]
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                if char not in self.goto[state]:
+                    self.goto[state][char] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append(())
+                state = self.goto[state][char]
+            self.outputs[state] += (keyword,)
+
+        # Breadth-first: a state's failure link is the longest proper suffix that is also a prefix
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.outputs[child] += self.outputs[self.fail[child]]
+
+    def find(self, text):
+        """Set of keywords occurring anywhere in text"""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+_DOMAIN_AUTOMATON = None
+
+
+def _keyword_automaton():
+    """(KeywordAutomaton over DOMAIN_KEYWORDS, keyword -> domains), built once"""
+    global _DOMAIN_AUTOMATON
+    if _DOMAIN_AUTOMATON is None:
+        domains = defaultdict(list)
+        for domain, keywords in DOMAIN_KEYWORDS.items():
+            for keyword in keywords:
+                domains[keyword].append(domain)
+        _DOMAIN_AUTOMATON = (KeywordAutomaton(domains), dict(domains))
+    return _DOMAIN_AUTOMATON
+
+
+def _build_domain_map():
+    """Derived keyword -> (domain, share) from every domain CSV's vocabulary.
+
+    A term's rate in a domain is the fraction of that CSV's rows containing
+    it; its share is that rate over the sum of its rates in all domains.
+    """
+    rates = defaultdict(dict)
+    for domain, config in CSV_CONFIG.items():
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            continue
+        _, bm25 = _load_index(filepath, config["search_cols"])
+        for term, term_id in bm25.vocab.items():
+            rates[term][domain] = bm25.doc_freqs[term_id] / bm25.N
+
+    domain_map = {}
+    for term, by_domain in rates.items():
+        domain, rate = max(by_domain.items(), key=lambda x: x[1])
+        share = rate / sum(by_domain.values())
+        if share >= DERIVED_KEYWORD_MIN_SHARE:
+            domain_map[term] = (domain, share)
+    return domain_map, None
+
+
+_DOMAIN_FILES = [str(DATA_DIR / config["file"]) for config in CSV_CONFIG.values()]
+_DOMAIN_COLUMNS = tuple((domain, tuple(config["search_cols"])) for domain, config in CSV_CONFIG.items())
+
+
+def _load_domain_map(rebuild=False):
+    """Derived keyword map, invalidated when any domain CSV changes"""
+    # Checked on every auto-detected search, so only stat plain strings
+    key = (INDEX_VERSION, "domains", DERIVED_KEYWORD_MIN_SHARE, _DOMAIN_COLUMNS)
+    for filepath in _DOMAIN_FILES:
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            continue
+        key += (stat.st_mtime_ns, stat.st_size)
+    return _cached_index(INDEX_DIR / "_domains.pickle", key, _build_domain_map, rebuild)[0]
+
+
+def rank_domains(query):
+    """Ranked distribution over domains: [(domain, probability), ...], best first.
+
+    Hand-picked DOMAIN_KEYWORDS count 1 each and are found in one
+    Aho-Corasick pass over the query. Each query word that is a derived
+    keyword adds DERIVED_KEYWORD_WEIGHT x its share to its domain, via one
+    dict lookup per word. Ties keep DOMAIN_KEYWORDS order. A query with no
+    signal at all gets [(DEFAULT_DOMAIN, 1.0)].
+    """
+    automaton, keyword_domains = _keyword_automaton()
+    scores = defaultdict(float)
+    for keyword in automaton.find(query.lower()):
+        for domain in keyword_domains[keyword]:
+            scores[domain] += 1
+
+    domain_map = _load_domain_map()
+    for token in set(BM25.tokenize(query)):
+        derived = domain_map.get(token)
+        if derived:
+            scores[derived[0]] += DERIVED_KEYWORD_WEIGHT * derived[1]
+
+    if not scores:
+        return [(DEFAULT_DOMAIN, 1.0)]
+    order = list(DOMAIN_KEYWORDS)
+    total = sum(scores.values())
+    ranked = sorted(scores.items(), key=lambda x: (-x[1], order.index(x[0]) if x[0] in order else len(order)))
+    return [(domain, round(score / total, 3)) for domain, score in ranked]
 
 
 def detect_domain(query):
     """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
-
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
-        "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
-        "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+    return rank_domains(query)[0][0]
+
+
+def _output_cols(source):
+    """Output columns for a unified-index source ("ux", "stack:react", ...)"""
+    if source.startswith("stack:"):
+        return _STACK_COLS["output_cols"]
+    return CSV_CONFIG[source]["output_cols"]
+
+
+def search_all(query, max_results=MAX_RESULTS):
+    """Federated search over every domain and stack in a single scoring pass.
+
+    Raw BM25 scores are not comparable across domains (idf and row length
+    differ per CSV), so each score is divided by the best score of its own
+    domain and weighted by the fraction of query terms the row contains.
+    """
+    data, bm25 = _load_unified_index()
+    ranked = bm25.score(query)
+    hits = bm25.term_hits(query)
+    n_terms = len({t for t in bm25.query_terms(query) if t in bm25.vocab}) or 1
+
+    domain_max = {}
+    for idx, score in ranked:
+        source = data[idx][0]
+        domain_max[source] = max(domain_max.get(source, 0), score)
+
+    normalized = [
+        (score / domain_max[data[idx][0]] * hits[idx] / n_terms, score, idx)
+        for idx, score in ranked
+    ]
+    top = heapq.nlargest(max_results, normalized, key=lambda x: (x[0], x[1], -x[2]))
+
+    results = []
+    for norm, score, idx in top:
+        source, row = data[idx]
+        result = {"Domain": source, "Relevance": round(norm, 3)}
+        result.update({col: row.get(col, "") for col in _output_cols(source) if col in row})
+        results.append(result)
+
+    return {
+        "domain": "all",
+        "query": query,
+        "file": f"{len(domain_max)} of {len(_index_targets())} CSVs matched",
+        "count": len(results),
+        "results": results
     }
 
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
-    best = max(scores, key=scores.get)
-    return best if scores[best] > 0 else "style"
 
+def _search_fts(source, search_cols, output_cols, query, max_results, ranking, boosts):
+    """Search through the SQLite FTS5 engine (bm25f ranking -> column weights)"""
+    import sqlite_fts
+    return sqlite_fts.search_source(source, search_cols, output_cols, query, max_results,
+                                    boosts if ranking == "bm25f" else None)
+
+
+def _argument_error(domain, ranking, engine=DEFAULT_ENGINE):
+    """Error message for a domain/ranking/engine combination search() cannot serve, else None"""
+    if domain is not None and domain != "all" and domain not in CSV_CONFIG:
+        return f"Unknown domain: {domain}. Available: {', '.join(CSV_CONFIG)}, all"
+    if ranking not in RANKINGS:
+        return f"Unknown ranking: {ranking}. Available: {', '.join(RANKINGS)}"
+    if engine not in ENGINES:
+        return f"Unknown engine: {engine}. Available: {', '.join(ENGINES)}"
+    if domain == "all" and (ranking != DEFAULT_RANKING or engine != DEFAULT_ENGINE):
+        return (f'Federated search (domain="all") supports only ranking="{DEFAULT_RANKING}" '
+                f'and engine="{DEFAULT_ENGINE}", got ranking="{ranking}", engine="{engine}"')
+    return None
 
-def search(query, domain=None, max_results=MAX_RESULTS):
-    """Main search function with auto-domain detection"""
+
+def search(query, domain=None, max_results=MAX_RESULTS, ranking=DEFAULT_RANKING, engine=DEFAULT_ENGINE):
+    """Main search function with auto-domain detection.
+
+    domain="all" runs the federated search_all(), which scores one unified
+    BM25 index in Python. An unknown domain, ranking or engine, or another
+    ranking or engine for domain="all", returns {"error": ..., "domain": ...}.
+    """
+    error = _argument_error(domain, ranking, engine)
+    if error:
+        return {"error": error, "domain": domain}
+    if domain == "all":
+        return search_all(query, max_results)
     if domain is None:
         domain = detect_domain(query)
 
-    config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+    config = CSV_CONFIG[domain]
     filepath = DATA_DIR / config["file"]
 
     if not filepath.exists():
         return {"error": f"File not found: {filepath}", "domain": domain}
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    if engine == "fts5":
+        results = _search_fts(domain, config["search_cols"], config["output_cols"], query, max_results,
+                              ranking, FIELD_BOOSTS.get(domain, {}))
+    else:
+        results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results,
+                              ranking, FIELD_BOOSTS.get(domain, {}))
 
     return {
         "domain": domain,
@@ -236,17 +1607,70 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     }
 
 
-def search_stack(query, stack, max_results=MAX_RESULTS):
+def search_many(queries, domain=None, max_results=MAX_RESULTS, ranking=DEFAULT_RANKING):
+    """Batch search: one result dict per query, in the same shape as search().
+
+    Queries are grouped by (detected) domain and each group is scored in a
+    single pass over that domain's precomputed weight matrix. Arguments
+    search() would reject get its error dict for every query, and so does
+    domain="all", which is not batched.
+    """
+    error = ('Federated search (domain="all") is not batched; use search()' if domain == "all"
+             else _argument_error(domain, ranking))
+    if error:
+        return [{"error": error, "domain": domain} for _ in queries]
+
+    groups = defaultdict(list)
+    for q_idx, query in enumerate(queries):
+        groups[domain or detect_domain(query)].append(q_idx)
+
+    responses = [None] * len(queries)
+    for group_domain, indices in groups.items():
+        config = CSV_CONFIG[group_domain]
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            for q_idx in indices:
+                responses[q_idx] = {"error": f"File not found: {filepath}", "domain": group_domain}
+            continue
+
+        data, bm25 = _load_index(filepath, config["search_cols"], ranking=ranking,
+                                 boosts=FIELD_BOOSTS.get(group_domain, {}))
+        batch = bm25.matrix().score_batch([queries[i] for i in indices], top_k=max_results)
+
+        for q_idx, ranked in zip(indices, batch):
+            results = [{col: data[idx].get(col, "") for col in config["output_cols"] if col in data[idx]}
+                       for idx, score in ranked if score > 0]
+            responses[q_idx] = {
+                "domain": group_domain,
+                "query": queries[q_idx],
+                "file": config["file"],
+                "count": len(results),
+                "results": results
+            }
+
+    return responses
+
+
+def search_stack(query, stack, max_results=MAX_RESULTS, ranking=DEFAULT_RANKING, engine=DEFAULT_ENGINE):
     """Search stack-specific guidelines"""
     if stack not in STACK_CONFIG:
         return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
+    if ranking not in RANKINGS:
+        return {"error": f"Unknown ranking: {ranking}. Available: {', '.join(RANKINGS)}", "stack": stack}
+    if engine not in ENGINES:
+        return {"error": f"Unknown engine: {engine}. Available: {', '.join(ENGINES)}", "stack": stack}
 
     filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
 
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    if engine == "fts5":
+        results = _search_fts(f"stack:{stack}", _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query,
+                              max_results, ranking, _STACK_BOOSTS)
+    else:
+        results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results,
+                              ranking, _STACK_BOOSTS)
 
     return {
         "domain": "stack",
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Daemon - keeps every domain/stack index warm in memory
+and answers newline-delimited JSON requests.
+
+Protocol (one JSON object per line, one response line per request):
+    {"op": "search", "query": "glassmorphism", "domain": "style", "max_results": 3, "ranking": "bm25", "engine": "python"}
+    {"op": "search_stack", "query": "forms", "stack": "react", "max_results": 3, "ranking": "bm25f"}
+    {"op": "search_many", "queries": ["focus ring", "touch target"], "domain": "ux", "max_results": 3}
+    {"op": "design_system", "query": "SaaS dashboard", "project_name": "X", "format": "ascii",
+     "persist": false, "page": null, "output_dir": "/abs/path", "pages": ["inventory"]}
+    {"op": "stats"}
+    {"op": "ping"}
+
+Responses:
+    {"id": <echoed id>, "ok": true, "result": ...}
+    {"id": <echoed id>, "ok": false, "error": "..."}
+
+Usage:
+    python search.py --serve              # Unix socket (default path below)
+    python search.py --serve --stdio      # stdin/stdout, e.g. as an agent subprocess
+
+This module only imports core/design_system when serving, and json/socket
+only once a daemon socket exists, so the client side stays cheap for
+one-shot search.py calls.
+"""
+
+import os
+import sys
+from pathlib import Path
+from stat import S_ISDIR, S_ISSOCK, S_ISVTX
+
+
+# ============ CONFIGURATION ============
+SOCKET_ENV = "UIPRO_SEARCH_SOCKET"
+CLIENT_TIMEOUT = 30
+
+
+def _temp_dir() -> str:
+    """tempfile.gettempdir()'s environment lookup, without importing tempfile (~5 ms)."""
+    for name in ("TMPDIR", "TEMP", "TMP"):
+        if os.path.isdir(os.environ.get(name, "")):
+            return os.environ[name]
+    return os.getcwd() if os.name == "nt" else "/tmp"
+
+
+def default_socket_path() -> Path:
+    """Per-user socket path, overridable with $UIPRO_SEARCH_SOCKET.
+
+    $XDG_RUNTIME_DIR is private to the user already; otherwise the socket
+    goes in a ui-ux-pro-max-<user> directory under the temp dir, which
+    serve_socket() creates with mode 0700.
+    """
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    if os.path.isdir(os.environ.get("XDG_RUNTIME_DIR", "")):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "ui-ux-pro-max.sock"
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return Path(_temp_dir()) / f"ui-ux-pro-max-{user}" / "search.sock"
+
+
+def _safe_dir(st) -> bool:
+    """A directory owned by this user (or root) that other users cannot swap entries in"""
+    return (S_ISDIR(st.st_mode) and st.st_uid in (os.getuid(), 0)
+            and (not st.st_mode & 0o022 or bool(st.st_mode & S_ISVTX)))
+
+
+def is_trusted_socket(path: Path) -> bool:
+    """True when path is a socket of this user's, in a directory no other user can tamper with.
+
+    The default path is predictable, so another local user could otherwise
+    create it first and answer with made-up results.
+    """
+    if not hasattr(os, "getuid"):
+        return True  # No per-user ownership to check
+    try:
+        st, parent = path.lstat(), path.parent.lstat()
+    except OSError:
+        return False
+    return S_ISSOCK(st.st_mode) and st.st_uid == os.getuid() and _safe_dir(parent)
+
+
+def supports_unix_socket() -> bool:
+    import socket
+    return hasattr(socket, "AF_UNIX")
+
+
+# ============ REQUEST HANDLING ============
+def handle_request(request: dict) -> dict:
+    """Dispatch one protocol request and wrap the result in a response envelope."""
+    from core import DEFAULT_ENGINE, DEFAULT_RANKING, MAX_RESULTS, cache_stats, search, search_many, search_stack
+
+    response = {"id": request.get("id")}
+    op = request.get("op")
+    try:
+        if op == "search":
+            result = search(request["query"], request.get("domain"), request.get("max_results", MAX_RESULTS),
+                            request.get("ranking", DEFAULT_RANKING), request.get("engine", DEFAULT_ENGINE))
+        elif op == "search_stack":
+            result = search_stack(request["query"], request["stack"], request.get("max_results", MAX_RESULTS),
+                                  request.get("ranking", DEFAULT_RANKING), request.get("engine", DEFAULT_ENGINE))
+        elif op == "search_many":
+            result = search_many(request["queries"], request.get("domain"), request.get("max_results", MAX_RESULTS),
+                                 request.get("ranking", DEFAULT_RANKING))
+        elif op == "design_system":
+            from design_system import generate_design_system
+            result = generate_design_system(
+                request["query"],
+                request.get("project_name"),
+                request.get("format", "ascii"),
+                persist=request.get("persist", False),
+                page=request.get("page"),
+                output_dir=request.get("output_dir"),
+                pages=request.get("pages")
+            )
+        elif op == "stats":
+            result = cache_stats()
+        elif op == "ping":
+            result = "pong"
+        else:
+            raise ValueError(f"Unknown op: {op}")
+    except Exception as e:
+        response.update(ok=False, error=f"{type(e).__name__}: {e}")
+        return response
+
+    response.update(ok=True, result=result)
+    return response
+
+
+def _handle_line(line: str) -> str:
+    import json
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+    except ValueError as e:
+        return json.dumps({"id": None, "ok": False, "error": f"Invalid request: {e}"})
+    return json.dumps(handle_request(request), ensure_ascii=False)
+
+
+def _warm():
+    """Load every index and the design system module before accepting requests."""
+    from core import warm_indexes
+    import design_system  # noqa: F401 - pay the import once, not per request
+    warm_indexes()
+
+
+# ============ SERVERS ============
+def serve_stdio(stdin=None, stdout=None):
+    """Answer JSON-lines requests from stdin until EOF."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    _warm()
+    for line in stdin:
+        if not line.strip():
+            continue
+        stdout.write(_handle_line(line) + "\n")
+        stdout.flush()
+
+
+def serve_socket(path=None):
+    """Answer JSON-lines requests on a Unix socket until interrupted."""
+    import signal
+    import socketserver
+
+    if not supports_unix_socket():
+        raise RuntimeError("Unix sockets are not available on this platform; use --stdio")
+
+    path = Path(path) if path else default_socket_path()
+    if not path.parent.exists() and hasattr(os, "getuid"):
+        path.parent.mkdir(mode=0o700)
+    if hasattr(os, "getuid") and not _safe_dir(path.parent.lstat()):
+        raise RuntimeError(f"{path.parent} is not a private directory; refusing to serve from it")
+    if os.path.lexists(path):
+        if not is_trusted_socket(path):
+            raise RuntimeError(f"{path} exists and is not a socket of this user's")
+        if request({"op": "ping"}, path) is not None:
+            raise RuntimeError(f"A search daemon is already listening on {path}")
+        path.unlink()  # Stale socket from a crashed daemon
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode("utf-8")
+                if not line.strip():
+                    continue
+                self.wfile.write((_handle_line(line) + "\n").encode("utf-8"))
+                self.wfile.flush()
+
+    def _terminate(signum, frame):
+        raise KeyboardInterrupt
+
+    _warm()
+    umask = os.umask(0o177)  # The socket is created 0600, with no window before a chmod
+    try:
+        server = socketserver.UnixStreamServer(str(path), Handler)
+    finally:
+        os.umask(umask)
+    signal.signal(signal.SIGTERM, _terminate)
+    print(f"UI Pro Max search daemon listening on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if path.exists():
+            path.unlink()
+
+
+# ============ CLIENT ============
+def request(payload: dict, path=None, timeout: float = CLIENT_TIMEOUT):
+    """Send one request to a running daemon.
+
+    Returns the response dict, or None when no daemon is reachable (or the
+    socket is not trusted, see is_trusted_socket) so the caller can fall
+    back to in-process search.
+    """
+    path = Path(path) if path else default_socket_path()
+    if not is_trusted_socket(path) or not supports_unix_socket():
+        return None
+
+    import json
+    import socket
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+
+    try:
+        return json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        return None
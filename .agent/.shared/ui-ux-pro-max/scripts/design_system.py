@@ -11,14 +11,18 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+
+    # Many page overrides in one run (MASTER.md written once)
+    result = generate_design_system("SaaS dashboard", "My Project", persist=True,
+                                    pages=["dashboard", "inventory", ("reports", "charts export")])
 """
 
-import csv
 import json
 import os
+import time
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, load_rows, DATA_DIR
 
 
 # ============ CONFIGURATION ============
@@ -41,12 +45,11 @@ class DesignSystemGenerator:
         self.reasoning_data = self._load_reasoning()
 
     def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
+        """Load reasoning rules from CSV (memoised across generator instances)."""
         filepath = DATA_DIR / REASONING_FILE
         if not filepath.exists():
             return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
+        return load_rows(filepath)
 
     def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
         """Execute searches across multiple domains."""
@@ -460,7 +463,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii",
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           pages: list = None) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,6 +475,8 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        pages: Optional list of page names or (name, extra_query) pairs; with persist,
+               all overrides are rendered in one run (see persist_pages)
 
     Returns:
         Formatted design system string
@@ -479,7 +485,10 @@ def generate_design_system(query: str, project_name: str = None, output_format:
     design_system = generator.generate(query, project_name)
 
     # Persist to files if requested
-    if persist:
+    if persist and pages:
+        page_list = ([page] if page else []) + list(pages)
+        persist_pages(design_system, page_list, output_dir, query)
+    elif persist:
         persist_design_system(design_system, page, output_dir, query)
 
     if output_format == "markdown":
@@ -526,7 +535,7 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
 
     # If page is specified, create page override file with intelligent content
     if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
+        page_file = pages_dir / page_file_name(page)
         page_content = format_page_override_md(design_system, page, page_query)
         with open(page_file, 'w', encoding='utf-8') as f:
             f.write(page_content)
@@ -539,6 +548,95 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     }
 
 
+def persist_pages(design_system: dict, pages: list, output_dir: str = None, page_query: str = None) -> dict:
+    """
+    Persist MASTER.md once, then render every page override in turn.
+
+    Pages share the process-wide index and result caches, so each CSV is loaded
+    once for the whole batch. Page names are checked before anything is written.
+
+    Args:
+        design_system: The generated design system dictionary
+        pages: Page names, or (name, extra_query) pairs appended to page_query
+        output_dir: Optional output directory (defaults to current working directory)
+        page_query: Query shared by all pages (usually the design system query)
+
+    Returns:
+        dict with created file paths, status and elapsed seconds
+
+    Raises:
+        ValueError: a page name holds a path separator, or two pages share a file
+    """
+    start = time.perf_counter()
+    pages = [(entry, "") if isinstance(entry, str) else (entry[0], entry[1] or "") for entry in pages]
+    file_names = page_file_names(name for name, _ in pages)
+    result = persist_design_system(design_system, None, output_dir)
+    pages_dir = Path(result["design_system_dir"]) / "pages"
+
+    for (name, extra), file_name in zip(pages, file_names):
+        query = f"{page_query or ''} {extra}".strip() or None
+        page_file = pages_dir / file_name
+        page_content = format_page_override_md(design_system, name, query)
+        with open(page_file, 'w', encoding='utf-8') as f:
+            f.write(page_content)
+        result["created_files"].append(str(page_file))
+
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def load_page_manifest(path: str) -> list:
+    """
+    Read a page manifest: one page per line, optionally "name: extra query".
+    Blank lines and lines starting with '#' are ignored.
+
+    Raises:
+        ValueError: a page name is not valid (see page_file_name) or repeats an earlier one
+    """
+    pages = []
+    seen = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, _, extra = line.partition(":")
+            name = name.strip()
+            try:
+                file_name = page_file_name(name)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_num}: {e}") from None
+            if file_name in seen:
+                raise ValueError(f"{path}:{line_num}: page {name!r} repeats line {seen[file_name]}")
+            seen[file_name] = line_num
+            pages.append((name, extra.strip()))
+    return pages
+
+
+def page_file_name(name: str) -> str:
+    """
+    File name of a page override under pages/ ("Order History" -> "order-history.md").
+
+    Raises:
+        ValueError: the name is empty or could point outside pages/ ("../x", "a/b")
+    """
+    slug = name.strip().lower().replace(' ', '-')
+    if not slug or slug in (".", "..") or "/" in slug or "\\" in slug:
+        raise ValueError(f"Invalid page name {name!r}: expected a name without path separators")
+    return f"{slug}.md"
+
+
+def page_file_names(names) -> list:
+    """page_file_name() of every name, refusing two pages that would share a file"""
+    file_names = {}
+    for name in names:
+        file_name = page_file_name(name)
+        if file_name in file_names:
+            raise ValueError(f"Duplicate page {name!r}: {file_names[file_name]!r} also writes pages/{file_name}")
+        file_names[file_name] = name
+    return list(file_names)
+
+
 def format_master_md(design_system: dict) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
     project = design_system.get("project_name", "PROJECT")
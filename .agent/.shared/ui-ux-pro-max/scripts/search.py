@@ -5,18 +5,45 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py "<query>" --design-system --persist [-p "Project Name"] --pages dashboard inventory reports
+       python search.py "<query>" --design-system --persist [-p "Project Name"] --manifest pages.txt
+
+Queries: words close together rank higher; "quoted phrases" must match exactly,
+         e.g. python search.py '"dark mode" dashboard' --domain style
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
+         all (federated search across every domain and stack)
 Stacks: html-tailwind, react, nextjs
 
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+  --pages      Several page overrides in one run (MASTER.md written once, indexes loaded once)
+  --manifest   File with one page per line, optionally "page: extra query"; '#' starts a comment
+
+Index:
+  --rebuild-index  Recompile the cached BM25 indexes in .index/ (normally rebuilt
+                   automatically whenever a CSV's mtime or size changes)
+
+Daemon (see daemon.py for the JSON-lines protocol):
+  --serve          Keep all indexes warm and answer requests on a Unix socket
+  --serve --stdio  Same, over stdin/stdout
+  Regular calls use a running daemon automatically and fall back to in-process
+  search when none is reachable (--no-daemon forces in-process).
+
+Startup: one-shot agent calls are dominated by interpreter start and imports,
+so only argparse, core and the daemon client load up front; design_system,
+json, sqlite3 and the socket modules are imported by the subcommands that use
+them. tests/ui_ux_pro_max/test_startup.py enforces a -X importtime budget.
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import os
+import sys
+import time
+from core import (CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, RANKINGS, DEFAULT_RANKING, ENGINES, DEFAULT_ENGINE,
+                  search, search_stack, rebuild_indexes, cache_stats)
+from daemon import request
 
 
 def format_output(result):
@@ -45,13 +72,20 @@ def format_output(result):
     return "\n".join(output)
 
 
-if __name__ == "__main__":
+def print_json(data, file=None):
+    import json
+    print(json.dumps(data, indent=2, ensure_ascii=False), file=file or sys.stdout)
+
+
+def build_parser():
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
-    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
+    parser.add_argument("query", nargs="?", help="Search query")
+    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()) + ["all"], help="Search domain (\"all\" = federated search across every domain and stack)")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ranking", "-r", choices=RANKINGS, default=DEFAULT_RANKING, help="Ranking function: bm25 (default) or bm25f (per-column boosts from FIELD_BOOSTS)")
+    parser.add_argument("--engine", "-e", choices=ENGINES, default=DEFAULT_ENGINE, help="Search engine: python (default, in-process BM25) or fts5 (SQLite database in .index/)")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
@@ -59,48 +93,138 @@ if __name__ == "__main__":
     # Persistence (Master + Overrides pattern)
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
+    parser.add_argument("--pages", nargs="+", default=None, help="Create several page override files in one run")
+    parser.add_argument("--manifest", type=str, default=None, help="Page manifest file (one 'page[: extra query]' per line)")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Index maintenance
+    parser.add_argument("--rebuild-index", action="store_true", help="Recompile all cached search indexes")
+    parser.add_argument("--cache-stats", action="store_true", help="Print result/index cache counters to stderr (the daemon's when one is running)")
+    # Daemon
+    parser.add_argument("--serve", action="store_true", help="Run a search daemon with every index kept warm")
+    parser.add_argument("--stdio", action="store_true", help="With --serve: use stdin/stdout instead of a Unix socket")
+    parser.add_argument("--socket", type=str, default=None, help="Daemon socket path (default: $UIPRO_SEARCH_SOCKET, else in $XDG_RUNTIME_DIR or a private per-user temp directory)")
+    parser.add_argument("--no-daemon", action="store_true", help="Search in-process even if a daemon is running")
+    return parser
 
-    args = parser.parse_args()
 
-    # Design system takes priority
-    if args.design_system:
+def serve(args, parser):
+    from daemon import serve_socket, serve_stdio
+    try:
+        if args.stdio:
+            serve_stdio()
+        else:
+            serve_socket(args.socket)
+    except RuntimeError as e:
+        parser.exit(1, f"Error: {e}\n")
+
+
+def run_design_system(args, via_daemon, parser):
+    from design_system import load_page_manifest, page_file_names
+    pages = list(args.pages or [])
+    try:
+        if args.manifest:
+            pages += load_page_manifest(args.manifest)
+        page_files = page_file_names(([args.page] if args.page else []) +
+                                     [p if isinstance(p, str) else p[0] for p in pages])
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    result = via_daemon({
+        "op": "design_system",
+        "query": args.query,
+        "project_name": args.project_name,
+        "format": args.format,
+        "persist": args.persist,
+        "page": args.page,
+        "output_dir": os.path.abspath(args.output_dir or os.getcwd()),
+        "pages": pages
+    })
+    if result is None:
+        from design_system import generate_design_system
         result = generate_design_system(
             args.query,
             args.project_name,
             args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            pages=pages
         )
-        print(result)
-
-        # Print persistence confirmation
-        if args.persist:
-            project_slug = args.project_name.lower().replace(' ', '-') if args.project_name else "default"
-            print("\n" + "=" * 60)
-            print(f"✅ Design system persisted to design-system/{project_slug}/")
-            print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
-            if args.page:
-                page_filename = args.page.lower().replace(' ', '-')
-                print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
-            print("")
-            print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
-            print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
-            print("=" * 60)
-    # Stack search
-    elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
-    # Domain search
+    elapsed = time.perf_counter() - start
+    print(result)
+
+    # Print persistence confirmation
+    if args.persist:
+        project_slug = args.project_name.lower().replace(' ', '-') if args.project_name else "default"
+        print("\n" + "=" * 60)
+        print(f"✅ Design system persisted to design-system/{project_slug}/")
+        print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
+        for page_file in page_files:
+            print(f"   📄 design-system/{project_slug}/pages/{page_file} (Page Overrides)")
+        if pages:
+            print(f"   ⏱️  {len(page_files)} page(s) generated in {elapsed * 1000:.0f} ms")
+        print("")
+        print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
+        print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
+        print("=" * 60)
+
+
+def run_search(args, via_daemon):
+    if args.stack:
+        result = via_daemon({"op": "search_stack", "query": args.query, "stack": args.stack,
+                             "max_results": args.max_results, "ranking": args.ranking, "engine": args.engine})
+        if result is None:
+            result = search_stack(args.query, args.stack, args.max_results, args.ranking, args.engine)
     else:
-        result = search(args.query, args.domain, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
+        result = via_daemon({"op": "search", "query": args.query, "domain": args.domain,
+                             "max_results": args.max_results, "ranking": args.ranking, "engine": args.engine})
+        if result is None:
+            result = search(args.query, args.domain, args.max_results, args.ranking, args.engine)
+
+    if args.json:
+        print_json(result)
+    else:
+        print(format_output(result))
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        serve(args, parser)
+        return
+
+    def via_daemon(payload):
+        """Result from a running daemon, or None to search in-process"""
+        if args.no_daemon:
+            return None
+        response = request(payload, args.socket)
+        if response is not None and response.get("ok"):
+            return response["result"]
+        return None
+
+    if args.rebuild_index:
+        timings = rebuild_indexes()
+        print(f"Rebuilt {len(timings)} indexes in {sum(timings.values()) * 1000:.1f} ms")
+        if not args.query:
+            return
+    elif not args.query:
+        parser.error("the following arguments are required: query")
+    if args.domain == "all" and not (args.stack or args.design_system) and \
+            (args.ranking != DEFAULT_RANKING or args.engine != DEFAULT_ENGINE):
+        parser.error(f"--domain all supports only --ranking {DEFAULT_RANKING} and --engine {DEFAULT_ENGINE}")
+
+    # Design system takes priority
+    if args.design_system:
+        run_design_system(args, via_daemon, parser)
+    else:
+        run_search(args, via_daemon)
+
+    if args.cache_stats:
+        print_json(via_daemon({"op": "stats"}) or cache_stats(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max SQLite FTS5 engine - alternative to the pure-Python BM25 in core.py
+
+All domain and stack CSVs are compiled into one SQLite database
+(.index/search.sqlite) with one FTS5 virtual table per source. Searches rank
+with FTS5's built-in bm25() and per-column weights, so nothing is parsed or
+fitted at startup. Quoted phrases and the term-proximity boost follow
+core.BM25.score(), using the token offsets FTS5 already stores (exposed per
+source through an fts5vocab 'instance' table).
+
+Schema (usable from any SQLite client):
+    meta(key TEXT PRIMARY KEY, value TEXT)        -- build fingerprint
+    sources(name TEXT PRIMARY KEY, tbl TEXT, columns TEXT)
+    rows(source TEXT, row_id INTEGER, data TEXT,  -- original CSV row as JSON
+         bases TEXT)                              -- JSON offset of each column's first token in the row
+    fts_<source>(<search columns...>)             -- rowid = row_id
+    fts_<source>_instance(term, doc, col, offset) -- fts5vocab: every token occurrence
+    vocab(source TEXT, term TEXT, df INTEGER)     -- indexed terms, for typo correction
+    deletes(source TEXT, key TEXT, term TEXT)     -- core.FuzzyIndex deletion dictionary
+
+Indexed text is pre-normalised with core.BM25.tokenize (lowercase, no
+punctuation, words of 3+ characters), so both engines see the same tokens:
+
+    SELECT r.data FROM fts_ux JOIN rows r ON r.source = 'ux' AND r.row_id = fts_ux.rowid
+    WHERE fts_ux MATCH '"keyboard" OR "focus"' ORDER BY bm25(fts_ux) LIMIT 3;
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+
+import core
+from core import (BM25, INDEX_DIR, INDEX_VERSION, PROXIMITY_WINDOW, _index_key, _index_targets, best_correction,
+                  bm25_idf, contains_phrase, deletes, load_rows, max_edit_distance, proximity_boost, rerank_window,
+                  split_phrases)
+
+
+# ============ CONFIGURATION ============
+DB_FILE = INDEX_DIR / "search.sqlite"
+
+_local = threading.local()
+
+# (fingerprint, source, token) -> corrected term or None
+_CORRECTIONS = {}
+
+
+def _table_name(source: str) -> str:
+    """'stack:react-native' -> 'fts_stack_react_native'"""
+    return "fts_" + re.sub(r'\W', '_', source)
+
+
+def _fingerprint() -> str:
+    """Changes whenever any source CSV (mtime/size) or the index format changes."""
+    parts = [(name,) + _index_key(filepath, search_cols)[1:]
+             for name, filepath, search_cols, _ in _index_targets() if filepath.exists()]
+    return json.dumps([INDEX_VERSION, parts])
+
+
+# ============ BUILD ============
+def build_database(path=None) -> str:
+    """Compile every domain and stack CSV into a fresh FTS5 database; returns its path."""
+    path = path or DB_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.execute("CREATE TABLE meta(key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("CREATE TABLE sources(name TEXT PRIMARY KEY, tbl TEXT, columns TEXT)")
+        conn.execute("CREATE TABLE rows(source TEXT, row_id INTEGER, data TEXT, bases TEXT, "
+                     "PRIMARY KEY(source, row_id))")
+        conn.execute("CREATE TABLE vocab(source TEXT, term TEXT, df INTEGER, PRIMARY KEY(source, term))")
+        conn.execute("CREATE TABLE deletes(source TEXT, key TEXT, term TEXT)")
+
+        for name, filepath, search_cols, _ in _index_targets():
+            if not filepath.exists():
+                continue
+            table = _table_name(name)
+            columns = [f"c{i}" for i in range(len(search_cols))]
+            conn.execute(f"CREATE VIRTUAL TABLE {table} USING fts5({', '.join(columns)})")
+            conn.execute(f"CREATE VIRTUAL TABLE {table}_instance USING fts5vocab({table}, 'instance')")
+            conn.execute("INSERT INTO sources VALUES (?, ?, ?)", (name, table, json.dumps(search_cols)))
+
+            rows = load_rows(filepath)
+            tokenized = [[" ".join(BM25.tokenize(row.get(col, ""))) for col in search_cols] for row in rows]
+            conn.executemany(
+                f"INSERT INTO {table}(rowid, {', '.join(columns)}) VALUES (?, {', '.join('?' * len(columns))})",
+                ((row_id, *cells) for row_id, cells in enumerate(tokenized))
+            )
+            conn.executemany(
+                "INSERT INTO rows VALUES (?, ?, ?, ?)",
+                ((name, row_id, json.dumps(row, ensure_ascii=False), json.dumps(_column_bases(cells)))
+                 for row_id, (row, cells) in enumerate(zip(rows, tokenized)))
+            )
+
+            doc_freqs = Counter(term for cells in tokenized for term in set(" ".join(cells).split()))
+            conn.executemany("INSERT INTO vocab VALUES (?, ?, ?)",
+                             ((name, term, df) for term, df in doc_freqs.items()))
+            conn.executemany("INSERT INTO deletes VALUES (?, ?, ?)",
+                             ((name, key, term) for term in doc_freqs
+                              for key in deletes(term, max_edit_distance(term))))
+
+        conn.execute("CREATE INDEX deletes_key ON deletes(source, key)")
+        conn.execute("CREATE INDEX vocab_term ON vocab(term)")
+        conn.execute("INSERT INTO meta VALUES ('fingerprint', ?)", (_fingerprint(),))
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+    if getattr(_local, "conn", None) is not None:
+        _local.conn.close()
+        _local.conn = None
+    return str(path)
+
+
+def _column_bases(cells):
+    """Offset of each column's first token when the row's columns are joined (core.BM25 positions)"""
+    bases, offset = [], 0
+    for cell in cells:
+        bases.append(offset)
+        offset += len(cell.split())
+    return bases
+
+
+def _connection():
+    """Per-thread read connection, rebuilding the database when it is stale."""
+    fingerprint = _fingerprint()
+    conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "fingerprint", None) == fingerprint:
+        return conn
+
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+    stored = None
+    if DB_FILE.exists():
+        try:
+            probe = sqlite3.connect(str(DB_FILE))
+            try:
+                stored = probe.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+            finally:
+                probe.close()
+        except sqlite3.DatabaseError:
+            stored = None
+
+    if stored is None or stored[0] != fingerprint:
+        build_database()
+
+    _local.conn = sqlite3.connect(str(DB_FILE))
+    _local.fingerprint = fingerprint
+    return _local.conn
+
+
+# ============ SEARCH ============
+def _correct(conn, source: str, token: str):
+    """Same rules as core.FuzzyIndex.correct, answered from the vocab/deletes tables."""
+    if conn.execute("SELECT 1 FROM vocab WHERE source = ? AND term = ?", (source, token)).fetchone():
+        return token
+
+    cache_key = (_local.fingerprint, source, token)
+    if cache_key in _CORRECTIONS:
+        return _CORRECTIONS[cache_key]
+
+    correction = None
+    # Words indexed by another source are valid, just absent here: leave them out
+    if not conn.execute("SELECT 1 FROM vocab WHERE term = ?", (token,)).fetchone():
+        keys = list(deletes(token, max_edit_distance(token)))
+        candidates = dict(conn.execute(
+            f"SELECT DISTINCT d.term, v.df FROM deletes d JOIN vocab v ON v.source = d.source AND v.term = d.term "
+            f"WHERE d.source = ? AND d.key IN ({', '.join('?' * len(keys))})",
+            (source, *keys)
+        ))
+        correction = best_correction(token, candidates)
+    _CORRECTIONS[cache_key] = correction
+    return correction
+
+
+def _terms(conn, source: str, words: list) -> list:
+    """Indexed term for each word (typo-corrected when enabled), None when it cannot match."""
+    if core.FUZZY_MATCHING:
+        return [_correct(conn, source, word) for word in words]
+    known = {term for (term,) in conn.execute(
+        f"SELECT term FROM vocab WHERE source = ? AND term IN ({', '.join('?' * len(words))})", (source, *words))}
+    return [word if word in known else None for word in words]
+
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _positions(conn, source: str, terms: set, rows: list) -> dict:
+    """row_id -> term -> sorted token offsets in the joined row, from the fts5vocab instance table."""
+    bases = {row_id: json.loads(data) for row_id, data in conn.execute(
+        f"SELECT row_id, bases FROM rows WHERE source = ? AND row_id IN ({', '.join('?' * len(rows))})",
+        (source, *rows))}
+    positions = {row_id: {term: [] for term in terms} for row_id in rows}
+    for term, doc, col, offset in conn.execute(
+            f"SELECT term, doc, col, offset FROM {_table_name(source)}_instance "
+            f"WHERE term IN ({', '.join('?' * len(terms))}) AND doc IN ({', '.join('?' * len(rows))})",
+            (*terms, *rows)):
+        positions[doc][term].append(bases[doc][int(col[1:])] + offset)
+    for row in positions.values():
+        for offsets in row.values():
+            offsets.sort()
+    return positions
+
+
+def search_source(source: str, search_cols: list, output_cols: list, query: str, max_results: int,
+                  boosts: dict = None) -> list:
+    """Top rows of one source ranked by FTS5 bm25() with per-column weights."""
+    tokens = BM25.tokenize(query)
+    if not tokens or max_results <= 0:
+        return []
+
+    conn = _connection()
+    tokens = [term for term in _terms(conn, source, tokens) if term]
+    if not tokens:
+        return []
+    phrases = []
+    for phrase in split_phrases(query):
+        words = BM25.tokenize(phrase)
+        terms = _terms(conn, source, words) if words else []
+        if None in terms:
+            return []  # A quoted word occurs in no row of this source
+        if terms:
+            phrases.append(terms)
+
+    table = _table_name(source)
+    weights = [float((boosts or {}).get(col, 1.0)) for col in search_cols]
+    match = " OR ".join(_quote(token) for token in tokens)
+    rerank = phrases or (core.PROXIMITY_WEIGHT and len(set(tokens)) > 1)
+    limit = max_results if not rerank else -1 if phrases else max(max_results, PROXIMITY_WINDOW)
+    if phrases:
+        # Rows with every phrase word; positions decide which hold the phrases
+        match = f"({match}) AND " + " AND ".join(_quote(term) for phrase in phrases for term in phrase)
+
+    ranked = [(row_id, -score) for row_id, score in conn.execute(
+        f"SELECT rowid, bm25({table}, {', '.join('?' * len(weights))}) AS score FROM {table} "
+        f"WHERE {table} MATCH ? ORDER BY score, rowid LIMIT ?",
+        (*weights, match, limit)
+    )]
+
+    if rerank and ranked:
+        terms = set(tokens)
+        positions = _positions(conn, source, terms, [row_id for row_id, _ in ranked])
+        if phrases:
+            ranked = [(row_id, score) for row_id, score in ranked
+                      if all(contains_phrase(phrase, positions[row_id]) for phrase in phrases)]
+        n_docs = conn.execute("SELECT COUNT(*) FROM rows WHERE source = ?", (source,)).fetchone()[0]
+        idf = {term: bm25_idf(n_docs, df) for term, df in conn.execute(
+            f"SELECT term, df FROM vocab WHERE source = ? AND term IN ({', '.join('?' * len(terms))})",
+            (source, *terms))}
+        ranked = rerank_window(ranked, lambda row_id: proximity_boost(tokens, positions[row_id], idf), max_results)
+
+    results = []
+    for row_id, _ in ranked[:max_results]:
+        (data,) = conn.execute("SELECT data FROM rows WHERE source = ? AND row_id = ?", (source, row_id)).fetchone()
+        row = json.loads(data)
+        results.append({col: row.get(col, "") for col in output_cols if col in row})
+    return results
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Check Scheduler - Antigravity Kit
+=================================
+
+Runs the validation scripts of checklist.py / verify_all.py on a bounded
+thread pool. Each check is its own subprocess, so threads are enough.
+
+Results come back in the order the checks were listed, whatever order
+they finish in, so the report reads the same on every run. Exclusive checks
+(e.g. Lighthouse, whose timings would be skewed by scans running next to
+it) wait for everything before them and run alone. When the caller stops
+early (a critical check failed), checks that have not started are
+cancelled and running ones are terminated.
+
+Usage:
+    with CheckScheduler(workers=4) as scheduler:
+        for task, result in scheduler.run(tasks, run_task, exclusive=is_exclusive):
+            ...
+"""
+
+import os
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+_RUNNING = set()
+_LOCK = threading.Lock()
+_STOPPED = threading.Event()
+
+
+def run_command(cmd: List[str], timeout: float, env: Optional[dict] = None) -> subprocess.CompletedProcess:
+    """subprocess.run(cmd, capture_output=True, text=True, timeout=...) that stop_running() can terminate."""
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env) as proc:
+        with _LOCK:
+            _RUNNING.add(proc)
+            if _STOPPED.is_set():
+                proc.terminate()
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        finally:
+            with _LOCK:
+                _RUNNING.discard(proc)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+def stop_running() -> None:
+    """Terminate every check started through run_command, and any started from now on."""
+    with _LOCK:
+        _STOPPED.set()
+        for proc in _RUNNING:
+            proc.terminate()
+
+
+class CheckScheduler:
+    """Bounded pool that yields check results in submission order."""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.workers = max(1, workers)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        _STOPPED.clear()
+
+    def __enter__(self) -> "CheckScheduler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cancel checks that have not started and terminate running ones."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        stop_running()
+
+    def run(self, tasks: list, run: Callable, exclusive: Optional[Callable] = None) -> Iterator[Tuple[object, dict]]:
+        """Yield (task, run(task)) in task order.
+
+        Consecutive non-exclusive tasks share the pool; an exclusive task runs
+        only after everything before it finished, and alone.
+        """
+        batch = []
+        for task in tasks:
+            if exclusive and exclusive(task):
+                yield from self._run_batch(batch, run)
+                yield from self._run_batch([task], run)
+                batch = []
+            else:
+                batch.append(task)
+        yield from self._run_batch(batch, run)
+
+    def _run_batch(self, batch: list, run: Callable) -> Iterator[Tuple[object, dict]]:
+        futures = [self.executor.submit(run, task) for task in batch]
+        for task, future in zip(batch, futures):
+            yield task, future.result()
@@ -9,6 +9,7 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --since main       # Only files changed since main
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -20,12 +21,18 @@ Priority Order:
     P6: Performance (lighthouse - requires URL)
 """
 
+import os
 import sys
+import time
+import atexit
 import subprocess
 import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from check_scheduler import DEFAULT_WORKERS, CheckScheduler, run_command
+from project_snapshot import SNAPSHOT_ENV, changed_files, persist_snapshot
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -64,6 +71,16 @@ CORE_CHECKS = [
     ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
 ]
 
+# Timing-sensitive checks never share the machine with another check
+EXCLUSIVE_CHECKS = {"Lighthouse Audit"}
+
+# Whole-project tool runs: with --since they run only if a file with one of these suffixes changed
+# (the file scanners are scoped through the snapshot instead)
+SOURCE_TRIGGERED_CHECKS = {
+    "Lint Check": {'.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.py', '.json', '.toml', '.cfg', '.ini'},
+    "Test Runner": {'.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.py', '.json', '.toml'},
+}
+
 PERFORMANCE_CHECKS = [
     ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
     ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
@@ -73,18 +90,20 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               env: Optional[dict] = None) -> dict:
     """
-    Run a validation script and capture results
+    Run a validation script and capture results (quietly - checks run in
+    parallel, print_result reports them in order)
 
     Returns:
-        dict with keys: name, passed, output, skipped
+        dict with keys: name, passed, output, skipped, duration
     """
     if not check_script_exists(script_path):
-        print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "output": "", "skipped": True}
+        return {"name": name, "passed": True, "output": "", "skipped": True, "duration": 0,
+                "reason": "Script not found"}
 
-    print_step(f"Running: {name}")
+    start_time = time.perf_counter()
 
     # Build command
     cmd = ["python", str(script_path), project_path]
@@ -93,42 +112,81 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
 
     # Run script
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-
-        passed = result.returncode == 0
-
-        if passed:
-            print_success(f"{name}: PASSED")
-        else:
-            print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
+        result = run_command(cmd, timeout=300, env=env)  # 5 minute timeout
 
         return {
             "name": name,
-            "passed": passed,
+            "passed": result.returncode == 0,
             "output": result.stdout,
             "error": result.stderr,
-            "skipped": False
+            "skipped": False,
+            "duration": time.perf_counter() - start_time
         }
 
     except subprocess.TimeoutExpired:
-        print_error(f"{name}: TIMEOUT (>5 minutes)")
-        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
+        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False,
+                "duration": time.perf_counter() - start_time, "timed_out": True}
 
     except Exception as e:
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
+        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False,
+                "duration": time.perf_counter() - start_time, "crashed": True}
+
+def print_result(r: dict):
+    """Print one check's outcome"""
+    name = r["name"]
+    if r.get("skipped"):
+        print_warning(f"{name}: {r['reason']}, skipping")
+        return
+
+    print_step(f"Running: {name}")
+    if r.get("timed_out"):
+        print_error(f"{name}: TIMEOUT (>5 minutes)")
+    elif r.get("crashed"):
+        print_error(f"{name}: ERROR - {r['error']}")
+    elif r["passed"]:
+        print_success(f"{name}: PASSED ({r['duration']:.1f}s)")
+    else:
+        print_error(f"{name}: FAILED ({r['duration']:.1f}s)")
+        if r["error"]:
+            print(f"  Error: {r['error'][:200]}")
 
-def print_summary(results: List[dict]):
+def run_checks(checks: List[Tuple[str, str, bool]], project_path: Path, workers: int, results: List[dict],
+               url: Optional[str] = None, env: Optional[dict] = None, gate: bool = False,
+               changed: Optional[List[str]] = None) -> bool:
+    """
+    Run checks concurrently, printing and collecting results in list order.
+
+    With gate=True a failed required check stops the run (pending checks are
+    cancelled, running ones terminated) and False is returned. With changed
+    (a --since change set), source-triggered checks the changes do not
+    concern are skipped.
+    """
+    def run_task(check):
+        name, script_path, _ = check
+        suffixes = SOURCE_TRIGGERED_CHECKS.get(name)
+        if changed is not None and suffixes and not any(Path(f).suffix in suffixes for f in changed):
+            return {"name": name, "passed": True, "output": "", "skipped": True, "duration": 0,
+                    "reason": "No relevant files changed"}
+        return run_script(name, project_path / script_path, str(project_path), url, env)
+
+    with CheckScheduler(workers) as scheduler:
+        for (name, _, required), result in scheduler.run(
+                checks, run_task, exclusive=lambda check: check[0] in EXCLUSIVE_CHECKS):
+            print_result(result)
+            results.append(result)
+
+            # If required check fails, stop
+            if gate and required and not result["passed"] and not result.get("skipped"):
+                print_error(f"CRITICAL: {name} failed. Stopping checklist.")
+                return False
+    return True
+
+def print_summary(results: List[dict], checks_duration: float):
     """Print final summary report"""
     print_header("📊 CHECKLIST SUMMARY")
 
+    check_time = sum(r.get("duration", 0) for r in results)
+
     passed_count = sum(1 for r in results if r["passed"] and not r.get("skipped"))
     failed_count = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
     skipped_count = sum(1 for r in results if r.get("skipped"))
@@ -137,6 +195,8 @@ def print_summary(results: List[dict]):
     print(f"{Colors.GREEN}✅ Passed: {passed_count}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed_count}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped_count}{Colors.ENDC}")
+    print(f"Wall Time: {checks_duration:.1f}s (checks took {check_time:.1f}s, "
+          f"saved {max(0.0, check_time - checks_duration):.1f}s running in parallel)")
     print()
 
     # Detailed results
@@ -148,7 +208,8 @@ def print_summary(results: List[dict]):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
 
-        print(f"{status} {r['name']}")
+        duration_str = f"({r['duration']:.1f}s)" if not r.get("skipped") else ""
+        print(f"{status} {r['name']} {duration_str}")
 
     print()
 
@@ -167,11 +228,17 @@ def main():
 Examples:
   python scripts/checklist.py .                      # Core checks only
   python scripts/checklist.py . --url http://localhost:3000  # Include performance
+  python scripts/checklist.py . --workers 1          # One check at a time
+  python scripts/checklist.py . --since main         # Files changed on this branch
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Checks to run at once (default: {DEFAULT_WORKERS}, 1 = sequential)")
+    parser.add_argument("--since", metavar="REF",
+                        help="Only audit files changed since REF's merge-base (plus untracked files)")
 
     args = parser.parse_args()
 
@@ -187,29 +254,35 @@ Examples:
 
     results = []
 
+    # Scope the run to a change set: the snapshot lists only those files
+    changed = None
+    if args.since:
+        try:
+            changed = changed_files(project_path, args.since)
+        except ValueError as e:
+            print_error(f"Cannot diff against {args.since}: {e}")
+            sys.exit(1)
+        print(f"Scope: {len(changed)} file(s) changed since {args.since}")
+
+    # Walk and read the project once; every check below loads this snapshot
+    snapshot_file = persist_snapshot(project_path, changed)
+    atexit.register(os.remove, snapshot_file)
+    env = {**os.environ, SNAPSHOT_ENV: str(snapshot_file)}
+
     # Run core checks
     print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
-        script = project_path / script_path
-        result = run_script(name, script, str(project_path))
-        results.append(result)
-
-        # If required check fails, stop
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
-            sys.exit(1)
+    checks_start = time.perf_counter()
+    if not run_checks(CORE_CHECKS, project_path, args.workers, results, env=env, gate=True, changed=changed):
+        print_summary(results, time.perf_counter() - checks_start)
+        sys.exit(1)
 
     # Run performance checks if URL provided
     if args.url and not args.skip_performance:
         print_header("⚡ PERFORMANCE CHECKS")
-        for name, script_path, required in PERFORMANCE_CHECKS:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            results.append(result)
+        run_checks(PERFORMANCE_CHECKS, project_path, args.workers, results, args.url, env)
 
     # Print summary
-    all_passed = print_summary(results)
+    all_passed = print_summary(results, time.perf_counter() - checks_start)
 
     sys.exit(0 if all_passed else 1)
 
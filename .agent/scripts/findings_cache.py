@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Findings Cache - Antigravity Kit
+================================
+
+Per-file audit findings kept between runs in .agent/cache, so a scanner
+only re-evaluates its rules on files that changed since the last run.
+
+Each entry is keyed by the file's content hash. The whole cache is keyed
+by a fingerprint of the scanner's rule set (its script source plus
+CACHE_VERSION), so editing a rule invalidates every finding it produced.
+Entries for files that are no longer scanned are dropped when the cache
+is saved (unless the run was scoped to a change set, which sees only a
+few files).
+
+Set $AGENT_FINDINGS_CACHE=off to evaluate every file from scratch.
+
+Usage (in a skill script):
+    cache = FindingsCache(project_path, "ux_audit", __file__)
+    for path in files:
+        findings = cache.findings(path, lambda: evaluate_rules(path))
+    cache.save()
+"""
+
+import os
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from project_snapshot import get_snapshot, read_bytes
+
+# ============================================================================
+#  CONFIGURATION
+# ============================================================================
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / "cache"
+CACHE_VERSION = 1
+CACHE_ENV = "AGENT_FINDINGS_CACHE"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def ruleset_fingerprint(rules_file) -> str:
+    """Cache format version plus the source of the script that holds the rules"""
+    with open(rules_file, "rb") as f:
+        return f"{CACHE_VERSION}:{content_hash(f.read())}"
+
+
+# ============================================================================
+#  CACHE
+# ============================================================================
+
+class FindingsCache:
+    """Findings per file of one project for one scanner, replayed while the file content is unchanged."""
+
+    def __init__(self, project_path, scanner: str, rules_file):
+        self.project_path = str(project_path)
+        self.root = os.path.realpath(project_path)
+        self.enabled = os.environ.get(CACHE_ENV, "").lower() not in ("0", "off", "false", "no")
+        self.path = CACHE_DIR / f"{scanner}-{content_hash(self.root.encode('utf-8'))[:12]}.pickle"
+        self.fingerprint = ruleset_fingerprint(rules_file)
+        self.scoped = get_snapshot(project_path).scoped
+        self.entries: Dict[str, tuple] = self._load() if self.enabled else {}  # rel path -> (hash, findings)
+        self.seen: Dict[str, tuple] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, tuple]:
+        try:
+            with open(self.path, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("fingerprint") == self.fingerprint and payload.get("root") == self.root:
+                return payload["entries"]
+        except Exception:
+            pass  # Missing, corrupt or from an older format: start empty
+        return {}
+
+    def findings(self, path, evaluate: Callable[[], Any]) -> Any:
+        """evaluate()'s result for path, replayed from the cache when the content hash matches"""
+        if not self.enabled:
+            return evaluate()
+        try:
+            digest = content_hash(read_bytes(path))
+        except OSError:
+            return evaluate()  # Unreadable: let the scanner report it as it always has
+
+        if self.cached_digest(path) == digest:
+            return self.record(path, digest)
+        return self.record(path, digest, evaluate())
+
+    def cached_digest(self, path) -> Optional[str]:
+        """Content hash the cached findings of path were computed for (None when there are none)"""
+        entry = self.entries.get(os.path.relpath(path, self.project_path)) if self.enabled else None
+        return entry[0] if entry is not None else None
+
+    def record(self, path, digest: str, findings: Any = None) -> Any:
+        """Findings of path at this content hash: the cached ones when findings is None, else findings.
+
+        For scanners that read and evaluate files elsewhere (security_scan.py
+        --jobs workers) and only report back what they found.
+        """
+        rel = os.path.relpath(path, self.project_path)
+        entry = self.entries.get(rel)
+        if findings is None and entry is not None and entry[0] == digest:
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry = (digest, findings)
+        self.seen[rel] = entry
+        return entry[1]
+
+    def save(self) -> None:
+        """Persist the findings of this run (only when something changed)"""
+        if not self.enabled or (not self.misses and (self.scoped or self.seen.keys() == self.entries.keys())):
+            return
+        entries = {**self.entries, **self.seen} if self.scoped else self.seen
+        # Write atomically; a read-only checkout simply runs uncached
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump({"fingerprint": self.fingerprint, "root": self.root, "entries": entries},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.path)
+        except OSError:
+            pass
+        self.entries = entries
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Project Snapshot - Antigravity Kit
+==================================
+
+One pruned walk of a project tree, shared by the skill-level audit scripts.
+Every file is listed once, read at most once, and kept in memory, so
+security_scan, ux_audit, seo_checker and the rest stop re-walking the tree
+(and descending into node_modules) for each check.
+
+The walk only prunes node_modules and .git. Build output and virtualenvs
+are listed, because some scanners look there; each scanner still applies
+its own skip set through files(skip_dirs) or its own path filter.
+
+A snapshot can be saved to disk. verify_all.py and checklist.py save one
+before running the checks and hand its path to every script through
+$AGENT_PROJECT_SNAPSHOT, so each later scanner loads one file instead of
+walking and reading the whole project again.
+
+A scoped snapshot (checklist.py --since REF) lists only the files git
+reports as changed or untracked, so every scanner audits just those;
+project-level checks look at snapshot.scoped to decide whether to run.
+
+Usage:
+    python .agent/scripts/project_snapshot.py .                  # Walk + read, print stats
+    python .agent/scripts/project_snapshot.py . --save snap.bin  # Persist for later scanners
+    python .agent/scripts/project_snapshot.py . --since main     # Only files changed since main
+
+In a skill script:
+    for path in get_snapshot(project_path).glob("**/*.tsx"):
+        content = read_text(path, errors='ignore')
+"""
+
+import os
+import re
+import sys
+import json
+import stat
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# ============================================================================
+#  CONFIGURATION
+# ============================================================================
+
+SNAPSHOT_ENV = "AGENT_PROJECT_SNAPSHOT"
+SNAPSHOT_VERSION = 2
+
+# Directories no audit script looks into: the walk never descends into them
+SKIP_DIRS = {'node_modules', '.git'}
+
+# Listed, but only read on demand: most scanners skip them
+PRELOAD_SKIP_DIRS = {'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
+
+# Every suffix some audit script reads; preload() reads these up front
+TEXT_EXTENSIONS = {
+    '.js', '.ts', '.jsx', '.tsx', '.mjs', '.py', '.go', '.java', '.rb', '.php',
+    '.html', '.htm', '.vue', '.svelte', '.css', '.dart',
+    '.json', '.yaml', '.yml', '.toml', '.po',
+}
+PRELOAD_MAX_BYTES = 1024 * 1024  # Larger files are still read, just on demand
+
+
+# ============================================================================
+#  SNAPSHOT
+# ============================================================================
+
+def _glob_regex(pattern: str) -> "re.Pattern":
+    """Translate a Path.glob pattern ('**/routes/*.ts') to a regex over relative posix paths."""
+    def segment(seg: str) -> str:
+        return "".join("[^/]*" if c == "*" else "[^/]" if c == "?" else re.escape(c) for c in seg)
+
+    segs = pattern.split("/")
+    regex = "".join("(?:[^/]+/)*" if seg == "**" else segment(seg) + "/" for seg in segs[:-1])
+    return re.compile(regex + segment(segs[-1]) + r"\Z")
+
+
+def decode_text(data: bytes, errors: str = "strict") -> str:
+    """UTF-8 text with universal newlines, like open(path, 'r', encoding='utf-8', errors=errors).read()."""
+    text = data.decode("utf-8", errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class ProjectSnapshot:
+    """File list (walk order) plus a content cache for one project root."""
+
+    def __init__(self, root, entries: Dict[str, tuple], contents: Optional[Dict[str, bytes]] = None,
+                 verify: bool = False, scoped: bool = False):
+        self.root = Path(root)
+        self.entries = entries  # relative posix path -> (size, mtime_ns), in walk order
+        self.contents = contents if contents is not None else {}
+        self.verify = verify  # Loaded from disk: re-check size/mtime before trusting cached bytes
+        self.scoped = scoped  # Lists only the files of a change set, not the whole tree
+
+    @classmethod
+    def build(cls, root, skip_dirs=SKIP_DIRS) -> "ProjectSnapshot":
+        """Walk root once with os.scandir, never descending into skip_dirs or symlinked dirs."""
+        entries = {}
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                with os.scandir(os.path.join(root, rel_dir)) as it:
+                    items = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in items:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            subdirs.append(rel)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        entries[rel] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+            stack.extend(reversed(subdirs))  # Depth-first, files of a directory before its subdirectories
+        return cls(root, entries)
+
+    @classmethod
+    def from_files(cls, root, rels, skip_dirs=SKIP_DIRS) -> "ProjectSnapshot":
+        """Scoped snapshot of just these relative paths (missing ones dropped), in walk order, without a walk."""
+        def walk_order(rel):
+            *dirs, name = rel.split("/")
+            return [(1, d) for d in dirs] + [(0, name)]  # A directory's files before its subdirectories
+
+        entries = {}
+        for rel in sorted(set(rels), key=walk_order):
+            if not skip_dirs.isdisjoint(rel.split("/")[:-1]):
+                continue
+            try:
+                st = os.stat(os.path.join(root, rel))
+            except OSError:
+                continue  # Deleted in the change set
+            if stat.S_ISREG(st.st_mode):
+                entries[rel] = (st.st_size, st.st_mtime_ns)
+        return cls(root, entries, scoped=True)
+
+    # -------------------------------------------------------------- listing
+
+    def files(self, skip_dirs=()) -> List[Path]:
+        """Every file in walk order, optionally skipping more directory names."""
+        if not skip_dirs:
+            return [self.root / rel for rel in self.entries]
+        skip_dirs = set(skip_dirs)
+        return [self.root / rel for rel in self.entries
+                if skip_dirs.isdisjoint(rel.split("/")[:-1])]
+
+    def glob(self, pattern: str) -> List[Path]:
+        """Files matching a Path.glob pattern ('*', '?' and '**'; no [...] sets), in walk order."""
+        match = _glob_regex(pattern).match
+        return [self.root / rel for rel in self.entries if match(rel)]
+
+    # -------------------------------------------------------------- reading
+
+    def contains(self, path) -> bool:
+        try:
+            return Path(path).relative_to(self.root).as_posix() in self.entries
+        except ValueError:
+            return False
+
+    def _rel(self, path) -> str:
+        path = Path(path)
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def read_bytes(self, path) -> bytes:
+        """File content, read from disk at most once per snapshot."""
+        return self._read(self._rel(path))
+
+    def _read(self, rel: str) -> bytes:
+        data = self.contents.get(rel)
+        if data is not None and self.verify:
+            st = os.stat(self.root / rel)
+            if (st.st_size, st.st_mtime_ns) != self.entries.get(rel):
+                data = None  # Edited since the snapshot was saved
+        if data is None:
+            with open(self.root / rel, "rb") as f:
+                st = os.fstat(f.fileno())
+                data = f.read()
+            self.entries[rel] = (st.st_size, st.st_mtime_ns)
+            self.contents[rel] = data
+        return data
+
+    def read_text(self, path, errors: str = "strict") -> str:
+        """UTF-8 text with universal newlines, like open(path, 'r', encoding='utf-8', errors=errors)."""
+        return decode_text(self.read_bytes(path), errors)
+
+    def preload(self, extensions=TEXT_EXTENSIONS, max_bytes: int = PRELOAD_MAX_BYTES,
+                skip_dirs=PRELOAD_SKIP_DIRS) -> int:
+        """Read every file an audit script is likely to ask for; returns the number of files read."""
+        count = 0
+        for rel, (size, _) in self.entries.items():
+            if size <= max_bytes and rel not in self.contents and os.path.splitext(rel)[1].lower() in extensions \
+                    and skip_dirs.isdisjoint(rel.split("/")[:-1]):
+                try:
+                    self._read(rel)
+                    count += 1
+                except OSError:
+                    continue
+        return count
+
+    # -------------------------------------------------------------- persistence
+
+    def save(self, path) -> Path:
+        """Write a JSON header line (root, entries, content offsets) followed by the raw contents."""
+        offsets = {}
+        blobs = []
+        position = 0
+        for rel, data in self.contents.items():
+            offsets[rel] = (position, len(data))
+            blobs.append(data)
+            position += len(data)
+        header = {
+            "version": SNAPSHOT_VERSION,
+            "root": os.path.realpath(self.root),
+            "scoped": self.scoped,
+            "entries": [[rel, size, mtime, *offsets.get(rel, ())] for rel, (size, mtime) in self.entries.items()],
+        }
+        path = Path(path)
+        with open(path, "wb") as f:
+            f.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+            f.writelines(blobs)
+        return path
+
+    @classmethod
+    def load(cls, path, root) -> Optional["ProjectSnapshot"]:
+        """Read a saved snapshot; None when it is missing, unreadable or for another root."""
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            newline = raw.index(b"\n")
+            header = json.loads(raw[:newline])
+        except (OSError, ValueError):
+            return None
+        if header.get("version") != SNAPSHOT_VERSION or header.get("root") != os.path.realpath(root):
+            return None
+
+        body = memoryview(raw)[newline + 1:]
+        entries, contents = {}, {}
+        for rel, size, mtime, *blob in header["entries"]:
+            entries[rel] = (size, mtime)
+            if blob:
+                contents[rel] = bytes(body[blob[0]:blob[0] + blob[1]])
+        return cls(root, entries, contents, verify=True, scoped=header.get("scoped", False))
+
+
+# ============================================================================
+#  SHARED ACCESS
+# ============================================================================
+
+_TREES: Dict[str, ProjectSnapshot] = {}      # realpath -> snapshot
+_SNAPSHOTS: Dict[str, ProjectSnapshot] = {}  # project path as the caller spelled it -> snapshot
+
+
+def get_snapshot(project_path, context: Optional[dict] = None) -> ProjectSnapshot:
+    """Snapshot for project_path: this process's copy, then $AGENT_PROJECT_SNAPSHOT, then a fresh walk.
+
+    context is the dict verify_all.py shares with in-process checks; its
+    "snapshot" is adopted when it covers project_path.
+    """
+    snapshot = _SNAPSHOTS.get(str(project_path))
+    if snapshot is None:
+        key = os.path.realpath(project_path)
+        tree = _TREES.get(key)
+        shared = (context or {}).get("snapshot")
+        if tree is None and shared is not None and os.path.realpath(shared.root) == key:
+            tree = _TREES[key] = shared
+        if tree is None:
+            saved = os.environ.get(SNAPSHOT_ENV)
+            tree = ProjectSnapshot.load(saved, project_path) if saved else None
+            tree = _TREES[key] = tree or ProjectSnapshot.build(project_path)
+        if tree.root != Path(project_path):
+            # Same tree spelled differently ('.' vs absolute): share the cache, keep the caller's paths
+            tree = ProjectSnapshot(project_path, tree.entries, tree.contents, tree.verify, tree.scoped)
+        snapshot = _SNAPSHOTS[str(project_path)] = tree
+    return snapshot
+
+
+def read_bytes(path) -> bytes:
+    """Read path through the snapshot that listed it, or straight from disk."""
+    for snapshot in _SNAPSHOTS.values():
+        if snapshot.contains(path):
+            return snapshot.read_bytes(path)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read_text(path, errors: str = "strict") -> str:
+    """Read path through the snapshot that listed it, or straight from disk."""
+    for snapshot in _SNAPSHOTS.values():
+        if snapshot.contains(path):
+            return snapshot.read_text(path, errors)
+    with open(path, "r", encoding="utf-8", errors=errors) as f:
+        return f.read()
+
+
+def changed_files(project_path, ref: str) -> List[str]:
+    """Files under project_path changed since ref's merge-base with HEAD, plus untracked ones.
+
+    Paths are relative to project_path and include deletions. Uses git
+    plumbing only; raises ValueError when ref cannot be resolved.
+    """
+    import subprocess  # Only orchestrators scope a run; keep the scanners' import cheap
+
+    def git(*args) -> str:
+        proc = subprocess.run(["git", "-C", str(project_path), *args], capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise ValueError(proc.stderr.strip() or f"git {args[0]} failed")
+        return proc.stdout
+
+    base = git("merge-base", ref, "HEAD").strip()
+    git("update-index", "-q", "--refresh")  # Else files merely touched since the last git command look modified
+    changed = git("diff-index", "--name-only", "-z", "--relative", base).split("\0")
+    untracked = git("ls-files", "--others", "--exclude-standard", "-z").split("\0")
+    return sorted(set(filter(None, changed + untracked)))
+
+
+def persist_snapshot(project_path, files: Optional[List[str]] = None) -> Path:
+    """Walk and read project_path once, save it to a temp file and return that file's path.
+
+    With files (paths relative to project_path), the snapshot is scoped to
+    them instead of walking the tree. Orchestrators export the path as
+    $AGENT_PROJECT_SNAPSHOT for the checks they run and delete the file
+    when they are done. The snapshot also stays in this process, for
+    get_snapshot() calls from checks run in-process.
+    """
+    import tempfile  # Only orchestrators persist; keep the scanners' import cheap
+
+    snapshot = ProjectSnapshot.build(project_path) if files is None else ProjectSnapshot.from_files(project_path, files)
+    _TREES[os.path.realpath(project_path)] = snapshot
+    snapshot.preload()
+    fd, path = tempfile.mkstemp(prefix="agent-snapshot-", suffix=".bin")
+    os.close(fd)
+    return snapshot.save(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Walk a project once and optionally persist the snapshot")
+    parser.add_argument("project", nargs="?", default=".", help="Project path to snapshot")
+    parser.add_argument("--save", help="Write the snapshot here (pass it to scripts via $%s)" % SNAPSHOT_ENV)
+    parser.add_argument("--since", metavar="REF", help="Only list files changed since REF (plus untracked files)")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.project):
+        print(f"Directory not found: {args.project}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    if args.since:
+        try:
+            snapshot = ProjectSnapshot.from_files(args.project, changed_files(args.project, args.since))
+        except ValueError as e:
+            print(f"Cannot diff against {args.since}: {e}")
+            sys.exit(1)
+    else:
+        snapshot = ProjectSnapshot.build(args.project)
+    walked = time.perf_counter()
+    count = snapshot.preload()
+    read = time.perf_counter()
+
+    print(f"Files: {len(snapshot.entries)} ({(walked - start) * 1000:.0f} ms walk)")
+    print(f"Preloaded: {count} files, {sum(map(len, snapshot.contents.values())) / 1024:.0f} KiB "
+          f"({(read - walked) * 1000:.0f} ms)")
+    if args.save:
+        snapshot.save(args.save)
+        print(f"Saved: {args.save} ({(time.perf_counter() - read) * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,15 +20,26 @@ Includes ALL checks:
     ✅ Playwright E2E
     ✅ Bundle Analysis (if applicable)
     ✅ Mobile Audit (if applicable)
+
+The file scanners listed in IN_PROCESS_CHECKS are imported and their
+run(project_path, url, context) is called in this process, sharing one project
+snapshot; every other check runs as a subprocess. --isolated runs them all as
+subprocesses.
 """
 
+import os
 import sys
+import atexit
+import importlib.util
 import subprocess
 import argparse
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from check_scheduler import DEFAULT_WORKERS, CheckScheduler, run_command
+from project_snapshot import SNAPSHOT_ENV, get_snapshot, persist_snapshot
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -147,13 +158,32 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+# Timing-sensitive checks never share the machine with another check
+EXCLUSIVE_CHECKS = {"Lighthouse Audit"}
+
+# File scanners that define run(project_path, url, context) -> dict, which are
+# imported and called instead of starting a subprocess. They are cheap enough
+# that interpreter start-up is a real share of their cost. In-process checks
+# share the GIL and --stop-on-fail cannot kill them; --isolated trades the
+# start-up cost back for both.
+IN_PROCESS_CHECKS = {
+    ".agent/skills/vulnerability-scanner/scripts/security_scan.py",
+    ".agent/skills/lint-and-validate/scripts/type_coverage.py",
+    ".agent/skills/database-design/scripts/schema_validator.py",
+    ".agent/skills/frontend-design/scripts/ux_audit.py",
+    ".agent/skills/frontend-design/scripts/accessibility_checker.py",
+    ".agent/skills/seo-fundamentals/scripts/seo_checker.py",
+    ".agent/skills/geo-fundamentals/scripts/geo_checker.py",
+    ".agent/skills/mobile-design/scripts/mobile_audit.py",
+    ".agent/skills/i18n-localization/scripts/i18n_checker.py",
+}
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               env: Optional[dict] = None) -> dict:
+    """Run validation script (quietly - checks run in parallel, print_result reports them in order)"""
     if not script_path.exists():
-        print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
 
-    print_step(f"Running: {name}")
     start_time = datetime.now()
 
     # Build command
@@ -163,26 +193,13 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
 
     # Run
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
+        result = run_command(cmd, timeout=600, env=env)  # 10 minute timeout for slow checks
 
         duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
-
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
 
         return {
             "name": name,
-            "passed": passed,
+            "passed": result.returncode == 0,
             "output": result.stdout,
             "error": result.stderr,
             "skipped": False,
@@ -191,15 +208,68 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
 
     except subprocess.TimeoutExpired:
         duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
+        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout",
+                "timed_out": True}
 
     except Exception as e:
         duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
+        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e),
+                "crashed": True}
+
+def load_check(script_path: Path):
+    """Import an IN_PROCESS_CHECKS script and return its run(), or None to run it as a subprocess"""
+    try:
+        spec = importlib.util.spec_from_file_location(f"check_{script_path.stem}", script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.run
+    except Exception:
+        return None  # Let the subprocess run report whatever is wrong with it
+
+def load_in_process_checks(project_path: Path, scripts) -> dict:
+    """run() of every IN_PROCESS_CHECKS script among scripts (None where it fails to import)"""
+    return {script: load_check(project_path / script) for script in scripts
+            if script in IN_PROCESS_CHECKS and (project_path / script).exists()}
+
+def run_in_process(name: str, check, project_path: str, url: Optional[str], context: dict) -> dict:
+    """Call a check's run() in this process - no interpreter start-up, and the snapshot is already in memory"""
+    start_time = datetime.now()
+    try:
+        result = check(project_path, url, context)
+    except Exception as e:
+        duration = (datetime.now() - start_time).total_seconds()
+        return {"name": name, "passed": False, "skipped": False, "duration": duration,
+                "error": f"{type(e).__name__}: {e}", "crashed": True}
+
+    return {
+        "name": name,
+        "passed": result["passed"],
+        "output": result["output"],
+        "error": "",
+        "skipped": False,
+        "duration": (datetime.now() - start_time).total_seconds()
+    }
+
+def print_result(r: dict):
+    """Print one check's outcome"""
+    name, duration = r["name"], r["duration"]
+    if r.get("skipped"):
+        print_warning(f"{name}: Script not found, skipping")
+        return
 
-def print_final_report(results: List[dict], start_time: datetime):
+    print_step(f"Running: {name}")
+    if r.get("timed_out"):
+        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
+    elif r.get("crashed"):
+        print_error(f"{name}: ERROR - {r['error']}")
+    elif r["passed"]:
+        print_success(f"{name}: PASSED ({duration:.1f}s)")
+    else:
+        print_error(f"{name}: FAILED ({duration:.1f}s)")
+        if r["error"]:
+            print(f"  {r['error'][:300]}")
+
+def print_final_report(results: List[dict], start_time: datetime, checks_duration: float):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
 
@@ -211,7 +281,10 @@ def print_final_report(results: List[dict], start_time: datetime):
     failed = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
     skipped = sum(1 for r in results if r.get("skipped"))
 
+    check_time = sum(r.get("duration", 0) for r in results)
+
     print(f"Total Duration: {total_duration:.1f}s")
+    print(f"Check Time: {check_time:.1f}s (saved {max(0.0, check_time - checks_duration):.1f}s running in parallel)")
     print(f"Total Checks: {total}")
     print(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
@@ -268,12 +341,18 @@ def main():
 Examples:
   python scripts/verify_all.py . --url http://localhost:3000
   python scripts/verify_all.py . --url https://staging.example.com --no-e2e
+  python scripts/verify_all.py . --url http://localhost:3000 --workers 1  # One check at a time
+  python scripts/verify_all.py . --url http://localhost:3000 --isolated   # Every check in its own subprocess
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Checks to run at once (default: {DEFAULT_WORKERS}, 1 = sequential)")
+    parser.add_argument("--isolated", action="store_true",
+                        help="Run the file scanners as subprocesses too (no shared GIL; --stop-on-fail can kill them)")
 
     args = parser.parse_args()
 
@@ -291,7 +370,14 @@ Examples:
     start_time = datetime.now()
     results = []
 
-    # Run all verification categories
+    # Walk and read the project once; every check below loads this snapshot
+    snapshot_file = persist_snapshot(project_path)
+    atexit.register(os.remove, snapshot_file)
+    env = {**os.environ, SNAPSHOT_ENV: str(snapshot_file)}
+    print(f"Snapshot: {snapshot_file.stat().st_size / 1024:.0f} KiB ({(datetime.now() - start_time).total_seconds():.1f}s)")
+
+    # Collect checks in suite order; the scheduler runs them concurrently but reports in this order
+    tasks = []
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
         requires_url = suite.get("requires_url", False)
@@ -304,22 +390,45 @@ Examples:
         if args.no_e2e and category == "E2E Testing":
             continue
 
-        print_header(f"📋 {category.upper()}")
-
         for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            tasks.append((category, name, script_path, required))
+
+    # No start-up cost, but in-process scanners share the GIL and cannot be killed
+    context = {"snapshot": get_snapshot(project_path)}
+    checks = {}
+    if not args.isolated:
+        checks = load_in_process_checks(project_path, [script for _, _, script, _ in tasks])
+        print(f"In-process checks: {sum(1 for check in checks.values() if check)} of {len(tasks)}")
+
+    def run_task(task):
+        _, name, script, _ = task
+        check = checks.get(script)
+        if check:
+            return run_in_process(name, check, str(project_path), args.url, context)
+        return run_script(name, project_path / script, str(project_path), args.url, env)
+
+    checks_start = datetime.now()
+    current_category = None
+    with CheckScheduler(args.workers) as scheduler:
+        for (category, name, script, required), result in scheduler.run(
+                tasks, run_task, exclusive=lambda task: task[1] in EXCLUSIVE_CHECKS):
+            if category != current_category:
+                current_category = category
+                print_header(f"📋 {category.upper()}")
+            print_result(result)
             result["category"] = category
             results.append(result)
 
             # Stop on critical failure if flag set
             if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
                 print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
+                scheduler.close()
+                print_final_report(results, start_time, (datetime.now() - checks_start).total_seconds())
                 sys.exit(1)
+    checks_duration = (datetime.now() - checks_start).total_seconds()
 
     # Print final report
-    all_passed = print_final_report(results, start_time)
+    all_passed = print_final_report(results, start_time, checks_duration)
 
     sys.exit(0 if all_passed else 1)
 
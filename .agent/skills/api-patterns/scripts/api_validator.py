@@ -7,13 +7,11 @@ import sys
 import json
 import re
 from pathlib import Path
+from typing import Optional
 
-# Fix Windows console encoding for Unicode output
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass  # Python < 3.7
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text
 
 def find_api_files(project_path: Path) -> list:
     """Find API-related files."""
@@ -27,9 +25,10 @@ def find_api_files(project_path: Path) -> list:
         "**/openapi.json", "**/openapi.yaml"
     ]
 
+    snapshot = get_snapshot(project_path)
     files = []
     for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+        files.extend(snapshot.glob(pattern))
 
     # Exclude node_modules, etc.
     return [f for f in files if not any(x in str(f) for x in ['node_modules', '.git', 'dist', 'build', '__pycache__'])]
@@ -40,7 +39,7 @@ def check_openapi_spec(file_path: Path) -> dict:
     passed = []
 
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = read_text(file_path)
 
         if file_path.suffix == '.json':
             spec = json.loads(content)
@@ -97,7 +96,7 @@ def check_api_code(file_path: Path) -> dict:
     passed = []
 
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = read_text(file_path)
 
         # Check for error handling
         error_patterns = [
@@ -159,20 +158,22 @@ def check_api_code(file_path: Path) -> dict:
 
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'code'}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the report main() prints, without printing or exiting."""
+    project_path = Path(project_path)
+    get_snapshot(project_path, context)
+    lines = []
 
-    print("\n" + "=" * 60)
-    print("  API VALIDATOR - Endpoint Best Practices Check")
-    print("=" * 60 + "\n")
+    lines.append("\n" + "=" * 60)
+    lines.append("  API VALIDATOR - Endpoint Best Practices Check")
+    lines.append("=" * 60 + "\n")
 
     api_files = find_api_files(project_path)
 
     if not api_files:
-        print("[!] No API files found.")
-        print("   Looking for: routes/, controllers/, api/, openapi.json/yaml")
-        sys.exit(0)
+        lines.append("[!] No API files found.")
+        lines.append("   Looking for: routes/, controllers/, api/, openapi.json/yaml")
+        return {"passed": True, "output": "\n".join(lines)}
 
     results = []
     for file_path in api_files[:15]:  # Limit
@@ -187,25 +188,37 @@ def main():
     total_passed = 0
 
     for result in results:
-        print(f"\n[FILE] {result['file']} [{result['type']}]")
+        lines.append(f"\n[FILE] {result['file']} [{result['type']}]")
         for item in result['passed']:
-            print(f"   {item}")
+            lines.append(f"   {item}")
             total_passed += 1
         for item in result['issues']:
-            print(f"   {item}")
+            lines.append(f"   {item}")
             if item.startswith("[X]"):
                 total_issues += 1
 
-    print("\n" + "=" * 60)
-    print(f"[RESULTS] {total_passed} passed, {total_issues} critical issues")
-    print("=" * 60)
+    lines.append("\n" + "=" * 60)
+    lines.append(f"[RESULTS] {total_passed} passed, {total_issues} critical issues")
+    lines.append("=" * 60)
 
     if total_issues == 0:
-        print("[OK] API validation passed")
-        sys.exit(0)
+        lines.append("[OK] API validation passed")
+        return {"passed": True, "output": "\n".join(lines)}
     else:
-        print("[X] Fix critical issues before deployment")
-        sys.exit(1)
+        lines.append("[X] Fix critical issues before deployment")
+        return {"passed": False, "output": "\n".join(lines)}
+
+def main():
+    # Fix Windows console encoding for Unicode output
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass  # Python < 3.7
+
+    result = run(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(result["output"])
+    sys.exit(0 if result["passed"] else 1)
 
 if __name__ == "__main__":
     main()
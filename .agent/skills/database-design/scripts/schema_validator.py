@@ -17,26 +17,26 @@ import sys
 import json
 import re
 from pathlib import Path
+from typing import Optional
 from datetime import datetime
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-except:
-    pass
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text
 
 
 def find_schema_files(project_path: Path) -> list:
     """Find database schema files."""
+    snapshot = get_snapshot(project_path)
     schemas = []
 
     # Prisma schema
-    prisma_files = list(project_path.glob('**/prisma/schema.prisma'))
+    prisma_files = snapshot.glob('**/prisma/schema.prisma')
     schemas.extend([('prisma', f) for f in prisma_files])
 
     # Drizzle schema files
-    drizzle_files = list(project_path.glob('**/drizzle/*.ts'))
-    drizzle_files.extend(project_path.glob('**/schema/*.ts'))
+    drizzle_files = snapshot.glob('**/drizzle/*.ts')
+    drizzle_files.extend(snapshot.glob('**/schema/*.ts'))
     for f in drizzle_files:
         if 'schema' in f.name.lower() or 'table' in f.name.lower():
             schemas.append(('drizzle', f))
@@ -49,7 +49,7 @@ def validate_prisma_schema(file_path: Path) -> list:
     issues = []
 
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
 
         # Find all models
         models = re.findall(r'model\s+(\w+)\s*{([^}]+)}', content, re.DOTALL)
@@ -91,19 +91,22 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the report main() prints, without printing or exiting."""
+    project_path = Path(project_path).resolve()
+    get_snapshot(project_path, context)
+    lines = []
 
-    print(f"\n{'='*60}")
-    print(f"[SCHEMA VALIDATOR] Database Schema Validation")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
+    lines.append(f"\n{'='*60}")
+    lines.append(f"[SCHEMA VALIDATOR] Database Schema Validation")
+    lines.append(f"{'='*60}")
+    lines.append(f"Project: {project_path}")
+    lines.append(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append("-"*60)
 
     # Find schema files
     schemas = find_schema_files(project_path)
-    print(f"Found {len(schemas)} schema files")
+    lines.append(f"Found {len(schemas)} schema files")
 
     if not schemas:
         output = {
@@ -114,14 +117,14 @@ def main():
             "passed": True,
             "message": "No schema files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
+        lines.append(json.dumps(output, indent=2))
+        return {"passed": True, "output": "\n".join(lines)}
 
     # Validate each schema
     all_issues = []
 
     for schema_type, file_path in schemas:
-        print(f"\nValidating: {file_path.name} ({schema_type})")
+        lines.append(f"\nValidating: {file_path.name} ({schema_type})")
 
         if schema_type == 'prisma':
             issues = validate_prisma_schema(file_path)
@@ -136,19 +139,19 @@ def main():
             })
 
     # Summary
-    print("\n" + "="*60)
-    print("SCHEMA ISSUES")
-    print("="*60)
+    lines.append("\n" + "="*60)
+    lines.append("SCHEMA ISSUES")
+    lines.append("="*60)
 
     if all_issues:
         for item in all_issues:
-            print(f"\n{item['file']} ({item['type']}):")
+            lines.append(f"\n{item['file']} ({item['type']}):")
             for issue in item["issues"][:5]:  # Limit per file
-                print(f"  - {issue}")
+                lines.append(f"  - {issue}")
             if len(item["issues"]) > 5:
-                print(f"  ... and {len(item['issues']) - 5} more issues")
+                lines.append(f"  ... and {len(item['issues']) - 5} more issues")
     else:
-        print("No schema issues found!")
+        lines.append("No schema issues found!")
 
     total_issues = sum(len(item["issues"]) for item in all_issues)
     # Schema issues are warnings, not failures
@@ -163,9 +166,21 @@ def main():
         "issues": all_issues
     }
 
-    print("\n" + json.dumps(output, indent=2))
+    lines.append("\n" + json.dumps(output, indent=2))
+
+    return {"passed": True, "output": "\n".join(lines)}
+
+
+def main():
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    except:
+        pass
 
-    sys.exit(0)
+    result = run(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(result["output"])
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -18,13 +18,13 @@ import sys
 import json
 import re
 from pathlib import Path
+from typing import Optional
 from datetime import datetime
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-except:
-    pass
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text
+from findings_cache import FindingsCache
 
 
 def find_html_files(project_path: Path) -> list:
@@ -32,9 +32,10 @@ def find_html_files(project_path: Path) -> list:
     patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
 
+    snapshot = get_snapshot(project_path)
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in snapshot.glob(pattern):
             if not any(skip in f.parts for skip in skip_dirs):
                 files.append(f)
 
@@ -46,7 +47,7 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
 
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
 
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -108,19 +109,22 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the report main() prints, without printing or exiting."""
+    project_path = Path(project_path).resolve()
+    get_snapshot(project_path, context)
+    lines = []
 
-    print(f"\n{'='*60}")
-    print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
+    lines.append(f"\n{'='*60}")
+    lines.append(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
+    lines.append(f"{'='*60}")
+    lines.append(f"Project: {project_path}")
+    lines.append(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append("-"*60)
 
     # Find HTML files
     files = find_html_files(project_path)
-    print(f"Found {len(files)} HTML/JSX/TSX files")
+    lines.append(f"Found {len(files)} HTML/JSX/TSX files")
 
     if not files:
         output = {
@@ -131,35 +135,37 @@ def main():
             "passed": True,
             "message": "No HTML files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
+        lines.append(json.dumps(output, indent=2))
+        return {"passed": True, "output": "\n".join(lines)}
 
-    # Check each file
+    # Check each file (unchanged files replay their cached issues)
     all_issues = []
+    cache = FindingsCache(project_path, "accessibility_checker", __file__)
 
     for f in files:
-        issues = check_accessibility(f)
+        issues = cache.findings(f, lambda: check_accessibility(f))
         if issues:
             all_issues.append({
                 "file": str(f.name),
                 "issues": issues
             })
+    cache.save()
 
     # Summary
-    print("\n" + "="*60)
-    print("ACCESSIBILITY ISSUES")
-    print("="*60)
+    lines.append("\n" + "="*60)
+    lines.append("ACCESSIBILITY ISSUES")
+    lines.append("="*60)
 
     if all_issues:
         for item in all_issues[:10]:
-            print(f"\n{item['file']}:")
+            lines.append(f"\n{item['file']}:")
             for issue in item["issues"]:
-                print(f"  - {issue}")
+                lines.append(f"  - {issue}")
 
         if len(all_issues) > 10:
-            print(f"\n... and {len(all_issues) - 10} more files with issues")
+            lines.append(f"\n... and {len(all_issues) - 10} more files with issues")
     else:
-        print("No accessibility issues found!")
+        lines.append("No accessibility issues found!")
 
     total_issues = sum(len(item["issues"]) for item in all_issues)
     # Accessibility issues are important but not blocking
@@ -174,9 +180,21 @@ def main():
         "passed": passed
     }
 
-    print("\n" + json.dumps(output, indent=2))
+    lines.append("\n" + json.dumps(output, indent=2))
+
+    return {"passed": passed, "output": "\n".join(lines)}
+
+
+def main():
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    except:
+        pass
 
-    sys.exit(0 if passed else 1)
+    result = run(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(result["output"])
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
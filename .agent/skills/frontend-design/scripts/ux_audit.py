@@ -94,6 +94,12 @@ import os
 import re
 import json
 from pathlib import Path
+from typing import Optional
+
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text
+from findings_cache import FindingsCache
 
 class UXAuditor:
     def __init__(self):
@@ -104,8 +110,7 @@ class UXAuditor:
 
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = read_text(filepath, errors='replace')
         except: return
 
         self.files_checked += 1
@@ -673,11 +678,24 @@ class UXAuditor:
 
     def audit_directory(self, directory: str) -> None:
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        cache = FindingsCache(directory, "ux_audit", __file__)
+        for filepath in get_snapshot(directory).files({'node_modules', '.git', 'dist', 'build', '.next'}):
+            if filepath.suffix in extensions:
+                self.add_findings(cache.findings(filepath, lambda: self.file_findings(str(filepath))))
+        cache.save()
+
+    def file_findings(self, filepath: str) -> tuple:
+        """What audit_file() adds for one file: (issues, warnings, passed_count, files_checked)"""
+        auditor = type(self)()
+        auditor.audit_file(filepath)
+        return auditor.issues, auditor.warnings, auditor.passed_count, auditor.files_checked
+
+    def add_findings(self, findings: tuple) -> None:
+        issues, warnings, passed_count, files_checked = findings
+        self.issues.extend(issues)
+        self.warnings.extend(warnings)
+        self.passed_count += passed_count
+        self.files_checked += files_checked
 
     def get_report(self):
         return {
@@ -688,35 +706,36 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
-def main():
-    if len(sys.argv) < 2: sys.exit(1)
-
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
-
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the text report, without printing or exiting."""
     auditor = UXAuditor()
-    if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
+    if os.path.isfile(project_path):
+        auditor.audit_file(project_path)
+    else:
+        get_snapshot(project_path, context)
+        auditor.audit_directory(project_path)
 
     report = auditor.get_report()
 
-    if is_json:
-        print(json.dumps(report))
-    else:
-        # Use ASCII-safe output for Windows console compatibility
-        print(f"\n[UX AUDIT] {report['files_checked']} files checked")
-        print("-" * 50)
-        if report['issues']:
-            print(f"[!] ISSUES ({len(report['issues'])}):")
-            for i in report['issues'][:10]: print(f"  - {i}")
-        if report['warnings']:
-            print(f"[*] WARNINGS ({len(report['warnings'])}):")
-            for w in report['warnings'][:15]: print(f"  - {w}")
-        print(f"[+] PASSED CHECKS: {report['passed_checks']}")
-        status = "PASS" if report['compliant'] else "FAIL"
-        print(f"STATUS: {status}")
-
-    sys.exit(0 if report['compliant'] else 1)
+    # Use ASCII-safe output for Windows console compatibility
+    lines = [f"\n[UX AUDIT] {report['files_checked']} files checked", "-" * 50]
+    if report['issues']:
+        lines.append(f"[!] ISSUES ({len(report['issues'])}):")
+        lines.extend(f"  - {i}" for i in report['issues'][:10])
+    if report['warnings']:
+        lines.append(f"[*] WARNINGS ({len(report['warnings'])}):")
+        lines.extend(f"  - {w}" for w in report['warnings'][:15])
+    lines.append(f"[+] PASSED CHECKS: {report['passed_checks']}")
+    lines.append(f"STATUS: {'PASS' if report['compliant'] else 'FAIL'}")
+
+    return {"passed": report['compliant'], "output": "\n".join(lines), "report": report}
+
+def main():
+    if len(sys.argv) < 2: sys.exit(1)
+
+    result = run(sys.argv[1])
+    print(json.dumps(result['report']) if "--json" in sys.argv else result['output'])
+    sys.exit(0 if result['passed'] else 1)
 
 if __name__ == "__main__":
     main()
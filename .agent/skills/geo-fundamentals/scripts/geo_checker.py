@@ -20,13 +20,11 @@ import sys
 import re
 import json
 from pathlib import Path
+from typing import Optional
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text
 
 
 # Directories to skip (not public content)
@@ -82,9 +80,10 @@ def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
 
+    snapshot = get_snapshot(project_path)
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in snapshot.glob(pattern):
             # Skip excluded directories
             if any(skip in f.parts for skip in SKIP_DIRS):
                 continue
@@ -99,7 +98,7 @@ def find_web_pages(project_path: Path) -> list:
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
 
@@ -219,28 +218,30 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    target_path = Path(target).resolve()
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the report main() prints, without printing or exiting."""
+    target_path = Path(project_path).resolve()
+    get_snapshot(target_path, context)
+    lines = []
 
-    print("\n" + "=" * 60)
-    print("  GEO CHECKER - AI Citation Readiness Audit")
-    print("=" * 60)
-    print(f"Project: {target_path}")
-    print("-" * 60)
+    lines.append("\n" + "=" * 60)
+    lines.append("  GEO CHECKER - AI Citation Readiness Audit")
+    lines.append("=" * 60)
+    lines.append(f"Project: {target_path}")
+    lines.append("-" * 60)
 
     # Find web pages only
     pages = find_web_pages(target_path)
 
     if not pages:
-        print("\n[!] No public web pages found.")
-        print("    Looking for: HTML, JSX, TSX files in pages/app directories")
-        print("    Skipping: docs, tests, config files, node_modules")
+        lines.append("\n[!] No public web pages found.")
+        lines.append("    Looking for: HTML, JSX, TSX files in pages/app directories")
+        lines.append("    Skipping: docs, tests, config files, node_modules")
         output = {"script": "geo_checker", "pages_found": 0, "passed": True}
-        print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        lines.append("\n" + json.dumps(output, indent=2))
+        return {"passed": True, "output": "\n".join(lines)}
 
-    print(f"Found {len(pages)} public pages to analyze\n")
+    lines.append(f"Found {len(pages)} public pages to analyze\n")
 
     # Check each page
     results = []
@@ -251,26 +252,26 @@ def main():
     # Print results
     for result in results:
         status = "[OK]" if result['score'] >= 60 else "[!]"
-        print(f"{status} {result['file']}: {result['score']}%")
+        lines.append(f"{status} {result['file']}: {result['score']}%")
         if result['issues'] and result['score'] < 60:
             for issue in result['issues'][:2]:  # Show max 2 issues
-                print(f"    - {issue}")
+                lines.append(f"    - {issue}")
 
     # Average score
     avg_score = sum(r['score'] for r in results) / len(results) if results else 0
 
-    print("\n" + "=" * 60)
-    print(f"AVERAGE GEO SCORE: {avg_score:.0f}%")
-    print("=" * 60)
+    lines.append("\n" + "=" * 60)
+    lines.append(f"AVERAGE GEO SCORE: {avg_score:.0f}%")
+    lines.append("=" * 60)
 
     if avg_score >= 80:
-        print("[OK] Excellent - Content well-optimized for AI citations")
+        lines.append("[OK] Excellent - Content well-optimized for AI citations")
     elif avg_score >= 60:
-        print("[OK] Good - Some improvements recommended")
+        lines.append("[OK] Good - Some improvements recommended")
     elif avg_score >= 40:
-        print("[!] Needs work - Add structured elements")
+        lines.append("[!] Needs work - Add structured elements")
     else:
-        print("[X] Poor - Content needs GEO optimization")
+        lines.append("[X] Poor - Content needs GEO optimization")
 
     # JSON output
     output = {
@@ -280,9 +281,22 @@ def main():
         "average_score": round(avg_score),
         "passed": avg_score >= 60
     }
-    print("\n" + json.dumps(output, indent=2))
+    lines.append("\n" + json.dumps(output, indent=2))
+
+    return {"passed": avg_score >= 60, "output": "\n".join(lines)}
+
 
-    sys.exit(0 if avg_score >= 60 else 1)
+def main():
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass
+
+    result = run(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(result["output"])
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
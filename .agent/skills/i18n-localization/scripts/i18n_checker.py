@@ -7,13 +7,11 @@ import sys
 import re
 import json
 from pathlib import Path
+from typing import Optional
 
-# Fix Windows console encoding for Unicode output
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass  # Python < 3.7
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text
 
 # Patterns that indicate hardcoded strings (should be translated)
 HARDCODED_PATTERNS = {
@@ -61,9 +59,10 @@ def find_locale_files(project_path: Path) -> list:
         "**/*.po",  # gettext
     ]
 
+    snapshot = get_snapshot(project_path)
     files = []
     for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+        files.extend(snapshot.glob(pattern))
 
     return [f for f in files if 'node_modules' not in str(f)]
 
@@ -81,7 +80,7 @@ def check_locale_completeness(locale_files: list) -> dict:
         if f.suffix == '.json':
             try:
                 lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
+                content = json.loads(read_text(f))
                 if lang not in locales:
                     locales[lang] = {}
                 locales[lang][f.stem] = set(flatten_keys(content))
@@ -140,9 +139,10 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
 
+    snapshot = get_snapshot(project_path)
     code_files = []
     for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+        code_files.extend(snapshot.glob(f"**/*{ext}"))
 
     code_files = [f for f in code_files if not any(x in str(f) for x in
                   ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
@@ -156,7 +156,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
 
     for file_path in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
             ext = file_path.suffix
             file_type = extensions.get(ext, 'jsx')
 
@@ -196,13 +196,15 @@ def check_hardcoded_strings(project_path: Path) -> dict:
 
     return {'passed': passed, 'issues': issues}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the report main() prints, without printing or exiting."""
+    project_path = Path(project_path)
+    get_snapshot(project_path, context)
+    lines = []
 
-    print("\n" + "=" * 60)
-    print("  i18n CHECKER - Internationalization Audit")
-    print("=" * 60 + "\n")
+    lines.append("\n" + "=" * 60)
+    lines.append("  i18n CHECKER - Internationalization Audit")
+    lines.append("=" * 60 + "\n")
 
     # Check locale files
     locale_files = find_locale_files(project_path)
@@ -212,30 +214,42 @@ def main():
     code_result = check_hardcoded_strings(project_path)
 
     # Print results
-    print("[LOCALE FILES]")
-    print("-" * 40)
+    lines.append("[LOCALE FILES]")
+    lines.append("-" * 40)
     for item in locale_result['passed']:
-        print(f"  {item}")
+        lines.append(f"  {item}")
     for item in locale_result['issues']:
-        print(f"  {item}")
+        lines.append(f"  {item}")
 
-    print("\n[CODE ANALYSIS]")
-    print("-" * 40)
+    lines.append("\n[CODE ANALYSIS]")
+    lines.append("-" * 40)
     for item in code_result['passed']:
-        print(f"  {item}")
+        lines.append(f"  {item}")
     for item in code_result['issues']:
-        print(f"  {item}")
+        lines.append(f"  {item}")
 
     # Summary
     critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
 
-    print("\n" + "=" * 60)
+    lines.append("\n" + "=" * 60)
     if critical_issues == 0:
-        print("[OK] i18n CHECK: PASSED")
-        sys.exit(0)
+        lines.append("[OK] i18n CHECK: PASSED")
+        return {"passed": True, "output": "\n".join(lines)}
     else:
-        print(f"[X] i18n CHECK: {critical_issues} issues found")
-        sys.exit(1)
+        lines.append(f"[X] i18n CHECK: {critical_issues} issues found")
+        return {"passed": False, "output": "\n".join(lines)}
+
+def main():
+    # Fix Windows console encoding for Unicode output
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass  # Python < 3.7
+
+    result = run(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(result["output"])
+    sys.exit(0 if result["passed"] else 1)
 
 if __name__ == "__main__":
     main()
@@ -7,13 +7,11 @@ import sys
 import re
 import subprocess
 from pathlib import Path
+from typing import Optional
 
-# Fix Windows console encoding for Unicode output
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass  # Python < 3.7
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text
 
 def check_typescript_coverage(project_path: Path) -> dict:
     """Check TypeScript type coverage."""
@@ -21,7 +19,8 @@ def check_typescript_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
 
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
+    snapshot = get_snapshot(project_path)
+    ts_files = snapshot.glob("**/*.ts") + snapshot.glob("**/*.tsx")
     ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
 
     if not ts_files:
@@ -29,7 +28,7 @@ def check_typescript_coverage(project_path: Path) -> dict:
 
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
 
             # Count 'any' usage
             any_matches = re.findall(r':\s*any\b', content)
@@ -77,7 +76,7 @@ def check_python_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
 
-    py_files = list(project_path.rglob("*.py"))
+    py_files = get_snapshot(project_path).glob("**/*.py")
     py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
 
     if not py_files:
@@ -85,7 +84,7 @@ def check_python_coverage(project_path: Path) -> dict:
 
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
 
             # Count Any usage
             any_matches = re.findall(r':\s*Any\b', content)
@@ -125,13 +124,15 @@ def check_python_coverage(project_path: Path) -> dict:
 
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the report main() prints, without printing or exiting."""
+    project_path = Path(project_path)
+    get_snapshot(project_path, context)
+    lines = []
 
-    print("\n" + "=" * 60)
-    print("  TYPE COVERAGE CHECKER")
-    print("=" * 60 + "\n")
+    lines.append("\n" + "=" * 60)
+    lines.append("  TYPE COVERAGE CHECKER")
+    lines.append("=" * 60 + "\n")
 
     results = []
 
@@ -146,28 +147,40 @@ def main():
         results.append(py_result)
 
     if not results:
-        print("[!] No TypeScript or Python files found.")
-        sys.exit(0)
+        lines.append("[!] No TypeScript or Python files found.")
+        return {"passed": True, "output": "\n".join(lines)}
 
     # Print results
     critical_issues = 0
     for result in results:
-        print(f"\n[{result['type'].upper()}]")
-        print("-" * 40)
+        lines.append(f"\n[{result['type'].upper()}]")
+        lines.append("-" * 40)
         for item in result['passed']:
-            print(f"  {item}")
+            lines.append(f"  {item}")
         for item in result['issues']:
-            print(f"  {item}")
+            lines.append(f"  {item}")
             if item.startswith("[X]"):
                 critical_issues += 1
 
-    print("\n" + "=" * 60)
+    lines.append("\n" + "=" * 60)
     if critical_issues == 0:
-        print("[OK] TYPE COVERAGE: ACCEPTABLE")
-        sys.exit(0)
+        lines.append("[OK] TYPE COVERAGE: ACCEPTABLE")
+        return {"passed": True, "output": "\n".join(lines)}
     else:
-        print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
-        sys.exit(1)
+        lines.append(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
+        return {"passed": False, "output": "\n".join(lines)}
+
+def main():
+    # Fix Windows console encoding for Unicode output
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass  # Python < 3.7
+
+    result = run(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(result["output"])
+    sys.exit(0 if result["passed"] else 1)
 
 if __name__ == "__main__":
     main()
@@ -21,13 +21,12 @@ import sys
 import json
 import re
 from pathlib import Path
+from typing import Optional
 from datetime import datetime
 
-# Fix Windows console encoding
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-except:
-    pass
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text
 
 
 # Directories to skip
@@ -79,9 +78,10 @@ def find_pages(project_path: Path) -> list:
     """Find page files to check."""
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
 
+    snapshot = get_snapshot(project_path)
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in snapshot.glob(pattern):
             # Skip excluded directories
             if any(skip in f.parts for skip in SKIP_DIRS):
                 continue
@@ -98,7 +98,7 @@ def check_page(file_path: Path) -> dict:
     issues = []
 
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
 
@@ -145,27 +145,30 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the report main() prints, without printing or exiting."""
+    project_path = Path(project_path).resolve()
+    get_snapshot(project_path, context)
+    lines = []
 
-    print(f"\n{'='*60}")
-    print(f"  SEO CHECKER - Search Engine Optimization Audit")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
+    lines.append(f"\n{'='*60}")
+    lines.append(f"  SEO CHECKER - Search Engine Optimization Audit")
+    lines.append(f"{'='*60}")
+    lines.append(f"Project: {project_path}")
+    lines.append(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append("-"*60)
 
     # Find pages
     pages = find_pages(project_path)
 
     if not pages:
-        print("\n[!] No page files found.")
-        print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
+        lines.append("\n[!] No page files found.")
+        lines.append("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
         output = {"script": "seo_checker", "files_checked": 0, "passed": True}
-        print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        lines.append("\n" + json.dumps(output, indent=2))
+        return {"passed": True, "output": "\n".join(lines)}
 
-    print(f"Found {len(pages)} page files to analyze\n")
+    lines.append(f"Found {len(pages)} page files to analyze\n")
 
     # Check each page
     all_issues = []
@@ -175,9 +178,9 @@ def main():
             all_issues.append(result)
 
     # Summary
-    print("=" * 60)
-    print("SEO ANALYSIS RESULTS")
-    print("=" * 60)
+    lines.append("=" * 60)
+    lines.append("SEO ANALYSIS RESULTS")
+    lines.append("=" * 60)
 
     if all_issues:
         # Group by issue type
@@ -186,17 +189,17 @@ def main():
             for issue in item["issues"]:
                 issue_counts[issue] = issue_counts.get(issue, 0) + 1
 
-        print("\nIssue Summary:")
+        lines.append("\nIssue Summary:")
         for issue, count in sorted(issue_counts.items(), key=lambda x: -x[1]):
-            print(f"  [{count}] {issue}")
+            lines.append(f"  [{count}] {issue}")
 
-        print(f"\nAffected files ({len(all_issues)}):")
+        lines.append(f"\nAffected files ({len(all_issues)}):")
         for item in all_issues[:5]:
-            print(f"  - {item['file']}")
+            lines.append(f"  - {item['file']}")
         if len(all_issues) > 5:
-            print(f"  ... and {len(all_issues) - 5} more")
+            lines.append(f"  ... and {len(all_issues) - 5} more")
     else:
-        print("\n[OK] No SEO issues found!")
+        lines.append("\n[OK] No SEO issues found!")
 
     total_issues = sum(len(item["issues"]) for item in all_issues)
     passed = total_issues == 0
@@ -210,9 +213,21 @@ def main():
         "passed": passed
     }
 
-    print("\n" + json.dumps(output, indent=2))
+    lines.append("\n" + json.dumps(output, indent=2))
+
+    return {"passed": passed, "output": "\n".join(lines)}
+
+
+def main():
+    # Fix Windows console encoding
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    except:
+        pass
 
-    sys.exit(0 if passed else 1)
+    result = run(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(result["output"])
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
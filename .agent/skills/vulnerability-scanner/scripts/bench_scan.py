@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Skill: vulnerability-scanner
+Script: bench_scan.py
+Purpose: Time the security_scan.py scanners against their previous implementation
+Usage: python bench_scan.py                          # 50k-file synthetic tree
+       python bench_scan.py --files 10000 --repeat 3 # smaller run
+       python bench_scan.py --jobs 4                 # also time security_scan.py --jobs 4
+       python bench_scan.py --output bench.json      # write JSON to a file
+Output: JSON with min/median milliseconds per stage
+
+Stages (each runs the reference and the current scanner on the same input and
+checks that both report identical findings):
+  secrets_in_memory   per-file secret matching on contents already in memory:
+                      one re.findall per SECRET_PATTERNS entry (reference)
+                      vs find_secrets
+  secrets_end_to_end  scan_secrets over the whole tree (findings cache off,
+                      file contents already loaded by the project snapshot)
+  patterns_in_memory  dangerous-pattern matching on contents in memory: one
+                      re.search per DANGEROUS_PATTERNS entry per line
+                      (reference) vs find_dangerous_patterns
+  patterns_end_to_end scan_code_patterns over the whole tree
+  file_scans_jobs     (with --jobs N) the secret, pattern and config scans run
+                      serially vs on N worker processes
+
+The synthetic tree mixes source and config files of realistic size. Most
+lines are ordinary code, some mention the secret keywords or look like risky
+calls without being either, and a few hold real-looking credentials or
+dangerous calls. Everything is seeded, so
+runs are comparable across commits.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+from pathlib import Path
+from datetime import datetime
+
+os.environ["AGENT_FINDINGS_CACHE"] = "off"  # Measure the scanners, not the cache
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))  # project_snapshot, findings_cache
+
+import re
+import security_scan
+from project_snapshot import read_text
+
+
+# ============================================================================
+#  CONFIGURATION
+# ============================================================================
+
+DEFAULT_FILES = 50000
+DEFAULT_REPEAT = 5
+SEED = 1337
+
+EXTENSIONS = ['.ts', '.tsx', '.js', '.py', '.json', '.yaml']
+LINES_PER_FILE = (5, 120)
+SECRET_FILE_RATE = 0.02   # Files holding one credential or dangerous call
+KEYWORD_LINE_RATE = 0.05  # Lines mentioning api/token/password/... harmlessly
+
+CODE_LINES = [
+    "import {{ useState, useEffect }} from 'react';",
+    "const {name} = await fetchItems(query, {{ limit: {n} }});",
+    "export function {name}(props) {{ return props.items.map(renderRow); }}",
+    "if ({name}.length > {n}) {{ setPage(page + 1); }}",
+    "def {name}(self, items):",
+    "    return [item for item in items if item.quantity > {n}]",
+    '    "{name}": {n},',
+    "{name}: {n}",
+    "// TODO: move {name} into the inventory service",
+    "",
+]
+KEYWORD_LINES = [
+    "const api = createClient(baseUrl);",
+    "// refresh the token before it expires",
+    "headers.Authorization = `Bearer ${{token}}`;",
+    "const html = el.innerHTML;",
+    "result = evaluate(expression)",
+    "password: z.string().min({n}),",
+    "const awsRegion = process.env.AWS_REGION;",
+    "# see https://cloud.google.com/docs for setup",
+    "import {{ ApiError }} from './api/errors';",
+]
+# Each literal is split inside its keyword so that security_scan.py does not report this file itself
+SECRET_LINES = [
+    'const API_' + 'KEY = "sk_live_{hex}";',
+    'tok' + 'en: "{hex}"',
+    "Authorization: Bear" + "er {hex}",
+    "AWS_ACCESS_KEY_ID=AK" + "IA{upper}",
+    'pass' + 'word = "{hex}"',
+    "DATABASE_URL=postgres:" + "//admin:{hex}@db.internal:5432/stock",
+    "-----BEGIN " + "RSA KEY-----",
+    "const jwt = 'ey" + "J{hex}.eyJ{hex}.{hex}';",
+    'GOOGLE_' + 'CLIENT_SECRET: "{hex}"',
+    "    container.inner" + "HTML = {name};",
+    "const run = new " + "Function('x', {name});",
+    'cursor.execute(f"SEL' + 'ECT * FROM items WHERE id = {{{name}}}")',
+    "data = yaml." + "load(open('{name}.yml'))",
+    "requests.get(url, verify" + "=False)",
+]
+
+
+# ============================================================================
+#  REFERENCE IMPLEMENTATION
+# ============================================================================
+
+def reference_find_secrets(content: str) -> list:
+    """find_secrets as it was: one uncompiled re.findall per pattern"""
+    secrets = []
+    for pattern, secret_type, severity, _ in security_scan.SECRET_PATTERNS:
+        count = len(re.findall(pattern, content, re.IGNORECASE))
+        if count:
+            secrets.append((secret_type, severity, count))
+    return secrets
+
+
+def reference_find_dangerous_patterns(content: str) -> list:
+    """find_dangerous_patterns as it was: re.search of every pattern on every line"""
+    found = []
+    for line_num, line in enumerate(content.split('\n'), 1):
+        for pattern, name, severity, category, _ in security_scan.DANGEROUS_PATTERNS:
+            if re.search(pattern, line, re.IGNORECASE):
+                found.append((line_num, name, severity, category, line.strip()[:80]))
+    return found
+
+
+# ============================================================================
+#  SYNTHETIC TREE
+# ============================================================================
+
+def synthetic_line(templates, rng) -> str:
+    return rng.choice(templates).format(
+        name=f"item{rng.randrange(1000)}", n=rng.randrange(100),
+        hex="%032x" % rng.getrandbits(128), upper="%016X" % rng.getrandbits(64))
+
+
+def build_tree(root: Path, files: int, rng) -> None:
+    """files synthetic source/config files spread over nested package directories"""
+    for i in range(files):
+        directory = root / f"pkg{i % 50}" / f"src{i % 7}"
+        directory.mkdir(parents=True, exist_ok=True)
+        lines = []
+        for _ in range(rng.randint(*LINES_PER_FILE)):
+            lines.append(synthetic_line(KEYWORD_LINES if rng.random() < KEYWORD_LINE_RATE else CODE_LINES, rng))
+        if rng.random() < SECRET_FILE_RATE:
+            lines.insert(rng.randrange(len(lines) + 1), synthetic_line(SECRET_LINES, rng))
+        (directory / f"file{i}{rng.choice(EXTENSIONS)}").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+# ============================================================================
+#  STAGES
+# ============================================================================
+
+def _timed(fn, repeat):
+    """Run fn `repeat` times; returns (last result, stats in ms)."""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, {"min": round(min(samples), 2), "median": round(statistics.median(samples), 2)}
+
+
+def compare(reference, current, repeat) -> dict:
+    """Time both implementations; they must produce the same result."""
+    expected, reference_stats = _timed(reference, repeat)
+    actual, current_stats = _timed(current, repeat)
+    if actual != expected:
+        raise AssertionError("current implementation disagrees with the reference")
+    return {"reference_ms": reference_stats, "current_ms": current_stats,
+            "speedup": round(reference_stats["median"] / current_stats["median"], 2)}
+
+
+def compare_scanner(root: Path, scanner, name: str, reference, repeat) -> dict:
+    """scanner(root) with security_scan.<name> swapped for its reference implementation, vs as is."""
+    current = getattr(security_scan, name)
+
+    def reference_scan():
+        setattr(security_scan, name, reference)
+        try:
+            return scanner(str(root))
+        finally:
+            setattr(security_scan, name, current)
+
+    return compare(reference_scan, lambda: scanner(str(root)), repeat)
+
+
+def file_scans(root: Path, jobs: int) -> dict:
+    return {name: scanner(str(root), jobs=jobs) for name, scanner in (
+        ("secrets", security_scan.scan_secrets), ("code_patterns", security_scan.scan_code_patterns),
+        ("configuration", security_scan.scan_configuration))}
+
+
+def bench_scanners(root: Path, repeat: int, jobs: int = 1) -> dict:
+    snapshot = security_scan.get_snapshot(str(root))
+    scanned = security_scan.CODE_EXTENSIONS | security_scan.CONFIG_EXTENSIONS
+    contents = [read_text(p, errors='ignore') for p in snapshot.files(security_scan.SKIP_DIRS)
+                if p.suffix.lower() in scanned]
+    code = [read_text(p, errors='ignore') for p in snapshot.files(security_scan.SKIP_DIRS)
+            if p.suffix.lower() in security_scan.CODE_EXTENSIONS]
+    report = {"files": len(contents), "code_files": len(code),
+              "megabytes": round(sum(map(len, contents)) / 1e6, 1)}
+
+    report["secrets_in_memory"] = compare(lambda: [reference_find_secrets(c) for c in contents],
+                                          lambda: [security_scan.find_secrets(c) for c in contents], repeat)
+    report["secrets_end_to_end"] = compare_scanner(root, security_scan.scan_secrets, "find_secrets",
+                                                   reference_find_secrets, repeat)
+    report["patterns_in_memory"] = compare(lambda: [reference_find_dangerous_patterns(c) for c in code],
+                                           lambda: [security_scan.find_dangerous_patterns(c) for c in code], repeat)
+    report["patterns_end_to_end"] = compare_scanner(root, security_scan.scan_code_patterns, "find_dangerous_patterns",
+                                                    reference_find_dangerous_patterns, repeat)
+    if jobs > 1:
+        report["file_scans_jobs"] = compare(lambda: file_scans(root, 1), lambda: file_scans(root, jobs), repeat)
+        report["file_scans_jobs"]["jobs"] = jobs
+    return report
+
+
+# ============================================================================
+#  MAIN
+# ============================================================================
+
+def run(files: int, repeat: int, jobs: int = 1) -> dict:
+    rng = random.Random(SEED)
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "files": files,
+            "repeat": repeat,
+            "jobs": jobs,
+            "cpus": os.cpu_count(),
+            "seed": SEED,
+        }
+    }
+    with tempfile.TemporaryDirectory(prefix="security-bench-") as tmp:
+        root = Path(tmp)
+        build_tree(root, files, rng)
+        report.update(bench_scanners(root, repeat, jobs))
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="security_scan.py benchmarks (JSON output)")
+    parser.add_argument("--files", type=int, default=DEFAULT_FILES, help="Synthetic tree size in files (default: 50000)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Repetitions per measurement (default: 5)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Also time the file scans on this many worker processes")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write JSON to this file instead of stdout")
+    args = parser.parse_args()
+
+    output = json.dumps(run(args.files, args.repeat, args.jobs), indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        print(f"Benchmark written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
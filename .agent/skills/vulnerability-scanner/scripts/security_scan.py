@@ -3,7 +3,7 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--jobs N]
 Output: JSON with validation findings
 
 This script verifies:
@@ -18,82 +18,221 @@ import os
 import sys
 import re
 import argparse
+import multiprocessing
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache, partial
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-# Fix Windows console encoding for Unicode output
-try:
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-except AttributeError:
-    pass  # Python < 3.7
+if __name__ == "__main__":  # Run directly; importers put .agent/scripts on sys.path themselves
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_snapshot import get_snapshot, read_text, decode_text
+from findings_cache import FindingsCache, content_hash
 
 
 # ============================================================================
 #  CONFIGURATION
 # ============================================================================
 
+# (regex, type, severity, anchor): every match of the regex contains its anchor (case-insensitively)
 SECRET_PATTERNS = [
     # API Keys & Tokens
-    (r'api[_-]?key\s*[=:]\s*["\'][^"\']{10,}["\']', "API Key", "high"),
-    (r'token\s*[=:]\s*["\'][^"\']{10,}["\']', "Token", "high"),
-    (r'bearer\s+[a-zA-Z0-9\-_.]+', "Bearer Token", "critical"),
+    (r'api[_-]?key\s*[=:]\s*["\'][^"\']{10,}["\']', "API Key", "high", "api"),
+    (r'token\s*[=:]\s*["\'][^"\']{10,}["\']', "Token", "high", "token"),
+    (r'bearer\s+[a-zA-Z0-9\-_.]+', "Bearer Token", "critical", "bearer"),
 
     # Cloud Credentials
-    (r'AKIA[0-9A-Z]{16}', "AWS Access Key", "critical"),
-    (r'aws[_-]?secret[_-]?access[_-]?key\s*[=:]\s*["\'][^"\']+["\']', "AWS Secret", "critical"),
-    (r'AZURE[_-]?[A-Z_]+\s*[=:]\s*["\'][^"\']+["\']', "Azure Credential", "critical"),
-    (r'GOOGLE[_-]?[A-Z_]+\s*[=:]\s*["\'][^"\']+["\']', "GCP Credential", "critical"),
+    (r'AKIA[0-9A-Z]{16}', "AWS Access Key", "critical", "akia"),
+    (r'aws[_-]?secret[_-]?access[_-]?key\s*[=:]\s*["\'][^"\']+["\']', "AWS Secret", "critical", "aws"),
+    (r'AZURE[_-]?[A-Z_]+\s*[=:]\s*["\'][^"\']+["\']', "Azure Credential", "critical", "azure"),
+    (r'GOOGLE[_-]?[A-Z_]+\s*[=:]\s*["\'][^"\']+["\']', "GCP Credential", "critical", "google"),
 
     # Database & Connections
-    (r'password\s*[=:]\s*["\'][^"\']{4,}["\']', "Password", "high"),
-    (r'(mongodb|postgres|mysql|redis):\/\/[^\s"\']+', "Database Connection String", "critical"),
+    (r'password\s*[=:]\s*["\'][^"\']{4,}["\']', "Password", "high", "password"),
+    (r'(mongodb|postgres|mysql|redis):\/\/[^\s"\']+', "Database Connection String", "critical", "://"),
 
     # Private Keys
-    (r'-----BEGIN\s+(RSA|PRIVATE|EC)\s+KEY-----', "Private Key", "critical"),
-    (r'ssh-rsa\s+[A-Za-z0-9+/]+', "SSH Key", "critical"),
+    (r'-----BEGIN\s+(RSA|PRIVATE|EC)\s+KEY-----', "Private Key", "critical", "-----begin"),
+    (r'ssh-rsa\s+[A-Za-z0-9+/]+', "SSH Key", "critical", "ssh-rsa"),
 
     # JWT
-    (r'eyJ[A-Za-z0-9-_]+\.eyJ[A-Za-z0-9-_]+\.[A-Za-z0-9-_]+', "JWT Token", "high"),
+    (r'eyJ[A-Za-z0-9-_]+\.eyJ[A-Za-z0-9-_]+\.[A-Za-z0-9-_]+', "JWT Token", "high", "eyj"),
 ]
 
+# (regex, name, severity, category, prefix): every match of the regex starts with its prefix (case-insensitively)
 DANGEROUS_PATTERNS = [
     # Injection risks
-    (r'eval\s*\(', "eval() usage", "critical", "Code Injection risk"),
-    (r'exec\s*\(', "exec() usage", "critical", "Code Injection risk"),
-    (r'new\s+Function\s*\(', "Function constructor", "high", "Code Injection risk"),
-    (r'child_process\.exec\s*\(', "child_process.exec", "high", "Command Injection risk"),
-    (r'subprocess\.call\s*\([^)]*shell\s*=\s*True', "subprocess with shell=True", "high", "Command Injection risk"),
+    (r'eval\s*\(', "eval() usage", "critical", "Code Injection risk", "eval"),
+    (r'exec\s*\(', "exec() usage", "critical", "Code Injection risk", "exec"),
+    (r'new\s+Function\s*\(', "Function constructor", "high", "Code Injection risk", "new"),
+    (r'child_process\.exec\s*\(', "child_process.exec", "high", "Command Injection risk", "child_process.exec"),
+    (r'subprocess\.call\s*\([^)]*shell\s*=\s*True', "subprocess with shell=True", "high", "Command Injection risk", "subprocess.call"),
 
     # XSS risks
-    (r'dangerouslySetInnerHTML', "dangerouslySetInnerHTML", "high", "XSS risk"),
-    (r'\.innerHTML\s*=', "innerHTML assignment", "medium", "XSS risk"),
-    (r'document\.write\s*\(', "document.write", "medium", "XSS risk"),
+    (r'dangerouslySetInnerHTML', "dangerouslySetInnerHTML", "high", "XSS risk", "dangerouslysetinnerhtml"),
+    (r'\.innerHTML\s*=', "innerHTML assignment", "medium", "XSS risk", ".innerhtml"),
+    (r'document\.write\s*\(', "document.write", "medium", "XSS risk", "document.write"),
 
     # SQL Injection indicators
-    (r'["\'][^"\']*\+\s*[a-zA-Z_]+\s*\+\s*["\'].*(?:SELECT|INSERT|UPDATE|DELETE)', "SQL String Concat", "critical", "SQL Injection risk"),
-    (r'f"[^"]*(?:SELECT|INSERT|UPDATE|DELETE)[^"]*\{', "SQL f-string", "critical", "SQL Injection risk"),
+    (r'["\'][^"\']*\+\s*[a-zA-Z_]+\s*\+\s*["\'].*(?:SELECT|INSERT|UPDATE|DELETE)', "SQL String Concat", "critical", "SQL Injection risk", None),
+    (r'f"[^"]*(?:SELECT|INSERT|UPDATE|DELETE)[^"]*\{', "SQL f-string", "critical", "SQL Injection risk", 'f"'),
 
     # Insecure configurations
-    (r'verify\s*=\s*False', "SSL Verify Disabled", "high", "MITM risk"),
-    (r'--insecure', "Insecure flag", "medium", "Security disabled"),
-    (r'disable[_-]?ssl', "SSL Disabled", "high", "MITM risk"),
+    (r'verify\s*=\s*False', "SSL Verify Disabled", "high", "MITM risk", "verify"),
+    (r'--insecure', "Insecure flag", "medium", "Security disabled", "--insecure"),
+    (r'disable[_-]?ssl', "SSL Disabled", "high", "MITM risk", "disable"),
 
     # Unsafe deserialization
-    (r'pickle\.loads?\s*\(', "pickle usage", "high", "Deserialization risk"),
-    (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
+    (r'pickle\.loads?\s*\(', "pickle usage", "high", "Deserialization risk", "pickle.load"),
+    (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk", "yaml.load"),
+]
+
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
 ]
 
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
 
+# Secret scanning: (regex, type, severity, anchor, whether every match starts with the anchor)
+_SECRET_REGEXES = [(re.compile(pattern, re.IGNORECASE), secret_type, severity, anchor, pattern.lower().startswith(anchor))
+                   for pattern, secret_type, severity, anchor in SECRET_PATTERNS]
+_SECRET_ANCHORS = frozenset(anchor for _, _, _, anchor, _ in _SECRET_REGEXES)
+
+
+def _within_line(pattern: str) -> str:
+    r"""pattern rewritten so that, searched over a whole file, it never matches across a newline.
+
+    \s becomes [^\S\n] and negated classes also exclude \n. Anything else that
+    could reach past a line end (\S, \W, \D, \n, \s in a set, ^/$, inline
+    flags) raises ValueError, so a new DANGEROUS_PATTERNS entry cannot silently
+    change what the per-line scan used to report.
+    """
+    out, i, in_class, negated = [], 0, False, False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            token = pattern[i:i + 2]
+            if token[1:] in ('S', 'W', 'D', 'n') or (token == r'\s' and in_class and not negated):
+                raise ValueError(f"{token} can match a newline in {pattern!r}")
+            out.append(r'[^\S\n]' if token == r'\s' and not in_class else token)
+            i += 2
+            continue
+        if in_class:
+            in_class = c != ']'
+            out.append(c)
+        elif c == '[':
+            negated = pattern.startswith('[^', i)
+            out.append(r'[^\n' if negated else '[')
+            i += 2 if negated else 1
+            if pattern.startswith(']', i):  # A leading ']' is a literal member
+                out.append(']')
+                i += 1
+            in_class = True
+            continue
+        elif c in '^$' or pattern.startswith('(?', i) and pattern[i + 2:i + 3].isalpha():
+            raise ValueError(f"{c if c in '^$' else 'inline flag'} is not line-local in {pattern!r}")
+        else:
+            out.append(c)
+        i += 1
+    return ''.join(out)
+
+
+# Code pattern scanning: each regex runs over the whole file, so like the per-line search it must never look
+# past a newline (see _within_line): (regex, name, severity, category, prefix)
+_PATTERN_REGEXES = [(re.compile(_within_line(pattern), re.IGNORECASE), name, severity, category, prefix)
+                    for pattern, name, severity, category, prefix in DANGEROUS_PATTERNS]
+
+# --jobs: below this many files a worker pool costs more than it saves; otherwise files go out in
+# contiguous chunks, about CHUNKS_PER_JOB per worker so a slow chunk does not hold up the others
+PARALLEL_MIN_FILES = 1000
+CHUNKS_PER_JOB = 8
+
+# Manifests and lockfiles: a scoped run (checklist.py --since) audits dependencies only if one changed
+DEPENDENCY_FILES = {'package.json', 'package-lock.json', 'npm-shrinkwrap.json', 'yarn.lock', 'pnpm-lock.yaml',
+                    'requirements.txt', 'Pipfile', 'Pipfile.lock', 'poetry.lock', 'pyproject.toml', 'setup.py'}
+
 
 # ============================================================================
 #  SCANNING FUNCTIONS
 # ============================================================================
 
+def changed_in_scope(project_path: str, names: set) -> bool:
+    """True unless the run is scoped to a change set that touches none of these file names."""
+    snapshot = get_snapshot(project_path)
+    return not snapshot.scoped or any(f.name in names for f in snapshot.files())
+
+
+def _scan_chunk(project_path: str, evaluate: Callable, chunk: List[Tuple[str, Optional[str]]],
+                hashing: bool) -> List[tuple]:
+    """Worker side of scan_files(): (content hash, findings) per (path, cached hash), one file in memory at a time.
+
+    Findings are None when the file still has its cached hash. The hash is
+    None when caching is off or the file could not be read.
+    """
+    results = []
+    for path, cached in chunk:
+        path = Path(path)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            results.append((None, evaluate(path, project_path)))  # Reported as unreadable, as in a serial run
+            continue
+        digest = content_hash(data) if hashing else None
+        if digest is not None and digest == cached:
+            results.append((digest, None))
+        else:
+            results.append((digest, evaluate(path, project_path, decode_text(data, errors='ignore'))))
+    return results
+
+
+def scan_files(project_path: str, scanner: str, files: List[Path], evaluate: Callable,
+               jobs: int = 1) -> Iterator[Tuple[Path, list]]:
+    """(path, evaluate(path, project_path)) for each file, in order, replayed from the findings cache when unchanged.
+
+    With jobs > 1 the files are split into chunks for a pool of worker
+    processes that read them from disk (this process never holds their
+    contents). Progress goes to stderr as each chunk comes back; results are
+    handed on in file order, as soon as every chunk before them is done, so
+    the report is the same as a serial run's.
+    """
+    cache = FindingsCache(project_path, scanner, __file__)
+    if jobs <= 1 or len(files) < PARALLEL_MIN_FILES:
+        for path in files:
+            yield path, cache.findings(path, lambda: evaluate(path, project_path))
+        cache.save()
+        return
+
+    size = -(-len(files) // (jobs * CHUNKS_PER_JOB))
+    chunks = [files[i:i + size] for i in range(0, len(files), size)]
+    done: Dict[int, list] = {}
+    next_chunk = scanned = found = 0
+    with ProcessPoolExecutor(jobs, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = {pool.submit(_scan_chunk, project_path, evaluate,
+                               [(str(path), cache.cached_digest(path)) for path in chunk], cache.enabled): index
+                   for index, chunk in enumerate(chunks)}
+        for future in as_completed(futures):
+            index = futures[future]
+            done[index] = [findings if digest is None else cache.record(path, digest, findings)
+                           for path, (digest, findings) in zip(chunks[index], future.result())]
+            scanned += len(chunks[index])
+            found += sum(len(findings) for findings in done[index])
+            print(f"[{scanner}] {scanned}/{len(files)} files, {found} findings", file=sys.stderr, flush=True)
+            while next_chunk in done:
+                yield from zip(chunks[next_chunk], done.pop(next_chunk))
+                next_chunk += 1
+    cache.save()
+
+
 def scan_dependencies(project_path: str) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
@@ -101,6 +240,10 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     """
     results = {"tool": "dependency_scanner", "findings": [], "status": "[OK] Secure"}
 
+    if not changed_in_scope(project_path, DEPENDENCY_FILES):
+        results["status"] = "[OK] Skipped: no manifest or lockfile changed"
+        return results
+
     # Check for lock files
     lock_files = {
         "npm": ["package-lock.json", "npm-shrinkwrap.json"],
@@ -178,7 +321,93 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _anchor_regex(anchors: frozenset) -> "re.Pattern":
+    """One alternation over these anchors; the match's lastgroup names the anchor found."""
+    return re.compile("|".join(f"(?P<a{i}>{re.escape(anchor)})" for i, (_, _, _, anchor, _) in enumerate(_SECRET_REGEXES)
+                               if anchor in anchors), re.IGNORECASE)
+
+
+def _present_anchors(content: str) -> set:
+    """Every secret anchor occurring in content under Unicode case folding (e.g. 'ſ' matches 's')."""
+    remaining = _SECRET_ANCHORS
+    found = set()
+    pos = 0
+    while remaining:
+        m = _anchor_regex(remaining).search(content, pos)
+        if m is None:
+            break
+        anchor = _SECRET_REGEXES[int(m.lastgroup[1:])][3]
+        found.add(anchor)
+        remaining -= {anchor}
+        pos = m.start()  # Another anchor may start at (or overlap) this one
+    return found
+
+
+def _count_from_anchor(regex: "re.Pattern", anchor: str, content: str, lowered: str) -> int:
+    """Non-overlapping matches of a regex that starts with its anchor, tried only where the anchor occurs."""
+    count = 0
+    pos = lowered.find(anchor)
+    while pos != -1:
+        m = regex.match(content, pos)
+        if m:
+            count += 1
+            pos = m.end()
+        else:
+            pos += 1
+        pos = lowered.find(anchor, pos)
+    return count
+
+
+def find_secrets(content: str) -> List[tuple]:
+    """(type, severity, match count) for every secret pattern matching content, in SECRET_PATTERNS order.
+
+    Same counts as re.findall(pattern, content, re.IGNORECASE) per pattern, but
+    only patterns whose anchor occurs in the file are run (precompiled). In
+    ASCII text the anchors are found by plain substring search, and a pattern
+    that starts with its anchor is only tried at the anchor's offsets.
+    """
+    if content.isascii():
+        lowered = content.lower()  # Exact case folding for ASCII
+        present = {anchor for anchor in _SECRET_ANCHORS if anchor in lowered}
+    else:
+        lowered = None
+        present = _present_anchors(content)
+
+    secrets = []
+    for regex, secret_type, severity, anchor, leading in _SECRET_REGEXES:
+        if anchor not in present:
+            continue
+        if leading and lowered is not None:
+            count = _count_from_anchor(regex, anchor, content, lowered)
+        else:
+            count = len(regex.findall(content))
+        if count:
+            secrets.append((secret_type, severity, count))
+    return secrets
+
+
+def scan_file_secrets(filepath: Path, project_path: str, content: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Secret findings for one file (content: already read, e.g. by a --jobs worker)."""
+    findings = []
+    try:
+        if content is None:
+            content = read_text(filepath, errors='ignore')
+
+        for secret_type, severity, count in find_secrets(content):
+            findings.append({
+                "file": str(filepath.relative_to(project_path)),
+                "type": secret_type,
+                "severity": severity,
+                "count": count
+            })
+
+    except Exception:
+        pass
+    return findings
+
+
+def scan_secrets(project_path: str, jobs: int = 1) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
@@ -191,34 +420,14 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
+    files = [f for f in get_snapshot(project_path).files(SKIP_DIRS)
+             if f.suffix.lower() in CODE_EXTENSIONS or f.suffix.lower() in CONFIG_EXTENSIONS]
+    for _, findings in scan_files(project_path, "security_secrets", files, scan_file_secrets, jobs):
+        results["scanned_files"] += 1
 
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-
-            except Exception:
-                pass
+        for finding in findings:
+            results["findings"].append(finding)
+            results["by_severity"][finding["severity"]] += finding["count"]
 
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
@@ -233,7 +442,79 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def _pattern_lines(regex: "re.Pattern", prefix: Optional[str], content: str, lowered: Optional[str], newlines: list):
+    """0-based numbers of the lines a within-line regex matches, tried only at its prefix's offsets when it has one."""
+    use_prefix = prefix and lowered is not None
+    pos = 0
+    while True:
+        if use_prefix:
+            pos = lowered.find(prefix, pos)
+            if pos == -1:
+                return
+            if not regex.match(content, pos):
+                pos += 1
+                continue
+        else:
+            m = regex.search(content, pos)
+            if m is None:
+                return
+            pos = m.start()
+        index = bisect_left(newlines, pos)  # Newlines before the match = line number
+        yield index
+        if index == len(newlines):
+            return
+        pos = newlines[index] + 1  # One finding per line: go on with the next one
+
+
+def find_dangerous_patterns(content: str) -> List[tuple]:
+    """(line number, name, severity, category, snippet) per DANGEROUS_PATTERNS entry found on each line, in line order.
+
+    Same findings as re.search(pattern, line, re.IGNORECASE) on every line, but
+    each pattern scans the whole file once and match offsets are mapped to line
+    numbers through the newline offsets. In ASCII text, a pattern is only tried
+    where its prefix occurs.
+    """
+    lowered = content.lower() if content.isascii() else None  # Exact case folding for ASCII
+    newlines = [m.start() for m in re.finditer('\n', content)]
+
+    hits = []
+    for i, (regex, _, _, _, prefix) in enumerate(_PATTERN_REGEXES):
+        hits.extend((index, i) for index in _pattern_lines(regex, prefix, content, lowered, newlines))
+    hits.sort()
+
+    found = []
+    for index, i in hits:
+        start = newlines[index - 1] + 1 if index else 0
+        end = newlines[index] if index < len(newlines) else len(content)
+        line = content[start:end]
+        _, name, severity, category, _ = _PATTERN_REGEXES[i]
+        found.append((index + 1, name, severity, category, line.strip()[:80]))
+    return found
+
+
+def scan_file_patterns(filepath: Path, project_path: str, content: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Dangerous-pattern findings for one file, in line order."""
+    findings = []
+    try:
+        if content is None:
+            content = read_text(filepath, errors='ignore')
+
+        for line_num, name, severity, category, snippet in find_dangerous_patterns(content):
+            findings.append({
+                "file": str(filepath.relative_to(project_path)),
+                "line": line_num,
+                "pattern": name,
+                "severity": severity,
+                "category": category,
+                "snippet": snippet
+            })
+
+    except Exception:
+        pass
+    return findings
+
+
+def scan_code_patterns(project_path: str, jobs: int = 1) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
@@ -246,36 +527,14 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
         "by_category": {}
     }
 
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
+    files = [f for f in get_snapshot(project_path).files(SKIP_DIRS) if f.suffix.lower() in CODE_EXTENSIONS]
+    for _, findings in scan_files(project_path, "security_patterns", files, scan_file_patterns, jobs):
+        results["scanned_files"] += 1
 
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-
-            except Exception:
-                pass
+        for finding in findings:
+            results["findings"].append(finding)
+            category = finding["category"]
+            results["by_category"][category] = results["by_category"].get(category, 0) + 1
 
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
@@ -293,7 +552,27 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_file_config(filepath: Path, project_path: str, content: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Configuration findings for one config file."""
+    findings = []
+    try:
+        if content is None:
+            content = read_text(filepath, errors='ignore')
+
+        for pattern, issue, severity in CONFIG_ISSUES:
+            if re.search(pattern, content, re.IGNORECASE):
+                findings.append({
+                    "file": str(filepath.relative_to(project_path)),
+                    "issue": issue,
+                    "severity": severity
+                })
+
+    except Exception:
+        pass
+    return findings
+
+
+def scan_configuration(project_path: str, jobs: int = 1) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
@@ -306,54 +585,26 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
     }
 
     # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-
-            filepath = Path(root) / file
-
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-
-            except Exception:
-                pass
+    files = [f for f in get_snapshot(project_path).files(SKIP_DIRS)
+             if f.suffix.lower() in CONFIG_EXTENSIONS or f.name in ['next.config.js', 'webpack.config.js', '.eslintrc.js']]
+    for _, findings in scan_files(project_path, "security_config", files, scan_file_config, jobs):
+        results["findings"].extend(findings)
 
-    # Check for security header configurations
+    # Check for security header configurations (project-level: a scoped run only checks it if one changed)
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
-    for hf in header_files:
-        hf_path = Path(project_path) / hf
-        if hf_path.exists():
-            results["checks"]["security_headers_config"] = True
-            break
-    else:
-        results["checks"]["security_headers_config"] = False
-        results["findings"].append({
-            "issue": "No security headers configuration found",
-            "severity": "medium",
-            "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
-        })
+    if changed_in_scope(project_path, set(header_files)):
+        for hf in header_files:
+            hf_path = Path(project_path) / hf
+            if hf_path.exists():
+                results["checks"]["security_headers_config"] = True
+                break
+        else:
+            results["checks"]["security_headers_config"] = False
+            results["findings"].append({
+                "issue": "No security headers configuration found",
+                "severity": "medium",
+                "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
+            })
 
     if any(f["severity"] == "critical" for f in results["findings"]):
         results["status"] = "[!!] CRITICAL: Configuration issues"
@@ -369,8 +620,8 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all", jobs: int = 1) -> Dict[str, Any]:
+    """Execute security validation scans (the file scans on `jobs` worker processes)."""
 
     report = {
         "project": project_path,
@@ -387,9 +638,9 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
 
     scanners = {
         "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
+        "secrets": ("secrets", partial(scan_secrets, jobs=jobs)),
+        "patterns": ("code_patterns", partial(scan_code_patterns, jobs=jobs)),
+        "config": ("configuration", partial(scan_configuration, jobs=jobs)),
     }
 
     for key, (name, scanner) in scanners.items():
@@ -418,7 +669,24 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
+def run(project_path: str, url: Optional[str] = None, context: Optional[dict] = None) -> dict:
+    """In-process entry point for verify_all.py: the default CLI run, without printing or exiting."""
+    if not os.path.isdir(project_path):
+        return {"passed": False, "output": json.dumps({"error": f"Directory not found: {project_path}"})}
+
+    get_snapshot(project_path, context)
+    report = run_full_scan(project_path)
+    return {"passed": True, "output": json.dumps(report, indent=2), "report": report}
+
+
 def main():
+    # Fix Windows console encoding for Unicode output
+    try:
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    except AttributeError:
+        pass  # Python < 3.7
+
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
     )
@@ -427,14 +695,18 @@ def main():
                         default="all", help="Type of scan to run")
     parser.add_argument("--output", choices=["json", "summary"], default="json",
                         help="Output format")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for the secret, pattern and config scans (0 = one per CPU, default: 1)")
 
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
 
     if not os.path.isdir(args.project_path):
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
 
-    result = run_full_scan(args.project_path, args.scan_type)
+    result = run_full_scan(args.project_path, args.scan_type, args.jobs or os.cpu_count() or 1)
 
     if args.output == "summary":
         print(f"\n{'='*60}")
@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENT_DIR = Path(__file__).resolve().parents[2] / ".agent"
+sys.path.insert(0, str(AGENT_DIR / "scripts"))
+sys.path.insert(0, str(AGENT_DIR / "skills" / "vulnerability-scanner" / "scripts"))
+
+import project_snapshot  # noqa: E402
+import security_scan  # noqa: E402
+from project_snapshot import ProjectSnapshot, changed_files, persist_snapshot  # noqa: E402
+
+GIT_ENV = {"GIT_AUTHOR_NAME": "test", "GIT_AUTHOR_EMAIL": "test@example.com",
+           "GIT_COMMITTER_NAME": "test", "GIT_COMMITTER_EMAIL": "test@example.com"}
+
+
+def git(root, *args):
+    subprocess.run(["git", "-C", str(root), *args], check=True, capture_output=True, env={**os.environ, **GIT_ENV})
+
+
+def write(root, rel, text):
+    (root / rel).parent.mkdir(parents=True, exist_ok=True)
+    (root / rel).write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """main with a few files; feature branched off it, then main moved on."""
+    monkeypatch.setattr(project_snapshot, "_TREES", {})
+    monkeypatch.setattr(project_snapshot, "_SNAPSHOTS", {})
+    monkeypatch.setenv("AGENT_FINDINGS_CACHE", "off")
+    root = tmp_path / "repo"
+    root.mkdir()
+    git(root, "init", "-q", "-b", "main")
+    for rel in ["package.json", "src/edited.ts", "src/committed.ts", "src/renamed.ts", "src/deleted.ts",
+                "src/untouched.ts", "src/main_only.ts", "docs/readme.md"]:
+        write(root, rel, "const value = 1;\n")
+    write(root, ".gitignore", "dist/\n")
+    git(root, "add", "-A")
+    git(root, "commit", "-q", "-m", "base")
+
+    git(root, "checkout", "-q", "-b", "feature")
+    write(root, "src/committed.ts", "const value = eval(input);\n")
+    git(root, "mv", "src/renamed.ts", "src/moved.ts")
+    git(root, "commit", "-q", "-am", "feature work")
+
+    git(root, "checkout", "-q", "main")
+    write(root, "src/main_only.ts", "const value = 2;\n")
+    git(root, "commit", "-q", "-am", "main moves on")
+    git(root, "checkout", "-q", "feature")
+
+    write(root, "src/edited.ts", "const value = eval(other);\n")  # uncommitted
+    (root / "src/deleted.ts").unlink()
+    write(root, "src/untracked.ts", "const value = eval(more);\n")
+    write(root, "dist/bundle.js", "eval(x);\n")  # ignored
+    return root
+
+
+def test_changed_files_since_merge_base(repo):
+    assert changed_files(repo, "main") == [
+        "src/committed.ts", "src/deleted.ts", "src/edited.ts", "src/moved.ts", "src/renamed.ts",
+        "src/untracked.ts",
+    ]
+
+
+def test_changed_files_ignores_files_only_touched(repo):
+    os.utime(repo / "src/untouched.ts", ns=(1, 1))  # same content, new mtime
+    assert "src/untouched.ts" not in changed_files(repo, "main")
+
+
+def test_changed_files_are_relative_to_a_subdirectory(repo):
+    write(repo, "docs/guide.md", "# guide\n")
+    assert changed_files(repo / "docs", "main") == ["guide.md"]
+
+
+def test_changed_files_rejects_unknown_ref(repo):
+    with pytest.raises(ValueError):
+        changed_files(repo, "no-such-branch")
+
+
+def test_scoped_snapshot_lists_only_changed_files_that_exist(repo):
+    snapshot = ProjectSnapshot.from_files(repo, changed_files(repo, "main"))
+    assert snapshot.scoped
+    assert list(snapshot.entries) == ["src/committed.ts", "src/edited.ts", "src/moved.ts", "src/untracked.ts"]
+
+
+@pytest.mark.parametrize("changed, expected", [
+    (["src/edited.ts"], False),
+    (["src/edited.ts", "package.json"], True),
+    (None, True),  # not scoped: the whole tree is in scope
+])
+def test_changed_in_scope(repo, changed, expected):
+    if changed is None:
+        project_snapshot._TREES[os.path.realpath(repo)] = ProjectSnapshot.build(repo)
+    else:
+        project_snapshot._TREES[os.path.realpath(repo)] = ProjectSnapshot.from_files(repo, changed)
+    assert security_scan.changed_in_scope(str(repo), security_scan.DEPENDENCY_FILES) is expected
+
+
+def test_since_scan_reports_only_changed_files(repo):
+    saved = persist_snapshot(repo, changed_files(repo, "main"))
+    try:
+        patterns = security_scan.scan_code_patterns(str(repo))
+        dependencies = security_scan.scan_dependencies(str(repo))
+    finally:
+        os.remove(saved)
+    assert sorted({finding["file"] for finding in patterns["findings"]}) == [
+        "src/committed.ts", "src/edited.ts", "src/untracked.ts",
+    ]
+    assert dependencies["status"] == "[OK] Skipped: no manifest or lockfile changed"
@@ -0,0 +1,84 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / ".agent" / "scripts"))
+
+from check_scheduler import CheckScheduler, run_command  # noqa: E402
+
+
+class Recorder:
+    """run() for the scheduler that logs when each task starts and ends."""
+
+    def __init__(self, durations):
+        self.durations = durations
+        self.events = []
+        self.lock = threading.Lock()
+
+    def __call__(self, task):
+        with self.lock:
+            self.events.append(("start", task))
+        time.sleep(self.durations.get(task, 0.01))
+        with self.lock:
+            self.events.append(("end", task))
+        return {"name": task}
+
+
+def test_results_come_back_in_task_order():
+    tasks = ["slow", "fast", "medium"]
+    run = Recorder({"slow": 0.2, "fast": 0.01, "medium": 0.05})
+    with CheckScheduler(workers=3) as scheduler:
+        results = list(scheduler.run(tasks, run))
+    assert [task for task, _ in results] == tasks
+    assert [result["name"] for _, result in results] == tasks
+    assert run.events.index(("end", "fast")) < run.events.index(("end", "slow"))  # they did overlap
+
+
+def test_exclusive_task_waits_for_earlier_tasks_and_runs_alone():
+    tasks = ["a", "b", "lighthouse", "c", "d"]
+    run = Recorder({"a": 0.1, "b": 0.05, "lighthouse": 0.05})
+    with CheckScheduler(workers=4) as scheduler:
+        results = list(scheduler.run(tasks, run, exclusive=lambda task: task == "lighthouse"))
+
+    assert [task for task, _ in results] == tasks
+    start, end = run.events.index(("start", "lighthouse")), run.events.index(("end", "lighthouse"))
+    assert run.events[start - 2:start] in ([("end", "a"), ("end", "b")], [("end", "b"), ("end", "a")])
+    assert run.events[end - 1] == ("start", "lighthouse")  # nothing started or ended while it ran
+    assert {("start", "c"), ("start", "d")} <= set(run.events[end + 1:])
+
+
+@pytest.mark.parametrize("workers", [1, 0])
+def test_one_worker_runs_tasks_one_at_a_time(workers):
+    run = Recorder({})
+    with CheckScheduler(workers=workers) as scheduler:
+        list(scheduler.run(["a", "b", "c"], run))
+    assert run.events == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b"), ("start", "c"), ("end", "c")]
+
+
+def test_close_cancels_pending_and_terminates_running_checks():
+    sleeper = [sys.executable, "-c", "import time; time.sleep(30)"]
+    returncodes, started = {}, []
+
+    def run(task):
+        started.append(task)
+        if task == "fail":
+            time.sleep(0.2)  # "sleep" starts its subprocess meanwhile
+            return {"passed": False}
+        returncodes[task] = run_command(sleeper, timeout=60).returncode
+        return {"passed": returncodes[task] == 0}
+
+    start = time.monotonic()
+    with CheckScheduler(workers=2) as scheduler:
+        # The worker freed by "fail" takes "sleep2", so "never" is still queued at close()
+        for task, result in scheduler.run(["fail", "sleep", "sleep2", "never"], run):
+            assert task == "fail" and not result["passed"]
+            scheduler.close()
+            break
+    scheduler.executor.shutdown(wait=True)
+
+    assert "never" not in started
+    assert "sleep" in returncodes and all(code != 0 for code in returncodes.values())
+    assert time.monotonic() - start < 10
@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / ".agent" / "scripts"))
+
+import findings_cache  # noqa: E402
+import project_snapshot  # noqa: E402
+from findings_cache import CACHE_ENV, FindingsCache, content_hash  # noqa: E402
+from project_snapshot import ProjectSnapshot  # noqa: E402
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(findings_cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(project_snapshot, "_TREES", {})
+    monkeypatch.setattr(project_snapshot, "_SNAPSHOTS", {})
+    monkeypatch.delenv(project_snapshot.SNAPSHOT_ENV, raising=False)
+    monkeypatch.delenv(CACHE_ENV, raising=False)
+    root = tmp_path / "project"
+    (root / "src").mkdir(parents=True)
+    (root / "src/a.ts").write_text("eval(a)\n", encoding="utf-8")
+    (root / "src/b.ts").write_text("ok\n", encoding="utf-8")
+    (tmp_path / "rules.py").write_text("RULES = ['eval']\n", encoding="utf-8")
+    return root
+
+
+def _scan(root, calls):
+    """One scanner run: findings per file, counting real evaluations in calls"""
+    rules = root.parent / "rules.py"
+    cache = FindingsCache(root, "test_scanner", rules)
+
+    def evaluate(path):
+        calls.append(path.name)
+        return ["eval"] if "eval" in path.read_text(encoding="utf-8") else []
+
+    found = {path.name: cache.findings(path, lambda: evaluate(path)) for path in sorted((root / "src").iterdir())}
+    cache.save()
+    return found, cache
+
+
+def _fresh_snapshots(monkeypatch):
+    """Next run in a new process: no snapshot left in memory"""
+    monkeypatch.setattr(project_snapshot, "_TREES", {})
+    monkeypatch.setattr(project_snapshot, "_SNAPSHOTS", {})
+
+
+def test_unchanged_files_are_replayed(project, monkeypatch):
+    calls = []
+    first, _ = _scan(project, calls)
+    _fresh_snapshots(monkeypatch)
+    second, cache = _scan(project, calls)
+    assert first == second == {"a.ts": ["eval"], "b.ts": []}
+    assert calls == ["a.ts", "b.ts"]
+    assert (cache.hits, cache.misses) == (2, 0)
+
+
+def test_changed_content_is_evaluated_again(project, monkeypatch):
+    calls = []
+    _scan(project, calls)
+    (project / "src/b.ts").write_text("eval(b)\n", encoding="utf-8")
+    _fresh_snapshots(monkeypatch)
+    found, cache = _scan(project, calls)
+    assert found == {"a.ts": ["eval"], "b.ts": ["eval"]}
+    assert calls == ["a.ts", "b.ts", "b.ts"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ruleset_change_invalidates_every_entry(project, monkeypatch):
+    calls = []
+    _scan(project, calls)
+    (project.parent / "rules.py").write_text("RULES = ['eval', 'exec']\n", encoding="utf-8")
+    _fresh_snapshots(monkeypatch)
+    _, cache = _scan(project, calls)
+    assert calls == ["a.ts", "b.ts", "a.ts", "b.ts"]
+    assert cache.hits == 0
+
+
+def test_cache_can_be_turned_off(project, monkeypatch):
+    monkeypatch.setenv(CACHE_ENV, "off")
+    calls = []
+    _scan(project, calls)
+    _scan(project, calls)
+    assert calls == ["a.ts", "b.ts", "a.ts", "b.ts"]
+    assert not findings_cache.CACHE_DIR.exists()
+
+
+def test_scoped_run_keeps_entries_of_files_it_did_not_see(project, monkeypatch):
+    calls = []
+    _scan(project, calls)
+    _fresh_snapshots(monkeypatch)
+    scoped = ProjectSnapshot.from_files(project, ["src/a.ts"])
+    monkeypatch.setitem(project_snapshot._TREES, str(project.resolve()), scoped)
+
+    cache = FindingsCache(project, "test_scanner", project.parent / "rules.py")
+    cache.findings(project / "src/a.ts", lambda: calls.append("a.ts"))
+    cache.save()
+    assert set(FindingsCache(project, "test_scanner", project.parent / "rules.py").entries) == {"src/a.ts",
+                                                                                                "src/b.ts"}
+
+
+def test_record_replays_findings_computed_elsewhere(project):
+    cache = FindingsCache(project, "test_scanner", project.parent / "rules.py")
+    digest = content_hash((project / "src/a.ts").read_bytes())
+    assert cache.cached_digest(project / "src/a.ts") is None
+    assert cache.record(project / "src/a.ts", digest, ["eval"]) == ["eval"]
+    cache.save()
+
+    cache = FindingsCache(project, "test_scanner", project.parent / "rules.py")
+    assert cache.cached_digest(project / "src/a.ts") == digest
+    assert cache.record(project / "src/a.ts", digest) == ["eval"]
+    assert cache.hits == 1
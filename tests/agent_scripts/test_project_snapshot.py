@@ -0,0 +1,107 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / ".agent" / "scripts"))
+
+import project_snapshot  # noqa: E402
+from project_snapshot import SNAPSHOT_ENV, ProjectSnapshot, get_snapshot, persist_snapshot  # noqa: E402
+
+FILES = {
+    "package.json": "{}\n",
+    "src/app.ts": "export const a = 1;\r\nexport const b = 2;\r\n",
+    "src/routes/users.ts": "export {};\n",
+    "src/routes/admin/index.tsx": "export {};\n",
+    "src/notes.md": "# notes\n",
+    "dist/bundle.js": "var a = 1;\n",
+    ".venv/lib/site.py": "x = 1\n",
+    "node_modules/pkg/index.js": "module.exports = 1;\n",
+    ".git/config": "[core]\n",
+}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(project_snapshot, "_TREES", {})
+    monkeypatch.setattr(project_snapshot, "_SNAPSHOTS", {})
+    monkeypatch.delenv(SNAPSHOT_ENV, raising=False)
+    for rel, text in FILES.items():
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_bytes(text.encode("utf-8"))
+    return tmp_path
+
+
+def _rels(snapshot, paths):
+    return [path.relative_to(snapshot.root).as_posix() for path in paths]
+
+
+def test_walk_prunes_only_node_modules_and_git(project):
+    snapshot = ProjectSnapshot.build(project)
+    assert list(snapshot.entries) == [
+        "package.json", ".venv/lib/site.py", "dist/bundle.js",
+        "src/app.ts", "src/notes.md", "src/routes/users.ts", "src/routes/admin/index.tsx",
+    ]
+    assert _rels(snapshot, snapshot.files({"dist", ".venv"})) == [
+        "package.json", "src/app.ts", "src/notes.md", "src/routes/users.ts", "src/routes/admin/index.tsx",
+    ]
+
+
+@pytest.mark.parametrize("pattern", ["**/*.ts", "**/*.tsx", "src/*.ts", "**/routes/*.ts", "**/routes/**/*.tsx",
+                                     "*.json", "src/?pp.ts"])
+def test_glob_matches_path_glob(project, pattern):
+    snapshot = ProjectSnapshot.build(project)
+    expected = {p for p in project.glob(pattern)
+                if p.is_file() and not {"node_modules", ".git"} & set(p.relative_to(project).parts)}
+    assert set(snapshot.glob(pattern)) == expected
+
+
+def test_read_text_uses_universal_newlines(project):
+    snapshot = ProjectSnapshot.build(project)
+    with open(project / "src/app.ts", encoding="utf-8") as f:
+        assert snapshot.read_text(project / "src/app.ts") == f.read()
+
+
+def test_preload_skips_build_output(project):
+    snapshot = ProjectSnapshot.build(project)
+    snapshot.preload()
+    assert set(snapshot.contents) == {"package.json", "src/app.ts", "src/routes/users.ts",
+                                      "src/routes/admin/index.tsx"}
+    assert snapshot.read_bytes(project / "dist/bundle.js") == b"var a = 1;\n"  # still readable on demand
+
+
+def test_saved_snapshot_round_trips_through_env(project, monkeypatch):
+    saved = persist_snapshot(project)
+    try:
+        built = project_snapshot._TREES[os.path.realpath(project)]
+        monkeypatch.setattr(project_snapshot, "_TREES", {})
+        monkeypatch.setattr(project_snapshot, "_SNAPSHOTS", {})
+        monkeypatch.setenv(SNAPSHOT_ENV, str(saved))
+
+        loaded = get_snapshot(str(project))
+        assert loaded.verify and not loaded.scoped
+        assert loaded.entries == built.entries and loaded.contents == built.contents
+        assert get_snapshot(str(project)) is loaded
+        assert project_snapshot.read_text(project / "src/app.ts") == "export const a = 1;\nexport const b = 2;\n"
+    finally:
+        os.remove(saved)
+
+
+def test_saved_snapshot_notices_later_edits(project, tmp_path_factory):
+    saved = ProjectSnapshot.build(project)
+    saved.preload()
+    path = saved.save(tmp_path_factory.mktemp("saved") / "snap.bin")
+
+    (project / "src/app.ts").write_text("export const edited = true;\n", encoding="utf-8")
+    os.utime(project / "src/app.ts", ns=(1, 1))
+    loaded = ProjectSnapshot.load(path, project)
+    assert loaded.read_text(project / "src/app.ts") == "export const edited = true;\n"
+    assert ProjectSnapshot.load(path, tmp_path_factory.mktemp("other")) is None  # saved for another root
+
+
+def test_from_files_lists_only_existing_changed_files(project):
+    snapshot = ProjectSnapshot.from_files(project, ["src/routes/users.ts", "package.json", "deleted.ts",
+                                                    "node_modules/pkg/index.js", "src/app.ts"])
+    assert snapshot.scoped
+    assert list(snapshot.entries) == ["package.json", "src/app.ts", "src/routes/users.ts"]
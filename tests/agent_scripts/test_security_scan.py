@@ -0,0 +1,113 @@
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENT_DIR = Path(__file__).resolve().parents[2] / ".agent"
+sys.path.insert(0, str(AGENT_DIR / "scripts"))
+sys.path.insert(0, str(AGENT_DIR / "skills" / "vulnerability-scanner" / "scripts"))
+
+import security_scan  # noqa: E402
+from findings_cache import CACHE_ENV  # noqa: E402
+
+
+def reference_find_secrets(content):
+    """find_secrets as it was: one re.findall per SECRET_PATTERNS entry"""
+    counts = [(secret_type, severity, len(re.findall(pattern, content, re.IGNORECASE)))
+              for pattern, secret_type, severity, _ in security_scan.SECRET_PATTERNS]
+    return [secret for secret in counts if secret[2]]
+
+
+# Literals are split inside their anchors so that security_scan.py does not report this file itself
+SECRET_SAMPLES = [
+    # Anchors that differ from the pattern only by case (ASCII fast path)
+    'const ApI_' + 'KeY = "0123456789abcdef";\nTOK' + 'EN: "abcdefghijklmnop"\nAuthorization: BeAr' + 'Er abc.def-ghi',
+    "ak" + "ia0123456789abcdef AK" + "IA0123456789ABCDEF aK" + "iA0123456789ABCDEf",
+    "-----begin " + "rsa key----- -----BEGIN " + "Private KEY----- SSH-" + "RSA AAAAB3Nza+/",
+    "EY" + "JhbGciOi.eyJzdWIiOi.c2lnbmF0dXJl Postgres:" + "//admin:pw@db/stock PASS" + "WORD = 'hunter22'",
+    "bearerbear" + "er bear" + "er bear" + "er x",
+    # Non-ASCII content (regex path), including characters that case-fold to ASCII letters
+    'const café = 1;\nconst API_' + 'KEY = "0123456789abcdef"; // clé\ntok' + 'en = "ééééééééééé"',
+    "api_\u212aey = '0123456789ab'",  # KELVIN SIGN matches 'k' under IGNORECASE
+    "pa\u017f\u017fword = 'hunter22'",  # LATIN SMALL LETTER LONG S matches 's'
+    "İİİ bear" + "er abc İ Bear" + "er def",  # 'İ'.lower() is two characters long
+    "日本語 AK" + "IA0123456789ABCDEF ключ GOOGLE_" + "CLIENT_SECRET: 'x'",
+    "",
+]
+
+
+@pytest.mark.parametrize("content", SECRET_SAMPLES)
+def test_find_secrets_matches_reference(content):
+    assert security_scan.find_secrets(content) == reference_find_secrets(content)
+
+
+def reference_find_dangerous_patterns(content):
+    """find_dangerous_patterns as it was: every pattern searched line by line"""
+    found = []
+    for line_num, line in enumerate(content.split('\n'), 1):
+        for pattern, name, severity, category, _ in security_scan.DANGEROUS_PATTERNS:
+            if re.search(pattern, line, re.IGNORECASE):
+                found.append((line_num, name, severity, category, line.strip()[:80]))
+    return found
+
+
+# Split inside their keywords, like SECRET_SAMPLES
+PATTERN_SAMPLES = [
+    "x = 1\r\ny = ev" + "al(data)\r\nsub" + "process.call(cmd, shell=True)\r\n",  # CRLF kept as is
+    "import os\nresult = EV" + "AL (code)",  # match on the last line, no trailing newline
+    "sub" + "process.call(\n    cmd, shell=True)\nyaml." + "load(\n  data) , Loader=x\n",  # calls spread over lines
+    "yaml." + "load(data)\n, Loader=SafeLoader\nyaml." + "load(data) , Loader=SafeLoader",
+    'query = "SEL' + 'ECT * " +\n user + " WHERE"\nq = "a" + name + "b" DEL' + 'ETE\nf"SEL' + 'ECT\n{x}"',
+    "veri" + "fy =\nFalse\npick" + "le .\nloads(x)\nel.inner" + "HTML \t= html\t\r\n",
+    "const café = ev" + "al(x); // clé\nnew  " + "Function\xa0(body)\n",
+    "ev" + "al(",
+    "",
+]
+
+
+@pytest.mark.parametrize("content", PATTERN_SAMPLES)
+def test_find_dangerous_patterns_matches_reference(content):
+    assert security_scan.find_dangerous_patterns(content) == reference_find_dangerous_patterns(content)
+
+
+@pytest.mark.parametrize("pattern", [
+    r'foo[\s,]+bar',  # \s in a set would let the set match a newline
+    r'\[^x',  # escaped bracket: not a negated class
+    r'a\Sb', r'a\Wb', r'a\Db', r'a\nb',
+    r'^eval', r'eval\($',  # line anchors mean something else over a whole file
+    r'(?s)a.b',
+])
+def test_patterns_that_cannot_stay_within_a_line_are_rejected(pattern):
+    with pytest.raises(ValueError):
+        security_scan._within_line(pattern)
+
+
+def test_within_line_rewrites_spaces_and_negated_classes():
+    assert security_scan._within_line(r'a\s*[^)]*[]x][^\s]\.') == r'a[^\S\n]*[^\n)]*[]x][^\n\s]\.'
+
+
+def test_parallel_cli_run_matches_serial(tmp_path):
+    """--jobs 2 from the command line: _scan_chunk has to pickle into spawned workers"""
+    for i in range(security_scan.PARALLEL_MIN_FILES + 100):
+        text = 'const key = ev' + 'al(input); API_' + 'KEY = "0123456789abcdef"\n' if i % 7 == 0 else "const ok = 1;\n"
+        (tmp_path / f"module_{i:04}.js").write_text(text, encoding="utf-8")
+    (tmp_path / "settings.yaml").write_text("debug = True\n", encoding="utf-8")
+
+    def run(jobs):
+        completed = subprocess.run([sys.executable, str(Path(security_scan.__file__)), str(tmp_path),
+                                    "--jobs", str(jobs)], capture_output=True, text=True, timeout=300,
+                                   env={**os.environ, CACHE_ENV: "off"})
+        assert completed.returncode in (0, 1), completed.stderr
+        result = json.loads(completed.stdout)
+        del result["timestamp"]
+        return result, completed.stderr
+
+    serial, _ = run(1)
+    parallel, progress = run(2)
+    assert parallel == serial
+    assert serial["scans"]["code_patterns"]["findings"]
+    assert f"[security_patterns] {len(list(tmp_path.glob('*.js')))}/" in progress
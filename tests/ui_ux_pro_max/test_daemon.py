@@ -0,0 +1,130 @@
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import daemon  # noqa: E402
+from core import search, search_many, search_stack  # noqa: E402
+from daemon import _handle_line, default_socket_path, handle_request, is_trusted_socket, request  # noqa: E402
+
+needs_unix_sockets = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no Unix sockets")
+
+
+@pytest.fixture
+def socket_dir():
+    """Private directory with a short path (AF_UNIX paths are limited to ~100 bytes)"""
+    path = Path(tempfile.mkdtemp(prefix="uipro-"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _stale_socket(path):
+    """A socket file nobody listens on, as left behind by a crashed daemon"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(path))
+    sock.close()
+
+
+@pytest.mark.parametrize("payload, expected", [
+    ({"op": "search", "query": "glassmorphism", "domain": "style"}, lambda: search("glassmorphism", "style")),
+    ({"op": "search_stack", "query": "forms", "stack": "react", "max_results": 2},
+     lambda: search_stack("forms", "react", 2)),
+    ({"op": "search_many", "queries": ["focus ring", "touch target"], "domain": "ux"},
+     lambda: search_many(["focus ring", "touch target"], "ux")),
+    ({"op": "ping"}, lambda: "pong"),
+])
+def test_ops_return_what_the_library_returns(payload, expected):
+    assert handle_request(dict(payload, id=7)) == {"id": 7, "ok": True, "result": expected()}
+
+
+def test_stats_op_reports_cache_counters():
+    result = handle_request({"op": "stats"})["result"]
+    assert set(result) == {"results", "indexes"} and "hit_rate" in result["results"]
+
+
+@pytest.mark.parametrize("payload, error", [
+    ({"op": "reindex", "id": "a"}, "ValueError: Unknown op: reindex"),
+    ({"op": "search", "id": "a"}, "KeyError: 'query'"),
+])
+def test_failed_requests_get_an_error_envelope(payload, error):
+    assert handle_request(payload) == {"id": "a", "ok": False, "error": error}
+
+
+@pytest.mark.parametrize("line", ["{not json", "[1, 2]", '"ping"'])
+def test_malformed_lines_get_an_error_envelope(line):
+    response = json.loads(_handle_line(line))
+    assert response["id"] is None and response["ok"] is False
+    assert response["error"].startswith("Invalid request: ")
+
+
+def test_stdio_server_answers_each_line_in_order():
+    lines = ['{"op": "ping", "id": 1}', "", "{oops", '{"op": "search", "query": "glassmorphism", "id": 2}',
+             '{"op": "nope", "id": 3}']
+    completed = subprocess.run([sys.executable, str(SCRIPTS_DIR / "search.py"), "--serve", "--stdio"],
+                               input="\n".join(lines) + "\n", capture_output=True, text=True, timeout=120,
+                               check=True)
+    responses = [json.loads(line) for line in completed.stdout.splitlines()]
+    assert [(r["id"], r["ok"]) for r in responses] == [(1, True), (None, False), (2, True), (3, False)]
+    assert responses[2]["result"] == search("glassmorphism")
+
+
+def test_default_socket_prefers_xdg_runtime_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv(daemon.SOCKET_ENV, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket_path() == tmp_path / "ui-ux-pro-max.sock"
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "missing"))
+    assert default_socket_path().parent.name.startswith("ui-ux-pro-max-")  # a directory of its own
+
+
+@needs_unix_sockets
+def test_request_returns_none_without_a_daemon(socket_dir):
+    assert request({"op": "ping"}, socket_dir / "missing.sock") is None
+    _stale_socket(socket_dir / "stale.sock")
+    assert request({"op": "ping"}, socket_dir / "stale.sock") is None
+    (socket_dir / "file.sock").write_text("")
+    assert request({"op": "ping"}, socket_dir / "file.sock") is None
+
+
+@needs_unix_sockets
+def test_sockets_of_other_users_or_in_shared_directories_are_not_trusted(socket_dir, monkeypatch):
+    path = socket_dir / "search.sock"
+    _stale_socket(path)
+    assert is_trusted_socket(path)
+    socket_dir.chmod(0o777)  # anyone could replace the socket
+    assert not is_trusted_socket(path)
+    socket_dir.chmod(0o1777)  # ...unless the sticky bit stops them, as in /tmp
+    assert is_trusted_socket(path)
+    other_user = os.getuid() + 1
+    monkeypatch.setattr(daemon.os, "getuid", lambda: other_user)
+    assert not is_trusted_socket(path)
+
+
+@needs_unix_sockets
+def test_socket_server_replaces_a_stale_socket_and_cleans_up(socket_dir):
+    path = socket_dir / "search.sock"
+    _stale_socket(path)
+    server = subprocess.Popen([sys.executable, str(SCRIPTS_DIR / "search.py"), "--serve", "--socket", str(path)],
+                              stderr=subprocess.PIPE, text=True)
+    try:
+        deadline = time.monotonic() + 120
+        while request({"op": "ping", "id": 1}, path) is None:
+            assert server.poll() is None and time.monotonic() < deadline, server.stderr.read()
+            time.sleep(0.05)
+        assert path.stat().st_mode & 0o777 == 0o600
+        response = request({"op": "search", "query": "glassmorphism", "domain": "style"}, path)
+        assert response == {"id": None, "ok": True, "result": search("glassmorphism", "style")}
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+    assert not os.path.lexists(path)
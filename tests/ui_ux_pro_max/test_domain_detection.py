@@ -0,0 +1,44 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from core import DOMAIN_KEYWORDS, KeywordAutomaton, detect_domain, rank_domains  # noqa: E402
+
+KEYWORDS = sorted({keyword for keywords in DOMAIN_KEYWORDS.values() for keyword in keywords})
+
+
+def test_automaton_matches_substring_search():
+    automaton = KeywordAutomaton(KEYWORDS + ["he", "she", "his", "hers"])
+    rng = random.Random(0)
+    alphabet = "abcdehirsuxy #."
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        text += " " + rng.choice(KEYWORDS)
+        expected = {keyword for keyword in KEYWORDS + ["he", "she", "his", "hers"] if keyword in text}
+        assert automaton.find(text) == expected
+
+
+@pytest.mark.parametrize("query,domain", [
+    ("glassmorphism dark", "style"),
+    ("saas dashboard", "product"),
+    ("dynamic import server component", "react"),
+    ("hero cta conversion", "landing"),
+    ("focus outline aria", "web"),
+    ("useState hooks", "react"),
+    ("x", "style"),
+])
+def test_detect_domain(query, domain):
+    assert detect_domain(query) == domain
+
+
+def test_rank_domains_is_a_distribution():
+    ranked = rank_domains("color palette healthcare")
+    assert ranked[0][0] == "color"
+    assert [score for _, score in ranked] == sorted((score for _, score in ranked), reverse=True)
+    assert sum(score for _, score in ranked) == pytest.approx(1.0, abs=0.01)
+    assert rank_domains("") == [("style", 1.0)]
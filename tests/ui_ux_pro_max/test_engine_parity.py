@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from core import AVAILABLE_STACKS, CSV_CONFIG, search, search_all, search_stack  # noqa: E402
+
+DOMAIN_QUERIES = [
+    "glassmorphism dark",
+    "saas dashboard",
+    "accessibility animation keyboard",
+    "elegant luxury serif",
+    "fintech crypto",
+    "chart trend bar",
+    "color palette healthcare",
+    "hero cta conversion",
+    "memo rerender",
+    "focus outline aria",
+    "glasmorphism dashbord",
+    "acessibility keybaord",
+    '"dark mode" glass',
+    '"touch target" mobile',
+    '"dynamic imports"',
+]
+
+STACK_QUERIES = [
+    "layout responsive form",
+    "dynamic import server component",
+    "accessibility keyboard",
+    "image optimization",
+    "state management",
+]
+
+
+@pytest.mark.parametrize("domain", list(CSV_CONFIG))
+@pytest.mark.parametrize("query", DOMAIN_QUERIES)
+def test_fts5_matches_python_bm25_for_domains(query, domain):
+    python_results = search(query, domain, 3)["results"]
+    fts5_results = search(query, domain, 3, engine="fts5")["results"]
+    assert fts5_results == python_results
+
+
+@pytest.mark.parametrize("stack", AVAILABLE_STACKS)
+@pytest.mark.parametrize("query", STACK_QUERIES)
+def test_fts5_matches_python_bm25_top_result_for_stacks(query, stack):
+    python_results = search_stack(query, stack, 3)["results"]
+    fts5_results = search_stack(query, stack, 3, engine="fts5")["results"]
+    assert fts5_results[:1] == python_results[:1]
+
+
+def test_federated_search_rejects_other_rankings_and_engines():
+    assert search("saas dashboard", "all", 3) == search_all("saas dashboard", 3)
+    for option, value in (("ranking", "bm25f"), ("engine", "fts5")):
+        result = search("saas dashboard", "all", 3, **{option: value})
+        assert set(result) == {"error", "domain"} and result["domain"] == "all"
+        assert f'{option}="{value}"' in result["error"]
+
+
+@pytest.mark.parametrize("arguments, error", [
+    ({"domain": "styles"}, "Unknown domain: styles"),
+    ({"ranking": "tfidf"}, "Unknown ranking: tfidf"),
+    ({"engine": "lucene"}, "Unknown engine: lucene"),
+])
+def test_search_returns_an_error_dict_for_unknown_arguments(arguments, error):
+    result = search("saas dashboard", **arguments)
+    assert result["error"].startswith(error) and result["domain"] == arguments.get("domain")
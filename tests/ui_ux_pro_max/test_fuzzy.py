@@ -0,0 +1,108 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from core import FuzzyIndex, best_correction, deletes, edit_distance, max_edit_distance  # noqa: E402
+
+TERMS = {"tables": 5, "tablet": 2, "carps": 3, "carts": 3, "glassmorphism": 4, "grid": 9}
+
+
+def _index(terms=TERMS):
+    """FuzzyIndex over {term: document frequency}, shaped like BM25's vocabulary arrays"""
+    names = list(terms)
+    return FuzzyIndex({term: i for i, term in enumerate(names)}, names, [terms[term] for term in names])
+
+
+@pytest.mark.parametrize("token, edits", [
+    ("", 0), ("grid", 0), ("table", 1), ("darkmode", 1), ("dashboard", 2), ("glassmorphism", 2),
+])
+def test_edits_tolerated_grow_at_5_and_9_characters(token, edits):
+    assert max_edit_distance(token) == edits
+
+
+def test_deletes_reach_every_shorter_string():
+    assert deletes("abc", 1) == {"abc", "bc", "ac", "ab"}
+    assert deletes("abc", 2) == {"abc", "bc", "ac", "ab", "a", "b", "c"}
+
+
+@pytest.mark.parametrize("a, b, limit, distance", [
+    ("tables", "tables", 1, 0),
+    ("tables", "tbales", 1, 1),  # adjacent transposition is one edit
+    ("color", "colour", 1, 1),
+    ("ca", "abc", 3, 3),  # optimal string alignment: no edits inside a transposed pair
+    ("kitten", "sitting", 3, 3),
+    ("kitten", "sitting", 1, 2),  # capped at limit + 1
+    ("grid", "glassmorphism", 2, 3),  # lengths alone exceed the limit
+])
+def test_edit_distance_is_osa_capped_at_limit(a, b, limit, distance):
+    assert edit_distance(a, b, limit) == distance
+    assert edit_distance(b, a, limit) == distance
+
+
+@pytest.mark.parametrize("token, correction", [
+    ("tablex", "tables"),  # tablet is as close, tables is in more documents
+    ("carns", "carps"),  # same distance and frequency: alphabetical
+    ("tbales", "tables"),
+    ("glasmorphsim", "glassmorphism"),  # 13 characters: two edits
+    ("grdi", None),  # 4 characters: no edits
+    ("tab", None),
+])
+def test_best_correction_ranks_distance_then_frequency_then_term(token, correction):
+    assert best_correction(token, TERMS) == correction
+
+
+def test_correct_finds_candidates_through_the_delete_dictionary():
+    fuzzy = _index()
+    assert fuzzy.correct("tables") == "tables"
+    assert fuzzy.correct("tablex") == "tables"
+    assert fuzzy.correct("tbales") == "tables"
+    assert fuzzy.correct("glasmorphsim") == "glassmorphism"
+    assert fuzzy.correct("zebra") is None
+    assert set(fuzzy.candidates("tablex")) == {"tables", "tablet"}
+
+
+def test_known_words_of_other_csvs_are_never_rewritten():
+    fuzzy = _index()
+    asked = []
+
+    def is_known_word(token):
+        asked.append(token)
+        return token == "tablex"
+
+    assert fuzzy.correct("tablex", is_known_word) is None
+    assert fuzzy.correct("carns", is_known_word) == "carps"
+    assert fuzzy.correct("tables", is_known_word) == "tables"  # indexed words never reach is_known_word
+    assert asked == ["tablex", "carns"]
+
+
+def test_corrections_are_memoised_per_index(monkeypatch):
+    fuzzy, other = _index(), _index()
+    lookups = []
+    candidates = fuzzy.candidates
+    monkeypatch.setattr(fuzzy, "candidates", lambda token: lookups.append(token) or candidates(token))
+    assert fuzzy.correct("tablex") == fuzzy.correct("tablex") == "tables"
+    assert fuzzy.correct("tablex", lambda token: True) == "tables"  # the memo answers first
+    assert lookups == ["tablex"] and fuzzy.corrections == {"tablex": "tables"}
+    assert other.corrections == {}
+
+    fuzzy.track_vocabulary(("csvs", 1))  # another CSV changed: corrections are made again
+    assert fuzzy.correct("tablex", lambda token: True) is None
+    fuzzy.track_vocabulary(("csvs", 1))
+    assert fuzzy.corrections == {"tablex": None}
+
+
+def test_added_terms_and_copies():
+    fuzzy = _index()
+    assert fuzzy.correct("zebrs") is None
+    clone = fuzzy.copy(dict(fuzzy.vocab), list(fuzzy.terms), list(fuzzy.doc_freqs))
+    clone.vocab["zebra"] = len(clone.terms)
+    clone.terms.append("zebra")
+    clone.doc_freqs.append(1)
+    clone.add(clone.vocab["zebra"])
+
+    assert clone.correct("zebrs") == "zebra"  # add() drops the memoised None
+    assert fuzzy.correct("zebrs") is None and "zebra" not in fuzzy.candidates("zebrs")
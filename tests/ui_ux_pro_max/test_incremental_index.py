@@ -0,0 +1,136 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import core  # noqa: E402
+from core import CSV_CONFIG, DATA_DIR, _build_index, _load_index  # noqa: E402
+
+SEARCH_COLS = CSV_CONFIG["ux"]["search_cols"]
+LINES = (DATA_DIR / CSV_CONFIG["ux"]["file"]).read_bytes().rstrip(b"\r\n").splitlines(keepends=True)
+QUERIES = ["focus ring keyboard", "touch target size mobile", "animaton", "z-index stacking", "loading skeleton"]
+ARRAYS = ("terms", "offsets", "doc_ids", "tfs", "doc_lengths", "idf", "doc_freqs", "max_tfs", "min_lengths")
+
+
+@pytest.fixture
+def csv_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(core, "INDEX_DIR", tmp_path / ".index")
+    monkeypatch.setattr(core, "_INDEX_CACHE", {})
+    path = tmp_path / "ux.csv"
+    path.write_bytes(b"".join(LINES[:40]) + b"\n")
+    return path
+
+
+def _append(path, lines):
+    with open(path, "ab") as f:
+        f.write(b"".join(lines) + b"\n")
+
+
+def _assert_same_index(left, right):
+    (data, bm25), (expected_data, expected) = left, right
+    bm25._refresh()
+    assert data == expected_data
+    assert bm25.avgdl == expected.avgdl and bm25.source == expected.source
+    for name in ARRAYS:
+        assert list(getattr(bm25, name)) == list(getattr(expected, name)), name
+    for term_id in range(len(expected.terms)):
+        for doc_id in expected.doc_ids[expected.offsets[term_id]:expected.offsets[term_id + 1]]:
+            assert bm25.doc_positions(term_id, doc_id) == expected.doc_positions(term_id, doc_id)
+    for query in QUERIES:
+        assert bm25.score(query, 5) == expected.score(query, 5), query
+        assert bm25.score_top_k(query, 5) == expected.score_top_k(query, 5), query
+
+
+@pytest.mark.parametrize("from_disk", [False, True], ids=["memory", "disk"])
+def test_appended_rows_match_full_rebuild(csv_file, monkeypatch, from_disk):
+    _load_index(csv_file, SEARCH_COLS)
+    if from_disk:
+        monkeypatch.setattr(core, "_INDEX_CACHE", {})
+    _append(csv_file, [line.rstrip(b"\r\n") + b"\n" for line in LINES[40:-1]])
+    _append(csv_file, [LINES[-1]])
+
+    appends, builds = core._INDEX_STATS["appends"], core._INDEX_STATS["builds"]
+    _load_index(csv_file, SEARCH_COLS)
+    result = _load_index(csv_file, SEARCH_COLS)
+    assert not result[1]._pending  # merged before the index was shared
+    assert core._INDEX_STATS["appends"] == appends + 1 and core._INDEX_STATS["builds"] == builds
+    _assert_same_index(result, _build_index(csv_file, SEARCH_COLS))
+
+
+def test_append_leaves_the_published_index_untouched(csv_file):
+    data, bm25 = _load_index(csv_file, SEARCH_COLS)
+    before = {name: list(getattr(bm25, name)) for name in ARRAYS + ("positions",)}
+    vocab, corrections = dict(bm25.vocab), dict(bm25.fuzzy.corrections)
+    _append(csv_file, [b"999,Novelty,Zyzzyva widget,All,Zyzzyva appended row,,,,,Low"])
+
+    new_data, new_bm25 = _load_index(csv_file, SEARCH_COLS)
+    assert new_bm25 is not bm25 and new_bm25.fuzzy is not bm25.fuzzy and len(new_data) == len(data) + 1
+    assert {name: list(getattr(bm25, name)) for name in before} == before
+    assert bm25.vocab == vocab and bm25.fuzzy.corrections == corrections and "zyzzyva" not in bm25.vocab
+
+
+def test_appended_rows_are_searchable(csv_file):
+    data, bm25 = _load_index(csv_file, SEARCH_COLS)
+    _append(csv_file, [b"999,Novelty,Zyzzyva widget,All,Zyzzyva appended row,,,,,Low"])
+    data, bm25 = _load_index(csv_file, SEARCH_COLS)
+    assert bm25.score("zyzzyva", 1)[0][0] == len(data) - 1
+    assert data[-1]["Issue"] == "Zyzzyva widget"
+
+
+def test_queries_run_while_rows_are_appended(csv_file):
+    data, bm25 = _load_index(csv_file, SEARCH_COLS)
+    rows, before = len(data), {query: bm25.score(query, 5) for query in QUERIES}
+    stop, errors = threading.Event(), []
+
+    def query_loop():
+        try:
+            while not stop.is_set():
+                for query in QUERIES:
+                    assert bm25.score(query, 5) == before[query], query  # the shared copy never changes
+                    _load_index(csv_file, SEARCH_COLS)[1].score(query, 5)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=query_loop) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for line in LINES[40:80]:
+            _append(csv_file, [line.rstrip(b"\r\n")])
+            _load_index(csv_file, SEARCH_COLS)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    assert not errors
+    assert len(data) == rows
+    _assert_same_index(_load_index(csv_file, SEARCH_COLS), _build_index(csv_file, SEARCH_COLS))
+
+
+@pytest.mark.parametrize("edit", ["rewrite", "unterminated"])
+def test_other_changes_rebuild(csv_file, edit):
+    _load_index(csv_file, SEARCH_COLS)
+    if edit == "rewrite":
+        csv_file.write_bytes(csv_file.read_bytes().replace(b"Accessibility", b"A11y", 1) + LINES[45])
+    else:
+        csv_file.write_bytes(csv_file.read_bytes().rstrip(b"\n"))
+        _load_index(csv_file, SEARCH_COLS)  # old file no longer ends on a line break
+        _append(csv_file, [LINES[45]])
+
+    builds = core._INDEX_STATS["builds"]
+    result = _load_index(csv_file, SEARCH_COLS)
+    assert core._INDEX_STATS["builds"] == builds + 1
+    _assert_same_index(result, _build_index(csv_file, SEARCH_COLS))
+
+
+def test_bm25f_refits_on_append(csv_file):
+    _load_index(csv_file, SEARCH_COLS, ranking="bm25f")
+    _append(csv_file, [LINES[45]])
+    builds = core._INDEX_STATS["builds"]
+    data, bm25f = _load_index(csv_file, SEARCH_COLS, ranking="bm25f")
+    assert core._INDEX_STATS["builds"] == builds + 1 and len(data) == 40
@@ -0,0 +1,40 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import core  # noqa: E402
+from bench import multi_domain_queries, sample_long_queries  # noqa: E402
+from core import BM25, _index_targets, _load_index  # noqa: E402
+
+TARGETS = [(name, filepath, search_cols, boosts) for name, filepath, search_cols, boosts in _index_targets()
+           if filepath.exists()]
+
+
+@pytest.mark.parametrize("ranking", ["bm25", "bm25f"])
+@pytest.mark.parametrize("target", TARGETS, ids=[target[0] for target in TARGETS])
+def test_max_score_matches_exhaustive_top_k(target, ranking):
+    name, filepath, search_cols, boosts = target
+    data, bm25 = _load_index(filepath, search_cols, ranking=ranking, boosts=boosts)
+    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    queries = multi_domain_queries() + sample_long_queries(documents, 40, random.Random(name))
+
+    for query in queries:
+        tokens = [t for t in map(bm25.vocab.get, bm25.query_terms(query)) if t is not None]
+        for top_k in (1, 3, 10):
+            assert bm25._max_score(tokens, top_k) == bm25._exhaustive(tokens, top_k), query
+
+
+def test_max_score_prunes_large_corpus(monkeypatch):
+    monkeypatch.setattr(core, "PROXIMITY_WEIGHT", 0)  # bag-of-words ranking only
+    documents = [f"common filler words row{i} " + ("rare signal" if i % 500 == 0 else "") for i in range(5000)]
+    bm25 = BM25()
+    bm25.fit(documents)
+    tokens = [bm25.vocab[term] for term in ("rare", "signal", "common", "filler")]
+    top = bm25.score("rare signal common filler", 3)  # long postings: routed through MaxScore
+    assert top == bm25._exhaustive(tokens, 3)
+    assert [doc_id for doc_id, _ in top] == [0, 500, 1000]
@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import search as search_cli  # noqa: E402
+from design_system import (DesignSystemGenerator, format_page_override_md, load_page_manifest,  # noqa: E402
+                           page_file_name, persist_pages)
+
+
+@pytest.fixture(scope="module")
+def design_system():
+    return DesignSystemGenerator().generate("laboratory inventory saas", "Lab Control")
+
+
+def _without_timestamp(text):
+    return [line for line in text.splitlines() if "**Generated:**" not in line]
+
+
+def test_manifest_lines_are_names_with_optional_extra_queries(tmp_path):
+    manifest = tmp_path / "pages.txt"
+    manifest.write_text("# LabControl pages\n\ndashboard\n  Order History : table filters  \n"
+                        "reports: charts: export\n   # indented comment\n", encoding="utf-8")
+    assert load_page_manifest(str(manifest)) == [
+        ("dashboard", ""), ("Order History", "table filters"), ("reports", "charts: export")]
+
+
+@pytest.mark.parametrize("lines, error", [
+    ("dashboard\n../escape: x\n", "pages.txt:2: Invalid page name '../escape'"),
+    ("dashboard\nsub\\page\n", "pages.txt:2: Invalid page name 'sub\\\\page'"),
+    (": only a query\n", "pages.txt:1: Invalid page name ''"),
+    ("Order History\n# comment\norder-history: again\n", "pages.txt:3: page 'order-history' repeats line 1"),
+])
+def test_manifest_rejects_path_separators_and_duplicates(tmp_path, lines, error):
+    manifest = tmp_path / "pages.txt"
+    manifest.write_text(lines, encoding="utf-8")
+    with pytest.raises(ValueError) as excinfo:
+        load_page_manifest(str(manifest))
+    assert str(excinfo.value).startswith(f"{manifest.parent}/{error}")
+
+
+@pytest.mark.parametrize("name", ["../x", "a/b", "..", " ", "C:\\pages\\x"])
+def test_page_file_name_refuses_names_that_leave_pages_dir(name):
+    with pytest.raises(ValueError):
+        page_file_name(name)
+
+
+def test_persist_pages_writes_master_once_and_every_page_in_order(tmp_path, design_system):
+    result = persist_pages(design_system, ["dashboard", ("Order History", "table filters"), "reports"],
+                           str(tmp_path), "laboratory inventory saas")
+    project_dir = tmp_path / "design-system" / "lab-control"
+    assert result["created_files"] == [str(project_dir / "MASTER.md")] + [
+        str(project_dir / "pages" / name) for name in ("dashboard.md", "order-history.md", "reports.md")]
+    assert sorted(p.name for p in project_dir.iterdir()) == ["MASTER.md", "pages"]
+    page = (project_dir / "pages" / "order-history.md").read_text(encoding="utf-8")
+    expected = format_page_override_md(design_system, "Order History", "laboratory inventory saas table filters")
+    assert _without_timestamp(page) == _without_timestamp(expected)
+
+
+@pytest.mark.parametrize("pages", [["dashboard", "../outside"], ["Dashboard", ("dashboard", "again")]])
+def test_persist_pages_rejects_bad_pages_before_writing(tmp_path, design_system, pages):
+    with pytest.raises(ValueError):
+        persist_pages(design_system, pages, str(tmp_path))
+    assert not (tmp_path / "design-system").exists()
+    assert not (tmp_path / "outside.md").exists()
+
+
+def test_cli_reports_a_page_clash_between_page_and_pages(tmp_path, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        search_cli.main(["lab", "--design-system", "--persist", "--no-daemon", "-o", str(tmp_path),
+                         "--page", "Dashboard", "--pages", "reports", "dashboard"])
+    assert excinfo.value.code == 2
+    assert "Duplicate page 'dashboard'" in capsys.readouterr().err
+    assert not (tmp_path / "design-system").exists()
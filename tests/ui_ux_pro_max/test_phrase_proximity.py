@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import core  # noqa: E402
+from core import BM25, BM25F, min_distance, phrase_starts, search_many, split_phrases  # noqa: E402
+
+DOCUMENTS = [
+    "dark theme colors with contrast checks and mode",                         # both words, far apart
+    "dark mode toggle for settings screens inside every product page layout",  # exact phrase
+    "mode dark palette for screen settings inside every product page",         # reversed, adjacent
+    "light theme only",
+]
+
+
+@pytest.fixture
+def bm25():
+    index = BM25()
+    index.fit(DOCUMENTS)
+    return index
+
+
+def test_position_merges():
+    assert phrase_starts([1, 4, 9], [2, 5, 7], 1) == [1, 4]
+    assert phrase_starts([1, 4], [6], 2) == [4]
+    assert min_distance([3, 10], [4]) == 1
+    assert min_distance([10], [4, 8]) == 3  # right term before left: one extra step
+    assert split_phrases('ssr "server component" "dark mode"') == ["server component", "dark mode"]
+
+
+def test_positions_are_stored_per_posting(bm25):
+    dark, mode = bm25.vocab["dark"], bm25.vocab["mode"]
+    assert list(bm25.doc_positions(mode, 0)) == [7]
+    assert list(bm25.doc_positions(dark, 2)) == [1]
+    assert list(bm25.doc_positions(dark, 3)) == []
+
+
+def test_proximity_reranks_close_terms_first(bm25, monkeypatch):
+    assert [doc_id for doc_id, _ in bm25.score("dark mode", 3)] == [1, 2, 0]
+    monkeypatch.setattr(core, "PROXIMITY_WEIGHT", 0)
+    assert [doc_id for doc_id, _ in bm25.score("dark mode", 3)] == [0, 2, 1]  # shortest row first
+
+
+def test_quoted_phrase_filters_rows(bm25):
+    assert [doc_id for doc_id, _ in bm25.score('"dark mode"')] == [1]
+    assert [doc_id for doc_id, _ in bm25.score('"mode dark" screen')] == [2]
+    assert bm25.score('"dark light"') == []
+    assert bm25.score('"dark unknownword"') == []
+
+
+def test_bm25f_positions_run_across_fields():
+    index = BM25F(boosts=[2.0, 1.0])
+    index.fit([["dark", "mode toggle"], ["mode", "dark"], ["dark mode", "mode"]])
+    assert sorted(doc_id for doc_id, _ in index.score('"dark mode"')) == [0, 2]
+
+
+def test_search_many_applies_phrases_and_proximity():
+    queries = ['"dark mode" glass', "dark mode", "touch target size", '"touch target"']
+    for query, response in zip(queries, search_many(queries, "style")):
+        assert response == core.search(query, "style")
+    for query, response in zip(queries, search_many(queries, "ux")):
+        assert response == core.search(query, "ux")
+
+
+@pytest.mark.parametrize("domain, ranking, error", [
+    ("all", "bm25", "Federated search"),
+    ("styles", "bm25", "Unknown domain: styles"),
+    ("style", "tfidf", "Unknown ranking: tfidf"),
+])
+def test_search_many_returns_error_dicts_like_search(domain, ranking, error):
+    responses = search_many(["dark mode", "glass"], domain, ranking=ranking)
+    assert len(responses) == 2
+    for response in responses:
+        assert response["error"].startswith(error) and response["domain"] == domain
+    if domain != "all":
+        assert responses[0] == core.search("dark mode", domain, ranking=ranking)
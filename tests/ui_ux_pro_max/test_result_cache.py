@@ -0,0 +1,82 @@
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import core  # noqa: E402
+from core import CSV_CONFIG, ResultCache, search  # noqa: E402
+
+
+def _write_csv(path, domain, texts):
+    """One row per text, placed in every search column of the domain"""
+    config = CSV_CONFIG[domain]
+    columns = list(dict.fromkeys(config["search_cols"] + config["output_cols"]))
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for text in texts:
+            writer.writerow({col: text if col in config["search_cols"] else "" for col in columns})
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(core, "INDEX_DIR", tmp_path / ".index")
+    monkeypatch.setattr(core, "_INDEX_CACHE", {})
+    monkeypatch.setattr(core, "_RESULT_CACHE", ResultCache())
+    _write_csv(tmp_path / CSV_CONFIG["style"]["file"], "style", ["glassy frosted panels", "flat minimal layout"])
+    _write_csv(tmp_path / CSV_CONFIG["ux"]["file"], "ux", ["glass overlays need contrast", "focus rings"])
+    return tmp_path
+
+
+def test_lru_evicts_the_least_recently_used_entry():
+    cache = ResultCache(maxsize=2)
+    cache.put("a", [{"n": 1}], 0.1)
+    cache.put("b", [{"n": 2}], 0.1)
+    assert cache.get("a") == [{"n": 1}]  # "b" is now the oldest
+    cache.put("c", [{"n": 3}], 0.1)
+    assert cache.get("b") is None
+    assert cache.get("a") == [{"n": 1}] and cache.get("c") == [{"n": 3}]
+    assert cache.stats()["entries"] == 2
+
+
+def test_counters_track_hits_misses_and_time_saved():
+    cache = ResultCache()
+    assert cache.get("q") is None
+    cache.put("q", [], 0.25)
+    cache.get("q")
+    cache.get("q")
+    assert cache.stats() == {"hits": 2, "misses": 1, "hit_rate": 0.667, "entries": 1, "time_saved_ms": 500.0}
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "entries": 0, "time_saved_ms": 0.0}
+
+
+def test_hits_return_copies_callers_can_modify(data_dir):
+    first = search("glassy", "style")["results"]
+    first[0]["Style Category"] = "edited"
+    first.append({"extra": True})
+    second = search("glassy", "style")["results"]
+    assert core._RESULT_CACHE.stats()["hits"] == 1
+    assert second == [{col: ("glassy frosted panels" if col in CSV_CONFIG["style"]["search_cols"] else "")
+                       for col in CSV_CONFIG["style"]["output_cols"]}]
+
+
+def test_equivalent_queries_share_an_entry_but_word_order_does_not(data_dir):
+    search("Glassy, FROSTED", "style")
+    search("glassy frosted!", "style")
+    assert core._RESULT_CACHE.stats()["hits"] == 1
+    search("frosted glassy", "style")
+    assert core._RESULT_CACHE.stats()["entries"] == 2
+
+
+def test_editing_another_csv_changes_fuzzy_corrections(data_dir):
+    # "glass" is a word of the ux CSV, so the style search does not rewrite it to "glassy"
+    assert search("glass", "style")["count"] == 0
+    _write_csv(data_dir / CSV_CONFIG["ux"]["file"], "ux", ["focus rings only"])
+    assert search("glass", "style")["count"] == 1  # now a typo of "glassy"
+    _write_csv(data_dir / CSV_CONFIG["ux"]["file"], "ux", ["glass overlays need contrast", "focus rings"])
+    assert search("glass", "style")["count"] == 0
@@ -0,0 +1,53 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"
+
+# Sum of top-level cumulative -X importtime figures for a one-shot domain search.
+# About 40 ms on a developer laptop; the headroom absorbs slow CI machines.
+IMPORT_BUDGET_MS = 100
+
+# Modules a plain domain search must not pay for
+LAZY_MODULES = ["design_system", "json", "csv", "sqlite3", "sqlite_fts", "socket", "socketserver", "tempfile",
+                "concurrent.futures"]
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _importtime(tmp_path, *args):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # measure imports, not recompilation
+    env["UIPRO_SEARCH_SOCKET"] = str(tmp_path / "no-daemon.sock")
+    command = [sys.executable, "-X", "importtime", str(SCRIPTS_DIR / "search.py"), *args]
+    subprocess.run(command, cwd=SCRIPTS_DIR, env=env, capture_output=True, check=True)  # warm .pyc files
+    completed = subprocess.run(command, cwd=SCRIPTS_DIR, env=env, capture_output=True, text=True, check=True)
+
+    modules, total_us = {}, 0
+    for match in LINE.finditer(completed.stderr):
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        modules[name] = cumulative
+        if len(indent) == 1:  # top-level import (nested ones are indented further)
+            total_us += cumulative
+    return modules, total_us / 1000
+
+
+@pytest.mark.parametrize("args", [
+    ("glassmorphism", "--domain", "style"),
+    ("glassmorphism", "--domain", "style", "--no-daemon"),
+    ("forms", "--stack", "react"),
+])
+def test_search_startup_stays_lazy_and_within_budget(tmp_path, args):
+    modules, total_ms = _importtime(tmp_path, *args)
+    assert "core" in modules
+    assert [name for name in LAZY_MODULES if name in modules] == []
+    assert total_ms <= IMPORT_BUDGET_MS, f"imports took {total_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)"
+
+
+def test_design_system_imports_its_module_on_demand(tmp_path):
+    modules, _ = _importtime(tmp_path, "saas dashboard", "--design-system")
+    assert "design_system" in modules